@@ -23,3 +23,8 @@ BACKEND_API_HOST = os.getenv("BACKEND_API_HOST", "127.0.0.1")
 BACKEND_API_PORT = os.getenv("BACKEND_API_PORT", 8000)
 BACKEND_API_USERNAME = os.getenv("BACKEND_API_USERNAME", "admin")
 BACKEND_API_PASSWORD = os.getenv("BACKEND_API_PASSWORD", "admin")
+BACKEND_API_POOL_SIZE = int(os.getenv("BACKEND_API_POOL_SIZE", 16))
+BACKEND_API_HEALTH_CHECK_INTERVAL = float(os.getenv("BACKEND_API_HEALTH_CHECK_INTERVAL", 30))
+
+# Write the frames behind some charts to DEBUG_EXPORTS_PATH, one folder per session, for troubleshooting
+DEBUG_EXPORTS_ENABLED = os.getenv("DEBUG_EXPORTS_ENABLED", "False").lower() in ("true", "1", "t")
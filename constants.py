@@ -1,4 +1,7 @@
 CANDLES_DATA_PATH = "data/candles"
+PORTFOLIO_HISTORY_DATA_PATH = "data/portfolio_history"
+ARCHIVED_DATABASES_STATUS_PATH = "data/archived_bots/databases_status.json"
+DEBUG_EXPORTS_PATH = "data/debug_exports"
 DOWNLOAD_CANDLES_CONFIG_YML = "hummingbot_files/scripts_configs/data_downloader_config.yml"
 BOTS_FOLDER = "hummingbot_files/bots"
 CONTROLLERS_PATH = "quants_lab/controllers"
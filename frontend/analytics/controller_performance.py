@@ -0,0 +1,81 @@
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+PERFORMANCE_COLUMNS = ["realized_pnl_quote", "unrealized_pnl_quote", "global_pnl_quote", "volume_traded"]
+CONFIG_COLUMNS = ["controller_name", "connector_name", "trading_pair", "manual_kill_switch"]
+# Short label shown in the bot cards for each close type counted by the controllers
+CLOSE_TYPE_LABELS = {
+    "TP": "CloseType.TAKE_PROFIT",
+    "SL": "CloseType.STOP_LOSS",
+    "TS": "CloseType.TRAILING_STOP",
+    "TL": "CloseType.TIME_LIMIT",
+    "ES": "CloseType.EARLY_STOP",
+    "F": "CloseType.FAILED",
+}
+
+
+def controller_performance_frame(performance: Dict[str, Dict],
+                                 controller_configs: Optional[List[Dict]] = None) -> pd.DataFrame:
+    """
+    Normalize the `performance` dict of a bot status (controller id -> {"status", "performance", "error"}) into one
+    row per controller, joined with its config by id.
+
+    Columns: controller_id, status, error, has_config, CONFIG_COLUMNS, PERFORMANCE_COLUMNS and one column per
+    CLOSE_TYPE_LABELS key with the close type counts.
+    """
+    controller_ids = list(performance)
+    frame = pd.json_normalize([performance[controller_id].get("performance") or {} for controller_id in controller_ids],
+                              sep="|")
+    frame = frame.reindex(columns=PERFORMANCE_COLUMNS + [f"close_type_counts|{close_type}"
+                                                         for close_type in CLOSE_TYPE_LABELS.values()])
+    frame.columns = PERFORMANCE_COLUMNS + list(CLOSE_TYPE_LABELS)
+    frame = frame.apply(pd.to_numeric, errors="coerce").fillna(0)
+    frame.insert(0, "controller_id", pd.Series(controller_ids, dtype=object))
+    frame.insert(1, "status", [performance[controller_id].get("status") for controller_id in controller_ids])
+    frame.insert(2, "error", [performance[controller_id].get("error", "Unknown error") for controller_id in controller_ids])
+
+    # Index the configs by id once instead of scanning the list for every controller
+    configs = pd.DataFrame(controller_configs or [], columns=["id"] + CONFIG_COLUMNS)
+    configs = configs.drop_duplicates("id", keep="first").set_index("id")
+    frame = frame.join(configs[CONFIG_COLUMNS], on="controller_id")
+    frame.insert(3, "has_config", frame["controller_id"].isin(configs.index))
+    frame["controller_name"] = frame["controller_name"].fillna(frame["controller_id"])
+    frame[["connector_name", "trading_pair"]] = frame[["connector_name", "trading_pair"]].fillna("N/A")
+    frame["manual_kill_switch"] = frame["manual_kill_switch"].fillna(False).astype(bool)
+    return frame
+
+
+def aggregate_controller_performance(performance: Dict[str, Dict],
+                                     controller_configs: Optional[List[Dict]] = None) -> Dict:
+    """
+    Aggregate the controller performance of a bot, for the bot cards as well as exports and alerts.
+
+    Returns a dict with:
+    - controllers: the controller_performance_frame rows of the controllers that are not in error
+    - errors: controller_id and error of the controllers in error
+    - totals: sums of PERFORMANCE_COLUMNS over the controllers plus global_pnl_pct (global PnL / volume)
+    - by_kill_switch: sums of PERFORMANCE_COLUMNS grouped by manual_kill_switch (False: active, True: stopped)
+    """
+    frame = controller_performance_frame(performance, controller_configs)
+    is_error = frame["status"] == "error"
+    controllers = frame[~is_error]
+
+    totals = controllers[PERFORMANCE_COLUMNS].sum().to_dict()
+    volume_traded = totals["volume_traded"]
+    totals["global_pnl_pct"] = totals["global_pnl_quote"] / volume_traded if volume_traded > 0 else 0
+    return {
+        "controllers": controllers,
+        "errors": frame.loc[is_error, ["controller_id", "error"]],
+        "totals": totals,
+        "by_kill_switch": controllers.groupby("manual_kill_switch")[PERFORMANCE_COLUMNS].sum(),
+    }
+
+
+def format_close_types(controllers: pd.DataFrame) -> pd.Series:
+    """Close type counts as "TP: 1 | SL: 0 | ..." strings, one per controller."""
+    parts = [f"{label}: " + controllers[label].astype(int).astype(str) for label in CLOSE_TYPE_LABELS]
+    close_types = parts[0]
+    for part in parts[1:]:
+        close_types = close_types + " | " + part
+    return close_types
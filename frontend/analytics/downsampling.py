@@ -0,0 +1,87 @@
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def _as_float(x: np.ndarray) -> np.ndarray:
+    x = np.asarray(x)
+    if np.issubdtype(x.dtype, np.datetime64):
+        return x.astype("datetime64[ns]").astype(np.int64).astype(np.float64)
+    return x.astype(np.float64)
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Indices of the points kept by largest-triangle-three-buckets: the first and last points plus, for each of
+    `n_out - 2` equal buckets, the point making the largest triangle with the previously kept point and the
+    average of the next bucket. Keeps the visual shape of a line (peaks included) with `n_out` points.
+    """
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x, y = _as_float(x), np.asarray(y, dtype=np.float64)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+    previous = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        next_x, next_y = x[end:next_end].mean(), y[end:next_end].mean()
+        areas = np.abs((x[previous] - next_x) * (y[start:end] - y[previous])
+                       - (x[previous] - x[start:end]) * (next_y - y[previous]))
+        previous = start + int(np.nanargmax(areas)) if not np.isnan(areas).all() else start
+        indices[i + 1] = previous
+    return indices
+
+
+def min_max_indices(y: np.ndarray, n_buckets: int) -> np.ndarray:
+    """Indices of the minimum and maximum of each of `n_buckets` equal buckets, in order (up to 2 points each)."""
+    n = len(y)
+    if 2 * n_buckets >= n:
+        return np.arange(n)
+    buckets = pd.Series(np.asarray(y, dtype=np.float64)).groupby(np.arange(n) * n_buckets // n)
+    return np.unique(np.concatenate([buckets.idxmin().dropna().to_numpy(dtype=np.int64),
+                                     buckets.idxmax().dropna().to_numpy(dtype=np.int64)]))
+
+
+def visible_slice(x: np.ndarray, x_range: Optional[Tuple] = None) -> slice:
+    """Slice of sorted `x` covering `x_range`, plus one point on each side so lines reach the edges."""
+    if x_range is None:
+        return slice(0, len(x))
+    start, end = np.searchsorted(x, np.asarray(x_range, dtype=np.asarray(x).dtype))
+    return slice(max(0, start - 1), min(len(x), end + 1))
+
+
+def downsample(x, y, max_points: int = 2000, x_range: Optional[Tuple] = None,
+               method: str = "lttb") -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Points of a series sorted by `x` to draw within `x_range` (everything when None) with at most `max_points`
+    points, so a narrower range is drawn at a finer resolution. `method` is "lttb" for lines or "minmax" to keep
+    every bucket's extremes (e.g. for spiky series).
+    """
+    x, y = np.asarray(x), np.asarray(y)
+    window = visible_slice(x, x_range)
+    x, y = x[window], y[window]
+    if method == "minmax":
+        indices = min_max_indices(y, max_points // 2)
+    else:
+        indices = lttb_indices(x, y, max_points)
+    return x[indices], y[indices]
+
+
+def downsample_ohlc(candles_df: pd.DataFrame, max_candles: int = 2000, x_range: Optional[Tuple] = None) -> pd.DataFrame:
+    """
+    Candles (timestamp, open, high, low, close[, volume]) sorted by time within `x_range`, merged by runs of
+    consecutive candles into at most `max_candles` candles that keep the open, high, low and close of each run.
+    """
+    candles_df = candles_df.iloc[visible_slice(candles_df["timestamp"].to_numpy(), x_range)]
+    if len(candles_df) <= max_candles:
+        return candles_df
+    run_length = -(-len(candles_df) // max_candles)
+    aggregations = {"timestamp": "first", "open": "first", "high": "max", "low": "min", "close": "last"}
+    if "volume" in candles_df.columns:
+        aggregations["volume"] = "sum"
+    runs = np.arange(len(candles_df)) // run_length
+    return candles_df.groupby(runs).agg(aggregations).reset_index(drop=True)
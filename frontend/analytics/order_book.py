@@ -0,0 +1,168 @@
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+
+def _levels_to_arrays(levels) -> Tuple[np.ndarray, np.ndarray]:
+    if not levels:
+        return np.empty(0), np.empty(0)
+    levels = np.array([(level["price"], level["amount"]) for level in levels], dtype=np.float64)
+    return levels[:, 0], levels[:, 1]
+
+
+@dataclass
+class MarketImpact:
+    is_buy: bool
+    filled_amount: float
+    quote_volume: float
+    average_price: float
+    slippage_bps: float
+    depth_sufficient: bool
+
+
+class OrderBookSnapshot:
+    """
+    Order book levels held in contiguous NumPy arrays: bids sorted by descending price, asks by ascending price.
+
+    Every metric is computed with a single vectorized pass over the levels (cumulative sums, masks and
+    `searchsorted`), so a snapshot can be shared by the depth chart and the market metrics of a render.
+    """
+
+    def __init__(self, bid_prices: np.ndarray, bid_amounts: np.ndarray, ask_prices: np.ndarray,
+                 ask_amounts: np.ndarray):
+        bid_order = np.argsort(-bid_prices, kind="stable")
+        ask_order = np.argsort(ask_prices, kind="stable")
+        self.bid_prices = bid_prices[bid_order]
+        self.bid_amounts = bid_amounts[bid_order]
+        self.ask_prices = ask_prices[ask_order]
+        self.ask_amounts = ask_amounts[ask_order]
+        self.bid_quote_volumes = self.bid_prices * self.bid_amounts
+        self.ask_quote_volumes = self.ask_prices * self.ask_amounts
+
+    @classmethod
+    def from_response(cls, order_book: Optional[Dict]) -> "OrderBookSnapshot":
+        """Build a snapshot from a `market_data.get_order_book` response (lists of {"price", "amount"} dicts)."""
+        order_book = order_book or {}
+        bid_prices, bid_amounts = _levels_to_arrays(order_book.get("bids"))
+        ask_prices, ask_amounts = _levels_to_arrays(order_book.get("asks"))
+        return cls(bid_prices, bid_amounts, ask_prices, ask_amounts)
+
+    def __bool__(self):
+        return self.bid_prices.size > 0 and self.ask_prices.size > 0
+
+    @property
+    def best_bid(self) -> float:
+        return float(self.bid_prices[0]) if self.bid_prices.size else 0.0
+
+    @property
+    def best_ask(self) -> float:
+        return float(self.ask_prices[0]) if self.ask_prices.size else 0.0
+
+    @property
+    def mid_price(self) -> float:
+        return (self.best_bid + self.best_ask) / 2 if self else 0.0
+
+    def _side(self, is_buy: bool) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Levels consumed by an order: asks for buys, bids for sells."""
+        if is_buy:
+            return self.ask_prices, self.ask_amounts, self.ask_quote_volumes
+        return self.bid_prices, self.bid_amounts, self.bid_quote_volumes
+
+    def cumulative_depth(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Cumulative quote volume of the bids and the asks, from the top of the book outwards."""
+        return np.cumsum(self.bid_quote_volumes), np.cumsum(self.ask_quote_volumes)
+
+    def total_quote_volume(self) -> Tuple[float, float]:
+        """Total quote volume of the bids and the asks in the snapshot."""
+        return float(self.bid_quote_volumes.sum()), float(self.ask_quote_volumes.sum())
+
+    def quote_volume_for_price(self, price: float, is_buy: bool) -> float:
+        """
+        Quote volume available to an order up to a limit price: asks priced at or below `price` for buys,
+        bids priced at or above `price` for sells. Same semantics as the backend's `get_quote_volume_for_price`.
+        """
+        prices, _, quote_volumes = self._side(is_buy)
+        if is_buy:
+            n_levels = np.searchsorted(prices, price, side="right")
+        else:
+            n_levels = np.searchsorted(-prices, -price, side="right")
+        return float(quote_volumes[:n_levels].sum())
+
+    def depth_within(self, percentage: float) -> Tuple[float, float]:
+        """Quote volume of the bids and the asks within `percentage` % of the best bid and best ask."""
+        factor = percentage / 100
+        bid_depth = self.quote_volume_for_price(self.best_bid * (1 - factor), is_buy=False)
+        ask_depth = self.quote_volume_for_price(self.best_ask * (1 + factor), is_buy=True)
+        return bid_depth, ask_depth
+
+    def vwap_for_amount(self, amount: float, is_buy: bool) -> Tuple[float, float]:
+        """
+        Average fill price of a market order of `amount` base units walking the book, and the amount the book
+        can actually fill. The price is NaN when the side is empty.
+        """
+        impact = self.market_impact(is_buy, amount=amount)
+        return impact.average_price, impact.filled_amount
+
+    def imbalance(self, percentage: Optional[float] = None) -> float:
+        """
+        (bid volume - ask volume) / (bid volume + ask volume) in quote, over the whole snapshot or within
+        `percentage` % of the top of the book. Ranges from -1 (only asks) to 1 (only bids).
+        """
+        if percentage is None:
+            bid_volume, ask_volume = self.total_quote_volume()
+        else:
+            bid_volume, ask_volume = self.depth_within(percentage)
+        total = bid_volume + ask_volume
+        return (bid_volume - ask_volume) / total if total > 0 else 0.0
+
+    def market_impact(self, is_buy: bool, amount: Optional[float] = None,
+                      price_limit: Optional[float] = None) -> MarketImpact:
+        """
+        Estimate the execution of a market order walking the book: up to `amount` base units, not going past
+        `price_limit`, or both. Slippage is measured against the mid price, in basis points.
+
+        `depth_sufficient` is False when the snapshot may not hold all the liquidity the order would reach (the
+        requested amount isn't filled, or the limit lies beyond the last level), in which case the estimate is a
+        lower bound and callers should ask the backend instead.
+        """
+        prices, amounts, quote_volumes = self._side(is_buy)
+        n_levels = prices.size
+        limit_within_book = False
+        if price_limit is not None:
+            if is_buy:
+                n_levels = int(np.searchsorted(prices, price_limit, side="right"))
+            else:
+                n_levels = int(np.searchsorted(-prices, -price_limit, side="right"))
+            limit_within_book = n_levels < prices.size
+        prices, amounts, quote_volumes = prices[:n_levels], amounts[:n_levels], quote_volumes[:n_levels]
+        depth_sufficient = limit_within_book
+
+        cumulative_amounts = np.cumsum(amounts)
+        available = float(cumulative_amounts[-1]) if n_levels else 0.0
+        if amount is None:
+            filled, quote_volume = available, float(quote_volumes.sum())
+        else:
+            filled = min(float(amount), available)
+            # Levels fully consumed, then the remainder taken from the next level
+            n_full = int(np.searchsorted(cumulative_amounts, filled, side="left"))
+            filled_before = float(cumulative_amounts[n_full - 1]) if n_full else 0.0
+            quote_volume = float(quote_volumes[:n_full].sum())
+            if n_full < n_levels:
+                quote_volume += (filled - filled_before) * float(prices[n_full])
+            depth_sufficient = limit_within_book or filled >= float(amount)
+
+        average_price = quote_volume / filled if filled > 0 else float("nan")
+        mid_price = self.mid_price
+        slippage_bps = float("nan")
+        if filled > 0 and mid_price > 0:
+            direction = 1 if is_buy else -1
+            slippage_bps = direction * (average_price - mid_price) / mid_price * 10000
+        return MarketImpact(
+            is_buy=is_buy,
+            filled_amount=filled,
+            quote_volume=quote_volume,
+            average_price=average_price,
+            slippage_bps=slippage_bps,
+            depth_sufficient=depth_sufficient,
+        )
@@ -0,0 +1,110 @@
+from enum import Enum
+from typing import Dict, Type
+
+import numpy as np
+import pandas as pd
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.strategy_v2.models.executors import CloseType
+
+# Capital the PnL and drawdown percentages are relative to, as in the backend performance results
+DEFAULT_TOTAL_AMOUNT_QUOTE = 1000
+RESULT_KEYS = ["net_pnl", "net_pnl_quote", "total_executors", "total_executors_with_position", "total_volume",
+               "total_long", "total_short", "close_types", "accuracy_long", "accuracy_short", "total_positions",
+               "accuracy", "max_drawdown_usd", "max_drawdown_pct", "sharpe_ratio", "profit_factor", "win_signals",
+               "loss_signals"]
+
+
+def _enum_names(values: pd.Series, enum_type: Type[Enum]) -> np.ndarray:
+    """
+    Names of enum members given as members, values or "Enum.NAME"/"NAME" strings, resolved once per distinct
+    value. Missing values become None.
+    """
+    def name(value):
+        if isinstance(value, Enum):
+            return value.name
+        if isinstance(value, (int, np.integer)):
+            return enum_type(int(value)).name
+        return str(value).split(".")[-1]
+
+    codes, uniques = pd.factorize(values)
+    names = np.array([name(value) for value in uniques] + [None], dtype=object)
+    return names[codes]  # code -1 (missing) picks the trailing None
+
+
+def empty_performance_results() -> Dict:
+    return {key: 0 for key in RESULT_KEYS}
+
+
+def summarize_executors(executors_df: pd.DataFrame, total_amount_quote: float = DEFAULT_TOTAL_AMOUNT_QUOTE) -> Dict:
+    """
+    Performance results of the executors in the schema of the backend's get_performance_results (the one
+    render_backtesting_metrics consumes), computed locally with NumPy from the executors frame in its order.
+
+    Executors with position are the ones with a non-zero net PnL. Drawdown and Sharpe ratio come from their
+    cumulative PnL, the Sharpe ratio using the cumulative PnL over cumulative volume as returns.
+    """
+    if executors_df.empty:
+        return empty_performance_results()
+
+    net_pnl_quote = executors_df["net_pnl_quote"].to_numpy(dtype=float)
+    with_position = net_pnl_quote != 0
+    pnl = net_pnl_quote[with_position]
+    volume = executors_df["filled_amount_quote"].to_numpy(dtype=float)[with_position]
+    sides = _enum_names(executors_df["side"], TradeType)[with_position]
+    is_long, is_short = sides == "BUY", sides == "SELL"
+    is_win, is_loss = pnl > 0, pnl < 0
+
+    total_long, total_short = int(is_long.sum()), int(is_short.sum())
+    total_positions = len(pnl)
+
+    close_type_column = "close_type_name" if "close_type_name" in executors_df.columns else "close_type"
+    close_types = pd.Series(_enum_names(executors_df[close_type_column], CloseType))
+    close_types = close_types[executors_df["timestamp"].notna().to_numpy()].value_counts().sort_index()
+
+    max_drawdown_usd = max_drawdown_pct = sharpe_ratio = 0.0
+    if total_positions:
+        cumulative_returns = np.nancumsum(pnl)
+        drawdown = cumulative_returns - np.maximum.accumulate(cumulative_returns)
+        max_drawdown_usd = float(drawdown.min())
+        max_drawdown_pct = max_drawdown_usd / (total_amount_quote + cumulative_returns[0])
+        if total_positions > 1:
+            with np.errstate(invalid="ignore", divide="ignore"):
+                returns = cumulative_returns / np.nancumsum(volume)
+                sharpe_ratio = float(np.nanmean(returns) / np.nanstd(returns, ddof=1))
+
+    total_won = np.nansum(pnl[is_win])
+    total_loss = -np.nansum(pnl[is_loss])
+    total_net_pnl_quote = np.nansum(net_pnl_quote)
+    return {
+        "net_pnl": float(total_net_pnl_quote / total_amount_quote),
+        "net_pnl_quote": float(total_net_pnl_quote),
+        "total_executors": len(executors_df),
+        "total_executors_with_position": total_positions,
+        "total_volume": float(np.nansum(volume)),
+        "total_long": total_long,
+        "total_short": total_short,
+        "close_types": {name: int(count) for name, count in close_types.items()},
+        "accuracy_long": float((is_long & is_win).sum() / total_long) if total_long else 0.0,
+        "accuracy_short": float((is_short & is_win).sum() / total_short) if total_short else 0.0,
+        "total_positions": total_positions,
+        "accuracy": float(is_win.sum() / total_positions) if total_positions else 0.0,
+        "max_drawdown_usd": max_drawdown_usd,
+        "max_drawdown_pct": float(max_drawdown_pct),
+        "sharpe_ratio": sharpe_ratio,
+        "profit_factor": float(total_won / total_loss) if total_loss > 0 else 1.0,
+        "win_signals": int(is_win.sum()),
+        "loss_signals": int(is_loss.sum()),
+    }
+
+
+def compare_performance_results(results: Dict, reference: Dict, rel_tol: float = 1e-6) -> Dict[str, tuple]:
+    """Metrics whose values differ between two results, as metric -> (value, reference value)."""
+    mismatches = {}
+    for key in RESULT_KEYS:
+        value, expected = results.get(key), reference.get(key)
+        if isinstance(expected, (int, float)) and isinstance(value, (int, float)):
+            if not np.isclose(value, expected, rtol=rel_tol, atol=1e-9, equal_nan=True):
+                mismatches[key] = (value, expected)
+        elif value != expected:
+            mismatches[key] = (value, expected)
+    return mismatches
@@ -0,0 +1,69 @@
+from array import array
+from typing import Dict, Iterable, List
+
+import numpy as np
+import pandas as pd
+
+STATE_COLUMNS = ["account", "exchange", "token", "price", "units", "value", "available_units"]
+HISTORY_COLUMNS = ["timestamp"] + STATE_COLUMNS
+NUMERIC_COLUMNS = ["price", "units", "value", "available_units"]
+
+
+def _categorical(codes: np.ndarray, categories: Dict) -> pd.Categorical:
+    return pd.Categorical.from_codes(codes, categories=list(categories))
+
+
+def _flatten_states(states: Iterable[Dict]) -> Dict[str, np.ndarray]:
+    """
+    Flatten account -> exchange -> [token info] states straight into typed columns, without building a dict per
+    row: categorical account, exchange and token, float64 numbers and, per row, the index of its state.
+
+    Python only walks the (state, account, exchange) blocks; the per-row columns are expanded with NumPy from the
+    block columns and read from the token infos with one pass per column.
+    """
+    account_codes, exchange_codes = {}, {}
+    block_accounts, block_exchanges, block_states, block_sizes = array("l"), array("l"), array("l"), array("l")
+    token_infos = []
+
+    for i, state in enumerate(states):
+        for account, exchanges_state in state.items():
+            account_code = account_codes.setdefault(account, len(account_codes))
+            for exchange, tokens_info in exchanges_state.items():
+                block_accounts.append(account_code)
+                block_exchanges.append(exchange_codes.setdefault(exchange, len(exchange_codes)))
+                block_states.append(i)
+                block_sizes.append(len(tokens_info))
+                token_infos.extend(tokens_info)
+
+    block_sizes = np.frombuffer(block_sizes, dtype=np.dtype(f"i{block_sizes.itemsize}"))
+    columns = {
+        "account": _categorical(np.repeat(np.frombuffer(block_accounts, dtype=block_sizes.dtype), block_sizes),
+                                account_codes),
+        "exchange": _categorical(np.repeat(np.frombuffer(block_exchanges, dtype=block_sizes.dtype), block_sizes),
+                                 exchange_codes),
+        "token": pd.Categorical([info["token"] for info in token_infos]),
+        "state_index": np.repeat(np.frombuffer(block_states, dtype=block_sizes.dtype), block_sizes),
+    }
+    for column in NUMERIC_COLUMNS:
+        columns[column] = np.fromiter((info[column] for info in token_infos), dtype=np.float64, count=len(token_infos))
+    return columns
+
+
+def portfolio_state_to_df(portfolio_state: Dict) -> pd.DataFrame:
+    """
+    Convert a portfolio state (account -> exchange -> [token info]) to one row per token, with categorical
+    account, exchange and token columns and float64 numbers.
+    """
+    columns = _flatten_states([portfolio_state])
+    return pd.DataFrame({column: columns[column] for column in STATE_COLUMNS})
+
+
+def portfolio_history_to_df(history: List[Dict]) -> pd.DataFrame:
+    """
+    Convert historical portfolio states ({"timestamp", "state"} records) to one row per token and record, with the
+    same dtypes as portfolio_state_to_df and the record timestamps parsed once per record.
+    """
+    columns = _flatten_states(record["state"] for record in history)
+    timestamps = pd.to_datetime(pd.Series([record["timestamp"] for record in history], dtype=object), format="ISO8601")
+    columns["timestamp"] = pd.DatetimeIndex(timestamps).take(columns["state_index"])
+    return pd.DataFrame({column: columns[column] for column in HISTORY_COLUMNS})
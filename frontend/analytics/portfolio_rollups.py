@@ -0,0 +1,84 @@
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+KEYS = ["account", "exchange", "token"]
+# Rollup resolutions in seconds, from the finest to the coarsest
+RESOLUTIONS = {"1m": 60, "5m": 5 * 60, "1h": 60 * 60, "1d": 24 * 60 * 60}
+
+
+class PortfolioRollups:
+    """
+    Portfolio value history rolled up in time buckets at several resolutions, kept up to date as history arrives.
+
+    Each resolution stores, per (bucket, account, exchange, token), the sum and count of the snapshot values, so
+    updates in any order merge exactly and the mean value of a bucket is always available. Values are levels, so
+    a bucket holds the mean of the key's snapshots rather than their sum; the sum across keys of a bucket is then
+    the portfolio value without the jitter of exchanges logged at slightly different times.
+
+    Only the last `retention_points` buckets of each resolution are kept, which bounds memory while still covering
+    any range the resolution would be picked for.
+    """
+
+    def __init__(self, retention_points: int = 10000):
+        self._retention_points = retention_points
+        self._rollups = {name: None for name in RESOLUTIONS}
+        self._first_timestamp: Optional[int] = None
+
+    def update(self, history_df: pd.DataFrame):
+        """Merge raw snapshot rows (timestamp, account, exchange, token, value) into every resolution."""
+        if history_df.empty:
+            return
+        epoch_seconds = history_df["timestamp"].to_numpy(dtype="datetime64[s]").astype(np.int64)
+        first_timestamp = int(epoch_seconds.min())
+        if self._first_timestamp is None or first_timestamp < self._first_timestamp:
+            self._first_timestamp = first_timestamp
+        rows = pd.DataFrame({
+            "account": history_df["account"].astype(str).to_numpy(),
+            "exchange": history_df["exchange"].astype(str).to_numpy(),
+            "token": history_df["token"].astype(str).to_numpy(),
+            "value_sum": history_df["value"].to_numpy(dtype=np.float64),
+            "count": 1,
+        })
+        for name, seconds in RESOLUTIONS.items():
+            rows["bucket"] = epoch_seconds // seconds * seconds
+            rollup = rows.groupby(["bucket"] + KEYS, sort=False)[["value_sum", "count"]].sum()
+            if self._rollups[name] is not None:
+                rollup = pd.concat([self._rollups[name], rollup]).groupby(level=[0, 1, 2, 3], sort=False).sum()
+            buckets = rollup.index.get_level_values("bucket")
+            cutoff = buckets.max() - self._retention_points * seconds
+            self._rollups[name] = rollup[buckets > cutoff].sort_index()
+
+    def first_bucket(self, resolution: str) -> Optional[int]:
+        rollup = self._rollups[resolution]
+        return None if rollup is None or rollup.empty else int(rollup.index.get_level_values("bucket").min())
+
+    def pick_resolution(self, start_time: int, end_time: int, target_points: int = 2000) -> Optional[str]:
+        """
+        The finest resolution giving at most about `target_points` buckets for the data between two timestamps
+        (seconds) while still retaining its start. None when there's no data.
+        """
+        if self._first_timestamp is None:
+            return None
+        data_start = max(start_time, self._first_timestamp)
+        for name, seconds in RESOLUTIONS.items():
+            n_points = (end_time - data_start) / seconds
+            if n_points <= target_points * 1.25 and self.first_bucket(name) <= data_start:
+                return name
+        return "1d"
+
+    def select(self, resolution: str, start_time: int) -> pd.DataFrame:
+        """Mean value per (timestamp, account, exchange, token) at a resolution, from `start_time` (seconds) on."""
+        rollup = self._rollups[resolution]
+        if rollup is None:
+            return pd.DataFrame(columns=["timestamp"] + KEYS + ["value"])
+        seconds = RESOLUTIONS[resolution]
+        frame = rollup[rollup.index.get_level_values("bucket") >= start_time // seconds * seconds].reset_index()
+        return pd.DataFrame({
+            "timestamp": pd.to_datetime(frame["bucket"], unit="s"),
+            "account": frame["account"].astype("category"),
+            "exchange": frame["exchange"].astype("category"),
+            "token": frame["token"].astype("category"),
+            "value": frame["value_sum"] / frame["count"],
+        })
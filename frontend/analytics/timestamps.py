@@ -0,0 +1,58 @@
+from typing import Dict, Iterable, List
+
+import numpy as np
+import pandas as pd
+
+# Nanoseconds per epoch unit, from the coarsest to the finest
+_NANOSECONDS = {"s": 10 ** 9, "ms": 10 ** 6, "us": 10 ** 3, "ns": 1}
+# Epochs up to these magnitudes are read in the unit (1e11 seconds is year 5138, 1e11 milliseconds is 1973)
+_MAX_MAGNITUDE = {"s": 1e11, "ms": 1e14, "us": 1e17}
+
+
+def detect_epoch_unit(values) -> str:
+    """Unit of numeric epochs ("s", "ms", "us" or "ns"), from the magnitude of the largest value."""
+    values = np.asarray(values, dtype=np.float64)
+    magnitude = np.nanmax(np.abs(values)) if values.size and not np.isnan(values).all() else 0
+    return next((unit for unit, max_magnitude in _MAX_MAGNITUDE.items() if magnitude < max_magnitude), "ns")
+
+
+def to_datetime64(timestamps: pd.Series) -> pd.Series:
+    """
+    Timestamps as a datetime64[ns] Series with the same index. Numeric epochs are scaled to nanoseconds with
+    integer arithmetic (NaN becomes NaT) after detecting the unit once for the whole column; strings and datetime
+    objects go through pd.to_datetime.
+    """
+    if pd.api.types.is_datetime64_any_dtype(timestamps):
+        return timestamps
+    if pd.api.types.is_numeric_dtype(timestamps) and not pd.api.types.is_bool_dtype(timestamps):
+        values = timestamps.to_numpy()
+        scale = _NANOSECONDS[detect_epoch_unit(values)]
+        if np.issubdtype(values.dtype, np.integer):
+            nanoseconds = values.astype(np.int64) * scale
+        else:
+            missing = np.isnan(values)
+            nanoseconds = np.where(missing, 0, np.round(values * scale)).astype(np.int64)
+            nanoseconds[missing] = np.iinfo(np.int64).min  # NaT
+        return pd.Series(nanoseconds.view("datetime64[ns]"), index=timestamps.index, name=timestamps.name)
+    return pd.Series(pd.to_datetime(timestamps), index=timestamps.index, name=timestamps.name)
+
+
+def normalize_timestamp_columns(frame: pd.DataFrame, columns: Iterable[str] = ("timestamp",)) -> pd.DataFrame:
+    """
+    Convert timestamp columns of a frame in place with to_datetime64, once: the converted columns are recorded in
+    `frame.attrs["datetime_columns"]` and skipped by later calls on the frame or on copies of it.
+    """
+    converted = frame.attrs.setdefault("datetime_columns", [])
+    for column in columns:
+        if column in frame.columns and column not in converted:
+            frame[column] = to_datetime64(frame[column])
+            converted.append(column)
+    return frame
+
+
+def records_to_frame(records: List[Dict], columns: Iterable[str] = ("timestamp",), sort_by: str = "timestamp") -> pd.DataFrame:
+    """Frame of API records with its timestamp columns converted once and sorted by `sort_by` when present."""
+    frame = normalize_timestamp_columns(pd.DataFrame(records), columns)
+    if sort_by in frame.columns:
+        frame = frame.sort_values(sort_by, kind="stable", ignore_index=True)
+    return frame
@@ -11,6 +11,11 @@ import plotly.graph_objects as go
 import streamlit as st
 from plotly.subplots import make_subplots
 
+from frontend.analytics.downsampling import downsample, downsample_ohlc, visible_slice
+from frontend.analytics.timestamps import records_to_frame
+from frontend.services.archived_trades_store import ArchivedTradesStore
+from frontend.services.bot_run_index import BotRunIndex
+from frontend.services.database_status_store import DatabaseStatusStore
 from frontend.st_utils import get_backend_api_client, initialize_st_page
 
 # Enable nested async
@@ -35,8 +40,10 @@ if "db_summary" not in st.session_state:
     st.session_state.db_summary = {}
 if "db_performance" not in st.session_state:
     st.session_state.db_performance = {}
+if "performance_df" not in st.session_state:
+    st.session_state.performance_df = pd.DataFrame()
 if "trades_data" not in st.session_state:
-    st.session_state.trades_data = []
+    st.session_state.trades_data = pd.DataFrame()
 if "orders_data" not in st.session_state:
     st.session_state.orders_data = []
 if "positions_data" not in st.session_state:
@@ -52,104 +59,80 @@ if "page_limit" not in st.session_state:
 if "trade_analysis" not in st.session_state:
     st.session_state.trade_analysis = {}
 if "historical_candles" not in st.session_state:
-    st.session_state.historical_candles = []
+    st.session_state.historical_candles = pd.DataFrame()
 if "bot_runs" not in st.session_state:
     st.session_state.bot_runs = []
+if "bot_run_index" not in st.session_state:
+    st.session_state.bot_run_index = BotRunIndex([], [])
 
 # Get backend client
 backend_client = get_backend_api_client()
 
+# Trade marker traces with more points than this are rendered with WebGL
+WEBGL_MARKERS_THRESHOLD = 1000
+# Maximum points drawn per candle or performance series of the dashboard, whatever the visible range
+MAX_CHART_POINTS = 2000
 
-# Helper functions
-
-def detect_timestamp_unit(timestamps):
-    """Detect if timestamps are in seconds or milliseconds"""
-    if hasattr(timestamps, 'empty') and timestamps.empty:
-        return 'ms'  # default to milliseconds
-    if not hasattr(timestamps, '__iter__') or len(timestamps) == 0:
-        return 'ms'  # default to milliseconds
-    
-    # Take a sample timestamp
-    sample_ts = timestamps[0] if hasattr(timestamps, '__iter__') else timestamps
-    
-    # If timestamp is greater than 1e10, it's likely milliseconds
-    # (1e10 corresponds to year 2001 in seconds, year 1970 in milliseconds)
-    if sample_ts > 1e10:
-        return 'ms'
-    else:
-        return 's'
 
-def safe_to_datetime(timestamps, default_unit='ms'):
-    """Safely convert timestamps to datetime, auto-detecting unit"""
-    if pd.isna(timestamps).all():
-        return timestamps
-    
-    # Check if already datetime
-    if hasattr(timestamps, 'dtype') and pd.api.types.is_datetime64_any_dtype(timestamps):
-        return timestamps
-    
-    # Check if Series contains datetime objects
-    if hasattr(timestamps, '__iter__') and not isinstance(timestamps, str):
-        first_valid = timestamps.dropna().iloc[0] if hasattr(timestamps, 'dropna') else next((t for t in timestamps if pd.notna(t)), None)
-        if first_valid is not None and isinstance(first_valid, (pd.Timestamp, datetime)):
-            return timestamps
-    
-    # Handle series/array
-    if hasattr(timestamps, '__iter__') and not isinstance(timestamps, str):
-        non_null_ts = timestamps.dropna() if hasattr(timestamps, 'dropna') else [t for t in timestamps if pd.notna(t)]
-        if len(non_null_ts) == 0:
-            return pd.to_datetime(timestamps)
-        unit = detect_timestamp_unit(non_null_ts)
-    else:
-        unit = detect_timestamp_unit([timestamps])
-    
-    return pd.to_datetime(timestamps, unit=unit)
+# Helper functions
 
 def load_databases():
     """Load available databases"""
     try:
         databases = backend_client.archived_bots.list_databases()
         st.session_state.databases_list = databases
+        build_bot_run_index()
         return databases
     except Exception as e:
         st.error(f"Failed to load databases: {str(e)}")
         return []
 
-def load_database_status(db_path: str):
-    """Load status for a specific database"""
-    try:
-        status = backend_client.archived_bots.get_database_status(db_path)
-        return status
-    except Exception as e:
-        return {"status": "error", "error": str(e)}
+@st.cache_resource
+def get_database_status_store():
+    return DatabaseStatusStore(backend_client)
+
+@st.cache_resource
+def get_archived_trades_store():
+    return ArchivedTradesStore(backend_client)
+
+def is_healthy_database(status: Dict) -> bool:
+    """Check if a database status reports it as not corrupted"""
+    # Check if 'healthy' field exists at the top level
+    if status.get("healthy") == True:
+        return True
+    # Handle different status formats as fallback
+    if status.get("status") == "healthy" or status.get("status") == "ok":
+        return True
+    if "status" in status and isinstance(status["status"], dict):
+        # Check if general_status is true in nested status
+        return status["status"].get("general_status") == True
+    return False
 
 def load_all_databases_status():
-    """Load status for all databases"""
+    """Load status for all databases, checking concurrently only the ones without a known status"""
     if not st.session_state.databases_list:
         return
     
-    status_dict = {}
-    for db_path in st.session_state.databases_list:
-        status_dict[db_path] = load_database_status(db_path)
-    
+    db_paths = st.session_state.databases_list
+    store = get_database_status_store()
+    status_dict = store.cached(db_paths)
+    # Shared with the session state so a rerun in the middle of the scan keeps the statuses already received
     st.session_state.databases_status = status_dict
+    
+    pending = len(db_paths) - len(status_dict)
+    if pending:
+        progress = st.progress(0.0, text=f"Checking {pending} databases...")
+        healthy = sum(is_healthy_database(status) for status in status_dict.values())
+        for checked, (db_path, status) in enumerate(store.scan(db_paths), start=1):
+            status_dict[db_path] = status
+            healthy += is_healthy_database(status)
+            progress.progress(checked / pending, text=f"Checked {checked}/{pending} databases ({healthy} healthy)")
+        progress.empty()
     return status_dict
 
 def get_healthy_databases():
     """Get list of databases that are not corrupted"""
-    healthy_dbs = []
-    for db_path, status in st.session_state.databases_status.items():
-        # Check if 'healthy' field exists at the top level
-        if status.get("healthy") == True:
-            healthy_dbs.append(db_path)
-        # Handle different status formats as fallback
-        elif status.get("status") == "healthy" or status.get("status") == "ok":
-            healthy_dbs.append(db_path)
-        elif "status" in status and isinstance(status["status"], dict):
-            # Check if general_status is true in nested status
-            if status["status"].get("general_status") == True:
-                healthy_dbs.append(db_path)
-    return healthy_dbs
+    return [db_path for db_path, status in st.session_state.databases_status.items() if is_healthy_database(status)]
 
 def load_database_summary(db_path: str):
     """Load database summary"""
@@ -166,20 +149,31 @@ def load_database_performance(db_path: str):
     try:
         performance = backend_client.archived_bots.get_database_performance(db_path)
         st.session_state.db_performance = performance
+        # Converted once here and reused by every rerun of the dashboard
+        st.session_state.performance_df = records_to_frame(performance.get("performance_data") or [])
         return performance
     except Exception as e:
         st.error(f"Failed to load performance data: {str(e)}")
         return {}
 
-def load_trades_data(db_path: str, limit: int = 100, offset: int = 0):
-    """Load trades data with pagination"""
+def load_trades_data(db_path: str):
+    """Load all trades of a database, downloaded once and shared as a typed DataFrame"""
     try:
-        trades = backend_client.archived_bots.get_database_trades(db_path, limit, offset)
-        st.session_state.trades_data = trades
-        return trades
+        trades_df = get_archived_trades_store().get_trades(db_path)
     except Exception as e:
         st.error(f"Failed to load trades data: {str(e)}")
-        return {"trades": [], "total": 0}
+        trades_df = pd.DataFrame()
+    st.session_state.trades_data = trades_df
+    return trades_df
+
+@st.cache_data(max_entries=4, show_spinner="Preparing export...")
+def build_trades_export(db_path: str, export_format: str):
+    """File contents, name and MIME type of the trades of a database exported as CSV or JSON"""
+    trades_df = get_archived_trades_store().get_trades(db_path)
+    file_name = db_path.split("/")[-1].rsplit(".", 1)[0] + "_trades"
+    if export_format == "JSON":
+        return trades_df.to_json(orient="records", date_format="iso").encode("utf-8"), f"{file_name}.json", "application/json"
+    return trades_df.to_csv(index=False).encode("utf-8"), f"{file_name}.csv", "text/csv"
 
 def load_orders_data(db_path: str, limit: int = 100, offset: int = 0, status: str = None):
     """Load orders data with pagination"""
@@ -221,43 +215,30 @@ def load_controllers_data(db_path: str):
         st.error(f"Failed to load controllers data: {str(e)}")
         return {"controllers": []}
 
-def get_trade_analysis(db_path: str):
+def get_trade_analysis(trades_df: pd.DataFrame):
     """Get trade analysis including exchanges and trading pairs"""
-    try:
-        trades = backend_client.archived_bots.get_database_trades(db_path, limit=10000, offset=0)
-        if not trades or "trades" not in trades:
-            return {"exchanges": [], "trading_pairs": [], "start_time": None, "end_time": None}
-        
-        trades_data = trades["trades"]
-        if not trades_data:
-            return {"exchanges": [], "trading_pairs": [], "start_time": None, "end_time": None}
-        
-        df = pd.DataFrame(trades_data)
-        
-        # Extract exchanges and trading pairs
-        exchanges = df["connector_name"].unique().tolist() if "connector_name" in df.columns else []
-        trading_pairs = df["trading_pair"].unique().tolist() if "trading_pair" in df.columns else []
-        
-        # Get time range
-        if "timestamp" in df.columns:
-            # Convert timestamps to datetime with auto-detection
-            df["timestamp"] = safe_to_datetime(df["timestamp"])
-            start_time = df["timestamp"].min()
-            end_time = df["timestamp"].max()
-        else:
-            start_time = None
-            end_time = None
-        
-        return {
-            "exchanges": exchanges,
-            "trading_pairs": trading_pairs,
-            "start_time": start_time,
-            "end_time": end_time,
-            "trades_df": df
-        }
-    except Exception as e:
-        st.error(f"Failed to analyze trades: {str(e)}")
-        return {"exchanges": [], "trading_pairs": [], "start_time": None, "end_time": None}
+    if trades_df.empty:
+        return {"exchanges": [], "trading_pairs": [], "start_time": None, "end_time": None, "trades_df": trades_df}
+    
+    # Extract exchanges and trading pairs
+    exchanges = trades_df["connector_name"].unique().tolist() if "connector_name" in trades_df.columns else []
+    trading_pairs = trades_df["trading_pair"].unique().tolist() if "trading_pair" in trades_df.columns else []
+    
+    # Get time range, the trades being sorted by timestamp
+    if "timestamp" in trades_df.columns:
+        start_time = trades_df["timestamp"].iloc[0]
+        end_time = trades_df["timestamp"].iloc[-1]
+    else:
+        start_time = None
+        end_time = None
+    
+    return {
+        "exchanges": exchanges,
+        "trading_pairs": trading_pairs,
+        "start_time": start_time,
+        "end_time": end_time,
+        "trades_df": trades_df
+    }
 
 def load_bot_runs():
     """Load bot runs data"""
@@ -265,33 +246,21 @@ def load_bot_runs():
         bot_runs = backend_client.bot_orchestration.get_bot_runs(limit=1000, offset=0)
         if bot_runs and "data" in bot_runs:
             st.session_state.bot_runs = bot_runs["data"]
-            return bot_runs["data"]
         else:
             st.session_state.bot_runs = []
-            return []
+        build_bot_run_index()
+        return st.session_state.bot_runs
     except Exception as e:
         st.warning(f"Could not load bot runs: {str(e)}")
         return []
 
-def find_matching_bot_run(db_path: str, bot_runs: List[Dict]):
+def build_bot_run_index():
+    """Index the bot runs and databases for the lookups between them"""
+    st.session_state.bot_run_index = BotRunIndex(st.session_state.bot_runs, st.session_state.databases_list)
+
+def find_matching_bot_run(db_path: str):
     """Find the bot run that matches the database file"""
-    if not bot_runs:
-        return None
-    
-    # Extract bot name from database path
-    # Format: "bots/archived/askarabuuut-20250710-0013/data/askarabuuut-20250710-0013-20250710-001318.sqlite"
-    try:
-        filename = db_path.split("/")[-1]  # Get filename
-        bot_name = filename.split("-20")[0]  # Extract bot name before timestamp
-        
-        # Find matching bot run
-        for run in bot_runs:
-            if run.get("bot_name", "").startswith(bot_name):
-                return run
-        
-        return None
-    except Exception:
-        return None
+    return st.session_state.bot_run_index.run_for_database(db_path)
 
 def create_bot_runs_scatterplot(bot_runs: List[Dict], healthy_databases: List[str]):
     """Create a scatterplot visualization of bot runs with performance data"""
@@ -300,6 +269,8 @@ def create_bot_runs_scatterplot(bot_runs: List[Dict], healthy_databases: List[st
     
     # Prepare data for plotting
     plot_data = []
+    healthy_databases = set(healthy_databases)
+    bot_run_index = st.session_state.bot_run_index
     
     for run in bot_runs:
         try:
@@ -327,7 +298,7 @@ def create_bot_runs_scatterplot(bot_runs: List[Dict], healthy_databases: List[st
             duration_hours = (stopped_at - deployed_at).total_seconds() / 3600 if deployed_at and stopped_at else 0
             
             # Check if database is available
-            has_database = any(run.get("bot_name", "") in db for db in healthy_databases)
+            has_database = any(db in healthy_databases for db in bot_run_index.databases_for_run(run.get("bot_name", "")))
             
             plot_data.append({
                 "bot_name": run.get("bot_name", "Unknown"),
@@ -451,10 +422,7 @@ def create_performance_chart(performance_data: Dict[str, Any]):
     if not perf_data:
         return None
     
-    df = pd.DataFrame(perf_data)
-    
-    # Convert timestamp to datetime with auto-detection
-    df["timestamp"] = safe_to_datetime(df["timestamp"])
+    df = records_to_frame(perf_data)
     
     fig = go.Figure()
     
@@ -505,12 +473,12 @@ def create_trades_chart(trades_data: List[Dict[str, Any]]):
     if not trades_data:
         return None
     
-    df = pd.DataFrame(trades_data)
+    df = records_to_frame(trades_data)
     
     fig = go.Figure()
     
     # Group by date and sum volume
-    df["date"] = safe_to_datetime(df["timestamp"]).dt.date
+    df["date"] = df["timestamp"].dt.date
     daily_volume = df.groupby("date")["amount"].sum().reset_index()
     
     fig.add_trace(go.Bar(
@@ -540,57 +508,50 @@ def get_default_layout(title=None, height=800, width=1200):
         layout["title"] = title
     return layout
 
-def add_trades_to_chart(fig, trades_data: List[Dict[str, Any]]):
-    """Add trade lines to chart inspired by backtesting result"""
-    if not trades_data:
-        return fig
-    
-    trades_df = pd.DataFrame(trades_data)
-    trades_df["timestamp"] = safe_to_datetime(trades_df["timestamp"])
-    
-    # Calculate cumulative PnL for each trade
-    if "pnl" in trades_df.columns:
-        trades_df["cumulative_pnl"] = trades_df["pnl"].cumsum()
+def trade_marker_traces(trades_df: pd.DataFrame, marker_size: int = 10, name_suffix: str = " Trade") -> List[go.Scatter]:
+    """Buy and sell markers of the trades as at most two traces, switching to WebGL for large runs"""
+    side_column = next((column for column in ("trade_type", "side", "order_type") if column in trades_df.columns), None)
+    if side_column is not None:
+        is_buy = (trades_df[side_column].astype(str).str.upper() == "BUY").to_numpy()
     else:
-        trades_df["cumulative_pnl"] = 0
+        is_buy = np.zeros(len(trades_df), dtype=bool)
+    timestamps = trades_df["timestamp"].to_numpy()
+    prices = trades_df["price"].to_numpy(dtype=float)
+    amounts = trades_df["amount"].to_numpy(dtype=float) if "amount" in trades_df.columns else np.zeros(len(trades_df))
+    scatter = go.Scattergl if len(trades_df) > WEBGL_MARKERS_THRESHOLD else go.Scatter
     
-    # Group trades by time intervals to show trade lines
-    for idx, trade in trades_df.iterrows():
-        trade_time = trade["timestamp"]
-        trade_price = trade["price"]
-        
-        # Determine trade type
-        is_buy = False
-        if "trade_type" in trade:
-            is_buy = trade["trade_type"].upper() == "BUY"
-        elif "side" in trade:
-            is_buy = trade["side"].upper() == "BUY"
-        elif "order_type" in trade:
-            is_buy = trade["order_type"].upper() == "BUY"
-        
-        # Use trade type for color - Buy=green, Sell=red
-        color = "green" if is_buy else "red"
-        
-        # Add trade marker
-        fig.add_trace(go.Scatter(
-            x=[trade_time],
-            y=[trade_price],
+    traces = []
+    for side, mask, symbol, color in (("Buy", is_buy, "triangle-up", "green"), ("Sell", ~is_buy, "triangle-down", "red")):
+        if not mask.any():
+            continue
+        traces.append(scatter(
+            x=timestamps[mask],
+            y=prices[mask],
+            customdata=amounts[mask],
             mode="markers",
             marker=dict(
-                symbol="triangle-up" if is_buy else "triangle-down",
-                size=10,
+                symbol=symbol,
+                size=marker_size,
                 color=color,
                 line=dict(width=1, color=color)
             ),
-            name=f"{'Buy' if is_buy else 'Sell'} Trade",
+            name=f"{side}{name_suffix}",
             showlegend=False,
-            hovertemplate=f"<b>{'Buy' if is_buy else 'Sell'} Trade</b><br>" +
-                        f"Time: %{{x}}<br>" +
-                        f"Price: ${trade_price:.4f}<br>" +
-                        f"Amount: {trade.get('amount', 0):.4f}<br>" +
+            hovertemplate=f"<b>{side}{name_suffix}</b><br>" +
+                        "Time: %{x}<br>" +
+                        "Price: $%{y:.4f}<br>" +
+                        "Amount: %{customdata:.4f}<br>" +
                         "<extra></extra>"
         ))
+    return traces
+
+def add_trades_to_chart(fig, trades_data: List[Dict[str, Any]]):
+    """Add trade lines to chart inspired by backtesting result"""
+    if not trades_data:
+        return fig
     
+    trades_df = records_to_frame(trades_data)
+    fig.add_traces(trade_marker_traces(trades_df))
     return fig
 
 def get_pnl_trace(trades_data: List[Dict[str, Any]]):
@@ -598,8 +559,7 @@ def get_pnl_trace(trades_data: List[Dict[str, Any]]):
     if not trades_data:
         return None
     
-    trades_df = pd.DataFrame(trades_data)
-    trades_df["timestamp"] = safe_to_datetime(trades_df["timestamp"])
+    trades_df = records_to_frame(trades_data)
     
     # Calculate cumulative PnL
     if "pnl" in trades_df.columns:
@@ -617,9 +577,13 @@ def get_pnl_trace(trades_data: List[Dict[str, Any]]):
         name='Cumulative PnL'
     )
 
-def create_comprehensive_dashboard(candles_data: List[Dict[str, Any]], trades_data: List[Dict[str, Any]], performance_data: Dict[str, Any], trading_pair: str = ""):
-    """Create comprehensive trading dashboard with multiple panels"""
-    if not candles_data or not performance_data:
+def create_comprehensive_dashboard(candles_df: pd.DataFrame, trades_df: pd.DataFrame, perf_df: pd.DataFrame, trading_pair: str = "",
+                                   x_range: Optional[tuple] = None, max_points: int = MAX_CHART_POINTS):
+    """
+    Create comprehensive trading dashboard with multiple panels, drawing each series within `x_range` (the whole
+    run when None) downsampled to at most `max_points` points
+    """
+    if candles_df.empty:
         return None
     
     # Create subplots with shared x-axis
@@ -636,15 +600,15 @@ def create_comprehensive_dashboard(candles_data: List[Dict[str, Any]], trades_da
                [{"secondary_y": True}]]
     )
     
-    # Prepare data
-    candles_df = pd.DataFrame(candles_data)
-    candles_df["timestamp"] = safe_to_datetime(candles_df["timestamp"])
+    # Prepare data, the frames being sorted by time with their timestamps converted when loaded
+    candles_df = downsample_ohlc(candles_df, max_points, x_range)
+    
+    if not perf_df.empty:
+        # Accumulated over the whole run before the visible points are picked
+        perf_df = perf_df.assign(cumulative_fees_quote=perf_df["fees_quote"].cumsum())
     
-    perf_data = performance_data.get("performance_data", [])
-    perf_df = None
-    if perf_data:
-        perf_df = pd.DataFrame(perf_data)
-        perf_df["timestamp"] = safe_to_datetime(perf_df["timestamp"])
+    def series(frame: pd.DataFrame, column: str):
+        return downsample(frame["timestamp"].to_numpy(), frame[column].to_numpy(), max_points, x_range)
     
     # Row 1: Candlestick chart with trades
     fig.add_trace(go.Candlestick(
@@ -658,45 +622,24 @@ def create_comprehensive_dashboard(candles_data: List[Dict[str, Any]], trades_da
     ), row=1, col=1)
     
     # Add trades to price chart and average price lines from performance data
-    if trades_data:
-        trades_df = pd.DataFrame(trades_data)
-        trades_df["timestamp"] = safe_to_datetime(trades_df["timestamp"])
-        
-        # Add individual trade markers
-        for idx, trade in trades_df.iterrows():
-            is_buy = False
-            if "trade_type" in trade:
-                is_buy = trade["trade_type"].upper() == "BUY"
-            elif "side" in trade:
-                is_buy = trade["side"].upper() == "BUY"
-            
-            color = "green" if is_buy else "red"
-            fig.add_trace(go.Scatter(
-                x=[trade["timestamp"]],
-                y=[trade["price"]],
-                mode="markers",
-                marker=dict(
-                    symbol="triangle-up" if is_buy else "triangle-down",
-                    size=8,
-                    color=color,
-                    line=dict(width=1, color=color)
-                ),
-                name=f"{'Buy' if is_buy else 'Sell'} Trade",
-                showlegend=False,
-                hovertemplate=f"<b>{'Buy' if is_buy else 'Sell'}</b><br>Price: ${trade['price']:.4f}<br>Amount: {trade.get('amount', 0):.4f}<extra></extra>"
-            ), row=1, col=1)
+    if not trades_df.empty:
+        # Add the trade markers, buys and sells in one trace each
+        visible_trades = trades_df.iloc[visible_slice(trades_df["timestamp"].to_numpy(), x_range)]
+        for trace in trade_marker_traces(visible_trades, marker_size=8, name_suffix=""):
+            fig.add_trace(trace, row=1, col=1)
     
     # Add dynamic average price lines from performance data
-    if perf_data and perf_df is not None:
+    if not perf_df.empty:
         # Filter performance data to only include rows with valid average prices
         buy_avg_data = perf_df[perf_df["buy_avg_price"] > 0].copy()
         sell_avg_data = perf_df[perf_df["sell_avg_price"] > 0].copy()
         
         # Add buy average price line (evolving over time)
         if not buy_avg_data.empty:
+            x, y = series(buy_avg_data, "buy_avg_price")
             fig.add_trace(go.Scatter(
-                x=buy_avg_data["timestamp"],
-                y=buy_avg_data["buy_avg_price"],
+                x=x,
+                y=y,
                 mode="lines",
                 name="Buy Avg Price",
                 line=dict(color="green", width=2, dash="dash"),
@@ -718,9 +661,10 @@ def create_comprehensive_dashboard(candles_data: List[Dict[str, Any]], trades_da
         
         # Add sell average price line (evolving over time)
         if not sell_avg_data.empty:
+            x, y = series(sell_avg_data, "sell_avg_price")
             fig.add_trace(go.Scatter(
-                x=sell_avg_data["timestamp"],
-                y=sell_avg_data["sell_avg_price"],
+                x=x,
+                y=y,
                 mode="lines",
                 name="Sell Avg Price",
                 line=dict(color="red", width=2, dash="dash"),
@@ -740,38 +684,42 @@ def create_comprehensive_dashboard(candles_data: List[Dict[str, Any]], trades_da
                 row=1, col=1
             )
     
-    if perf_data and perf_df is not None:
+    if not perf_df.empty:
         # Row 2: Net PnL, Unrealized PnL, and Fees (left y-axis) + Position (right y-axis)
+        x, y = series(perf_df, "net_pnl_quote")
         fig.add_trace(go.Scatter(
-            x=perf_df["timestamp"],
-            y=perf_df["net_pnl_quote"],
+            x=x,
+            y=y,
             mode="lines",
             name="Net PnL",
             line=dict(color='#4CAF50', width=2),
             showlegend=True
         ), row=2, col=1, secondary_y=False)
         
+        x, y = series(perf_df, "unrealized_trade_pnl_quote")
         fig.add_trace(go.Scatter(
-            x=perf_df["timestamp"],
-            y=perf_df["unrealized_trade_pnl_quote"],
+            x=x,
+            y=y,
             mode="lines", 
             name="Unrealized PnL",
             line=dict(color='#FF9800', width=2),
             showlegend=True
         ), row=2, col=1, secondary_y=False)
         
+        x, y = series(perf_df, "cumulative_fees_quote")
         fig.add_trace(go.Scatter(
-            x=perf_df["timestamp"],
-            y=perf_df["fees_quote"].cumsum(),
+            x=x,
+            y=y,
             mode="lines",
             name="Cumulative Fees",
             line=dict(color='#F44336', width=2),
             showlegend=True
         ), row=2, col=1, secondary_y=False)
         
+        x, y = series(perf_df, "net_position")
         fig.add_trace(go.Scatter(
-            x=perf_df["timestamp"],
-            y=perf_df["net_position"],
+            x=x,
+            y=y,
             mode="lines",
             name="Net Position",
             line=dict(color='#2196F3', width=2),
@@ -798,6 +746,8 @@ def create_comprehensive_dashboard(candles_data: List[Dict[str, Any]], trades_da
     
     # Update axis properties
     fig.update_xaxes(rangeslider_visible=False)
+    if x_range is not None:
+        fig.update_xaxes(range=list(x_range))
     fig.update_yaxes(title_text="Price ($)", row=1, col=1)
     fig.update_yaxes(title_text="PnL & Fees ($)", row=2, col=1, secondary_y=False)
     fig.update_yaxes(title_text="Position", row=2, col=1, secondary_y=True)
@@ -880,21 +830,32 @@ with col1:
             # Reset data when database changes
             st.session_state.db_summary = {}
             st.session_state.db_performance = {}
-            st.session_state.trades_data = []
+            st.session_state.performance_df = pd.DataFrame()
+            st.session_state.trades_data = pd.DataFrame()
             st.session_state.orders_data = []
             st.session_state.positions_data = []
             st.session_state.executors_data = []
             st.session_state.controllers_data = []
             st.session_state.page_offset = 0
             st.session_state.trade_analysis = {}
-            st.session_state.historical_candles = []
+            st.session_state.historical_candles = pd.DataFrame()
             st.rerun()
     else:
         st.warning("No healthy databases found.")
 
 with col2:
-    if st.button("🔄 Refresh", use_container_width=True):
+    refresh = st.button("🔄 Refresh", use_container_width=True)
+    rescan_all = st.button("♻️ Rescan All", use_container_width=True,
+                           help="Check the status of every database again, not only the new and unhealthy ones")
+    if refresh or rescan_all:
         with st.spinner("Refreshing..."):
+            backend_client.invalidate("archived_bots.list_databases", "archived_bots.get_database_status",
+                                      "bot_orchestration.get_bot_runs")
+            # New databases and failed checks are scanned anyway, so only unhealthy ones are checked again here;
+            # healthy statuses are rescanned once they reach the store's max age
+            get_database_status_store().invalidate(None if rescan_all else [
+                db_path for db_path, status in st.session_state.databases_status.items()
+                if not is_healthy_database(status)])
             load_databases()
             load_all_databases_status()
             load_bot_runs()
@@ -913,7 +874,7 @@ if st.session_state.selected_database:
             load_database_summary(db_path)
     
     # Find matching bot run
-    matching_bot_run = find_matching_bot_run(db_path, st.session_state.bot_runs)
+    matching_bot_run = find_matching_bot_run(db_path)
     
     # Compact summary in one row
     if st.session_state.db_summary and matching_bot_run:
@@ -930,8 +891,8 @@ if st.session_state.selected_database:
             try:
                 # Load all necessary data
                 load_database_performance(db_path)
-                load_trades_data(db_path, 10000, 0)  # Load more trades for analysis
-                st.session_state.trade_analysis = get_trade_analysis(db_path)
+                trades_df = load_trades_data(db_path)  # Every trade, downloaded once
+                st.session_state.trade_analysis = get_trade_analysis(trades_df)
                 
                 st.success("✅ Dashboard loaded!")
                 st.rerun()
@@ -942,7 +903,7 @@ if st.session_state.selected_database:
     st.divider()
     
     # Main Dashboard
-    if st.session_state.db_performance and st.session_state.trades_data and st.session_state.trade_analysis:
+    if st.session_state.db_performance and st.session_state.trade_analysis:
         performance = st.session_state.db_performance
         summary = performance.get("summary", {})
         analysis = st.session_state.trade_analysis
@@ -1001,6 +962,15 @@ if st.session_state.selected_database:
                     index=1,  # Default to 5m
                 )
             
+            # Narrowing the visible range redraws it at a finer resolution
+            x_range = None
+            if analysis.get("start_time") and analysis.get("end_time") and analysis["start_time"] < analysis["end_time"]:
+                run_range = (analysis["start_time"].to_pydatetime(), analysis["end_time"].to_pydatetime())
+                visible_range = st.slider("Visible Range", min_value=run_range[0], max_value=run_range[1],
+                                          value=run_range, format="MM/DD/YY HH:mm")
+                if visible_range != run_range:
+                    x_range = tuple(pd.Timestamp(value) for value in visible_range)
+            
             # Auto-load candles when interval changes
             candle_key = f"{selected_exchange}_{selected_pair}_{candle_interval}"
             if st.session_state.get("candle_key") != candle_key and analysis.get("start_time") and analysis.get("end_time"):
@@ -1012,19 +982,17 @@ if st.session_state.selected_database:
                         analysis["end_time"],
                         candle_interval
                     )
-                    st.session_state.historical_candles = candles
+                    st.session_state.historical_candles = records_to_frame(candles)
                     st.session_state.candle_key = candle_key
             
             # Display comprehensive dashboard
-            if st.session_state.historical_candles:
-                trades_data = analysis.get("trades_df", pd.DataFrame())
-                trades_list = trades_data.to_dict("records") if not trades_data.empty else []
-                
+            if not st.session_state.historical_candles.empty:
                 dashboard = create_comprehensive_dashboard(
                     st.session_state.historical_candles,
-                    trades_list,
-                    performance,
-                    selected_pair
+                    analysis["trades_df"],
+                    st.session_state.performance_df,
+                    selected_pair,
+                    x_range=x_range
                 )
                 
                 if dashboard:
@@ -1070,16 +1038,25 @@ if st.session_state.selected_database:
     
     export_format = st.sidebar.selectbox(
         "Export Format",
-        options=["CSV", "JSON", "Excel"],
+        options=["CSV", "JSON"],
         help="Choose the format for data export"
     )
     
-    if st.sidebar.button("📥 Export Current Data", use_container_width=True):
-        try:
-            # Implementation would depend on the specific data to export
-            st.sidebar.success("Export functionality would be implemented here")
-        except Exception as e:
-            st.sidebar.error(f"Export failed: {str(e)}")
+    if st.session_state.trades_data.empty:
+        st.sidebar.caption("Load the dashboard to export its trades.")
+    else:
+        # The file is only built on request, then kept per database and format instead of on every rerun
+        export_key = (st.session_state.selected_database, export_format)
+        if st.session_state.get("trades_export_key") != export_key:
+            if st.sidebar.button("📦 Prepare Export", use_container_width=True):
+                st.session_state.trades_export_key = export_key
+        if st.session_state.get("trades_export_key") == export_key:
+            try:
+                data, file_name, mime = build_trades_export(*export_key)
+                st.sidebar.download_button("📥 Export Trades", data=data, file_name=file_name, mime=mime,
+                                           use_container_width=True)
+            except Exception as e:
+                st.sidebar.error(f"Export failed: {str(e)}")
 
 # Help section
 st.sidebar.markdown("### ❓ Help")
@@ -1,8 +1,13 @@
+import hashlib
+import json
 import time
+from functools import partial
 
 import pandas as pd
 import streamlit as st
 
+from frontend.analytics.controller_performance import aggregate_controller_performance, format_close_types
+from frontend.services.concurrent_fetch import fetch_concurrently
 from frontend.st_utils import get_backend_api_client, initialize_st_page
 
 initialize_st_page(icon="🦅", show_readme=False)
@@ -16,6 +21,7 @@ if "auto_refresh_enabled" not in st.session_state:
 
 # Set refresh interval
 REFRESH_INTERVAL = 10  # seconds
+FETCH_TIMEOUT = 8  # seconds, per bot snapshot
 
 
 def stop_bot(bot_name):
@@ -83,238 +89,238 @@ def start_controllers(bot_name, controllers):
     return success_count > 0
 
 
-def render_bot_card(bot_name):
+def fetch_bot_snapshot(bot_name):
+    """
+    Status and, for running bots, controller configs of a bot. Raises on backend errors.
+    Runs outside the Streamlit script thread, so it must not use `st.*`.
+    """
+    bot_status = backend_api_client.bot_orchestration.get_bot_status(bot_name)
+    snapshot = {"bot_status": bot_status, "controller_configs": [], "configs_error": None}
+    if bot_status.get("status") == "success" and bot_status.get("data", {}).get("status") == "running":
+        try:
+            controller_configs = backend_api_client.controllers.get_bot_controller_configs(bot_name)
+            snapshot["controller_configs"] = controller_configs if controller_configs else []
+        except Exception as e:
+            # If controller configs fail, continue without them
+            snapshot["configs_error"] = str(e)
+    return snapshot
+
+
+def load_bot_snapshots(bot_names):
+    """
+    Fetch the snapshot of every bot in parallel, requesting each bot's status and configs exactly once.
+    Returns the snapshots and, for the bots whose status couldn't be fetched, the reason.
+    """
+    results = fetch_concurrently(
+        {bot_name: partial(fetch_bot_snapshot, bot_name) for bot_name in bot_names},
+        timeout=FETCH_TIMEOUT
+    )
+    snapshots = {bot_name: result.value for bot_name, result in results.items() if result.ok}
+    unreachable = {
+        bot_name: f"no response within {FETCH_TIMEOUT}s" if result.timed_out else str(result.error)
+        for bot_name, result in results.items() if not result.ok
+    }
+    return snapshots, unreachable
+
+
+def render_unreachable_bot_card(bot_name, reason):
+    """Placeholder card of a bot whose status couldn't be fetched, so it isn't mistaken for a stopped one."""
+    with st.container(border=True):
+        st.warning(f"🤖 **{bot_name}** - Status unavailable ({reason}). It will be retried on the next refresh.")
+
+
+def build_bot_card_data(snapshot):
+    """Compute everything a bot card displays from the bot snapshot."""
+    bot_status = snapshot["bot_status"]
+    bot_data = bot_status.get("data", {})
+    card = {
+        "error": bot_status.get("status") == "error",
+        "is_running": bot_data.get("status") == "running",
+        "configs_error": snapshot["configs_error"],
+        "error_logs": [
+            f"{log.get('timestamp', '')} - {log.get('logger_name', '')}: {log.get('msg', '')}"
+            for log in bot_data.get("error_logs", [])[:50]
+        ],
+        "general_logs": [
+            f"{pd.to_datetime(int(log.get('timestamp', 0)), unit='s')} - {log.get('logger_name', '')}: {log.get('msg', '')}"
+            for log in bot_data.get("general_logs", [])[:50]
+        ],
+    }
+    if not card["is_running"]:
+        return card
+
+    aggregation = aggregate_controller_performance(bot_data.get("performance", {}), snapshot["controller_configs"])
+    controllers = aggregation["controllers"]
+    controller_rows = pd.DataFrame({
+        "Select": False,
+        "ID": controllers["controller_id"].where(controllers["has_config"], None),
+        "Controller": controllers["controller_name"],
+        "Connector": controllers["connector_name"],
+        "Trading Pair": controllers["trading_pair"],
+        "Realized PNL ($)": controllers["realized_pnl_quote"].round(2),
+        "Unrealized PNL ($)": controllers["unrealized_pnl_quote"].round(2),
+        "NET PNL ($)": controllers["global_pnl_quote"].round(2),
+        "Volume ($)": controllers["volume_traded"].round(2),
+        "Close Types": format_close_types(controllers),
+        "_controller_id": controllers["controller_id"],
+    }).reset_index(drop=True)
+    is_stopped = controllers["manual_kill_switch"].to_numpy()
+    error_rows = aggregation["errors"].rename(columns={"controller_id": "Controller", "error": "Error"})
+
+    totals = aggregation["totals"]
+    card.update({
+        "total_global_pnl_quote": totals["global_pnl_quote"],
+        "total_unrealized_pnl_quote": totals["unrealized_pnl_quote"],
+        "total_global_pnl_pct": totals["global_pnl_pct"],
+        "total_volume_traded": totals["volume_traded"],
+        "active_df": controller_rows[~is_stopped].reset_index(drop=True) if (~is_stopped).any() else None,
+        "stopped_df": controller_rows[is_stopped].reset_index(drop=True) if is_stopped.any() else None,
+        "error_df": error_rows.reset_index(drop=True) if not error_rows.empty else None,
+    })
+    return card
+
+
+def get_bot_card_data(bot_name, snapshot):
+    """
+    Return the card data of a bot, recomputing it only when the bot snapshot changed since the last refresh of
+    this session.
+    """
+    fingerprint = hashlib.md5(json.dumps(snapshot, sort_keys=True, default=str).encode()).hexdigest()
+    bot_cards = st.session_state.setdefault("bot_cards", {})
+    cached = bot_cards.get(bot_name)
+    if cached is None or cached[0] != fingerprint:
+        cached = (fingerprint, build_bot_card_data(snapshot))
+        bot_cards[bot_name] = cached
+    return cached[1]
+
+
+def render_bot_card(bot_name, card):
     """Render a bot performance card using native Streamlit components."""
-    try:
-        # Get bot status first
-        bot_status = backend_api_client.bot_orchestration.get_bot_status(bot_name)
-
-        # Only try to get controller configs if bot exists and is running
-        controller_configs = []
-        if bot_status.get("status") == "success":
-            bot_data = bot_status.get("data", {})
-            is_running = bot_data.get("status") == "running"
+    if card["configs_error"]:
+        st.warning(f"Could not fetch controller configs for {bot_name}: {card['configs_error']}")
+
+    with st.container(border=True):
+
+        if card["error"]:
+            # Error state
+            col1, col2 = st.columns([3, 1])
+            with col1:
+                st.error(f"🤖 **{bot_name}** - Not Available")
+            st.error(f"An error occurred while fetching bot status of {bot_name}. Please check the bot client.")
+            return
+
+        is_running = card["is_running"]
+
+        # Bot header
+        col1, col2, col3 = st.columns([2, 1, 1])
+        with col1:
             if is_running:
-                try:
-                    controller_configs = backend_api_client.controllers.get_bot_controller_configs(bot_name)
-                    controller_configs = controller_configs if controller_configs else []
-                except Exception as e:
-                    # If controller configs fail, continue without them
-                    st.warning(f"Could not fetch controller configs for {bot_name}: {e}")
-                    controller_configs = []
-
-        with st.container(border=True):
-
-            if bot_status.get("status") == "error":
-                # Error state
-                col1, col2 = st.columns([3, 1])
-                with col1:
-                    st.error(f"🤖 **{bot_name}** - Not Available")
-                st.error(f"An error occurred while fetching bot status of {bot_name}. Please check the bot client.")
+                st.success(f"🤖 **{bot_name}** - Running")
             else:
-                bot_data = bot_status.get("data", {})
-                is_running = bot_data.get("status") == "running"
-                performance = bot_data.get("performance", {})
-                error_logs = bot_data.get("error_logs", [])
-                general_logs = bot_data.get("general_logs", [])
-
-                # Bot header
-                col1, col2, col3 = st.columns([2, 1, 1])
-                with col1:
-                    if is_running:
-                        st.success(f"🤖 **{bot_name}** - Running")
-                    else:
-                        st.warning(f"🤖 **{bot_name}** - Stopped")
-
-                with col3:
-                    if is_running:
-                        if st.button("⏹️ Stop", key=f"stop_{bot_name}", use_container_width=True):
-                            stop_bot(bot_name)
-                    else:
-                        if st.button("📦 Archive", key=f"archive_{bot_name}", use_container_width=True):
-                            archive_bot(bot_name)
-
-                if is_running:
-                    # Calculate totals
-                    active_controllers = []
-                    stopped_controllers = []
-                    error_controllers = []
-                    total_global_pnl_quote = 0
-                    total_volume_traded = 0
-                    total_unrealized_pnl_quote = 0
-
-                    for controller, inner_dict in performance.items():
-                        controller_status = inner_dict.get("status")
-                        if controller_status == "error":
-                            error_controllers.append({
-                                "Controller": controller,
-                                "Error": inner_dict.get("error", "Unknown error")
-                            })
-                            continue
-
-                        controller_performance = inner_dict.get("performance", {})
-                        controller_config = next(
-                            (config for config in controller_configs if config.get("id") == controller), {}
-                        )
-
-                        controller_name = controller_config.get("controller_name", controller)
-
-                        connector_name = controller_config.get("connector_name", "N/A")
-                        trading_pair = controller_config.get("trading_pair", "N/A")
-                        kill_switch_status = controller_config.get("manual_kill_switch", False)
-
-                        realized_pnl_quote = controller_performance.get("realized_pnl_quote", 0)
-                        unrealized_pnl_quote = controller_performance.get("unrealized_pnl_quote", 0)
-                        global_pnl_quote = controller_performance.get("global_pnl_quote", 0)
-                        volume_traded = controller_performance.get("volume_traded", 0)
-
-                        close_types = controller_performance.get("close_type_counts", {})
-                        tp = close_types.get("CloseType.TAKE_PROFIT", 0)
-                        sl = close_types.get("CloseType.STOP_LOSS", 0)
-                        time_limit = close_types.get("CloseType.TIME_LIMIT", 0)
-                        ts = close_types.get("CloseType.TRAILING_STOP", 0)
-                        refreshed = close_types.get("CloseType.EARLY_STOP", 0)
-                        failed = close_types.get("CloseType.FAILED", 0)
-                        close_types_str = f"TP: {tp} | SL: {sl} | TS: {ts} | TL: {time_limit} | ES: {refreshed} | F: {failed}"
-
-                        controller_info = {
-                            "Select": False,
-                            "ID": controller_config.get("id"),
-                            "Controller": controller_name,
-                            "Connector": connector_name,
-                            "Trading Pair": trading_pair,
-                            "Realized PNL ($)": round(realized_pnl_quote, 2),
-                            "Unrealized PNL ($)": round(unrealized_pnl_quote, 2),
-                            "NET PNL ($)": round(global_pnl_quote, 2),
-                            "Volume ($)": round(volume_traded, 2),
-                            "Close Types": close_types_str,
-                            "_controller_id": controller
-                        }
-
-                        if kill_switch_status:
-                            stopped_controllers.append(controller_info)
-                        else:
-                            active_controllers.append(controller_info)
-
-                        total_global_pnl_quote += global_pnl_quote
-                        total_volume_traded += volume_traded
-                        total_unrealized_pnl_quote += unrealized_pnl_quote
-
-                    total_global_pnl_pct = total_global_pnl_quote / total_volume_traded if total_volume_traded > 0 else 0
-
-                    # Display metrics
-                    col1, col2, col3, col4 = st.columns(4)
-
-                    with col1:
-                        st.metric("🏦 NET PNL", f"${total_global_pnl_quote:.2f}")
-                    with col2:
-                        st.metric("💹 Unrealized PNL", f"${total_unrealized_pnl_quote:.2f}")
-                    with col3:
-                        st.metric("📊 NET PNL (%)", f"{total_global_pnl_pct:.2%}")
-                    with col4:
-                        st.metric("💸 Volume Traded", f"${total_volume_traded:.2f}")
-
-                    # Active Controllers
-                    if active_controllers:
-                        st.success("🚀 **Active Controllers:** Controllers currently running and trading")
-                        active_df = pd.DataFrame(active_controllers)
-
-                        edited_active_df = st.data_editor(
-                            active_df,
-                            column_config={
-                                "Select": st.column_config.CheckboxColumn(
-                                    "Select",
-                                    help="Select controllers to stop",
-                                    default=False,
-                                ),
-                                "_controller_id": None,  # Hide this column
-                            },
-                            disabled=[col for col in active_df.columns if col != "Select"],
-                            hide_index=True,
-                            use_container_width=True,
-                            key=f"active_table_{bot_name}"
-                        )
-
-                        selected_active = [
-                            row["_controller_id"]
-                            for _, row in edited_active_df.iterrows()
-                            if row["Select"]
-                        ]
-
-                        if selected_active:
-                            if st.button(f"⏹️ Stop Selected ({len(selected_active)})",
-                                         key=f"stop_active_{bot_name}",
-                                         type="secondary"):
-                                with st.spinner(f"Stopping {len(selected_active)} controller(s)..."):
-                                    stop_controllers(bot_name, selected_active)
-                                    time.sleep(1)
-
-                    # Stopped Controllers
-                    if stopped_controllers:
-                        st.warning("💤 **Stopped Controllers:** Controllers that are paused or stopped")
-                        stopped_df = pd.DataFrame(stopped_controllers)
-
-                        edited_stopped_df = st.data_editor(
-                            stopped_df,
-                            column_config={
-                                "Select": st.column_config.CheckboxColumn(
-                                    "Select",
-                                    help="Select controllers to start",
-                                    default=False,
-                                ),
-                                "_controller_id": None,  # Hide this column
-                            },
-                            disabled=[col for col in stopped_df.columns if col != "Select"],
-                            hide_index=True,
-                            use_container_width=True,
-                            key=f"stopped_table_{bot_name}"
-                        )
-
-                        selected_stopped = [
-                            row["_controller_id"]
-                            for _, row in edited_stopped_df.iterrows()
-                            if row["Select"]
-                        ]
-
-                        if selected_stopped:
-                            if st.button(f"▶️ Start Selected ({len(selected_stopped)})",
-                                         key=f"start_stopped_{bot_name}",
-                                         type="primary"):
-                                with st.spinner(f"Starting {len(selected_stopped)} controller(s)..."):
-                                    start_controllers(bot_name, selected_stopped)
-                                    time.sleep(1)
-
-                    # Error Controllers
-                    if error_controllers:
-                        st.error("💀 **Controllers with Errors:** Controllers that encountered errors")
-                        error_df = pd.DataFrame(error_controllers)
-                        st.dataframe(error_df, use_container_width=True, hide_index=True)
-
-                # Logs sections (available for both running and stopped bots)
-                with st.expander("📋 Error Logs"):
-                    if error_logs:
-                        for log in error_logs[:50]:
-                            timestamp = log.get("timestamp", "")
-                            message = log.get("msg", "")
-                            logger_name = log.get("logger_name", "")
-                            st.text(f"{timestamp} - {logger_name}: {message}")
-                    else:
-                        st.info("No error logs available.")
-
-                with st.expander("📝 General Logs"):
-                    if general_logs:
-                        for log in general_logs[:50]:
-                            timestamp = pd.to_datetime(int(log.get("timestamp", 0)), unit="s")
-                            message = log.get("msg", "")
-                            logger_name = log.get("logger_name", "")
-                            st.text(f"{timestamp} - {logger_name}: {message}")
-                    else:
-                        st.info("No general logs available.")
+                st.warning(f"🤖 **{bot_name}** - Stopped")
 
-    except Exception as e:
-        with st.container(border=True):
-            st.error(f"🤖 **{bot_name}** - Error")
-            st.error(f"An error occurred while fetching bot status: {str(e)}")
+        with col3:
+            if is_running:
+                if st.button("⏹️ Stop", key=f"stop_{bot_name}", use_container_width=True):
+                    stop_bot(bot_name)
+            else:
+                if st.button("📦 Archive", key=f"archive_{bot_name}", use_container_width=True):
+                    archive_bot(bot_name)
+
+        if is_running:
+            # Display metrics
+            col1, col2, col3, col4 = st.columns(4)
+
+            with col1:
+                st.metric("🏦 NET PNL", f"${card['total_global_pnl_quote']:.2f}")
+            with col2:
+                st.metric("💹 Unrealized PNL", f"${card['total_unrealized_pnl_quote']:.2f}")
+            with col3:
+                st.metric("📊 NET PNL (%)", f"{card['total_global_pnl_pct']:.2%}")
+            with col4:
+                st.metric("💸 Volume Traded", f"${card['total_volume_traded']:.2f}")
+
+            # Active Controllers
+            active_df = card["active_df"]
+            if active_df is not None:
+                st.success("🚀 **Active Controllers:** Controllers currently running and trading")
+
+                edited_active_df = st.data_editor(
+                    active_df,
+                    column_config={
+                        "Select": st.column_config.CheckboxColumn(
+                            "Select",
+                            help="Select controllers to stop",
+                            default=False,
+                        ),
+                        "_controller_id": None,  # Hide this column
+                    },
+                    disabled=[col for col in active_df.columns if col != "Select"],
+                    hide_index=True,
+                    use_container_width=True,
+                    key=f"active_table_{bot_name}"
+                )
+
+                selected_active = edited_active_df.loc[edited_active_df["Select"], "_controller_id"].tolist()
+
+                if selected_active:
+                    if st.button(f"⏹️ Stop Selected ({len(selected_active)})",
+                                 key=f"stop_active_{bot_name}",
+                                 type="secondary"):
+                        with st.spinner(f"Stopping {len(selected_active)} controller(s)..."):
+                            stop_controllers(bot_name, selected_active)
+                            time.sleep(1)
+
+            # Stopped Controllers
+            stopped_df = card["stopped_df"]
+            if stopped_df is not None:
+                st.warning("💤 **Stopped Controllers:** Controllers that are paused or stopped")
+
+                edited_stopped_df = st.data_editor(
+                    stopped_df,
+                    column_config={
+                        "Select": st.column_config.CheckboxColumn(
+                            "Select",
+                            help="Select controllers to start",
+                            default=False,
+                        ),
+                        "_controller_id": None,  # Hide this column
+                    },
+                    disabled=[col for col in stopped_df.columns if col != "Select"],
+                    hide_index=True,
+                    use_container_width=True,
+                    key=f"stopped_table_{bot_name}"
+                )
+
+                selected_stopped = edited_stopped_df.loc[edited_stopped_df["Select"], "_controller_id"].tolist()
+
+                if selected_stopped:
+                    if st.button(f"▶️ Start Selected ({len(selected_stopped)})",
+                                 key=f"start_stopped_{bot_name}",
+                                 type="primary"):
+                        with st.spinner(f"Starting {len(selected_stopped)} controller(s)..."):
+                            start_controllers(bot_name, selected_stopped)
+                            time.sleep(1)
+
+            # Error Controllers
+            if card["error_df"] is not None:
+                st.error("💀 **Controllers with Errors:** Controllers that encountered errors")
+                st.dataframe(card["error_df"], use_container_width=True, hide_index=True)
+
+        # Logs sections (available for both running and stopped bots)
+        with st.expander("📋 Error Logs"):
+            if card["error_logs"]:
+                for line in card["error_logs"]:
+                    st.text(line)
+            else:
+                st.info("No error logs available.")
+
+        with st.expander("📝 General Logs"):
+            if card["general_logs"]:
+                for line in card["general_logs"]:
+                    st.text(line)
+            else:
+                st.info("No general logs available.")
 
 
 # Page Header
@@ -333,6 +339,8 @@ with col2:
 
 with col3:
     if st.button("🔄 Refresh Now", use_container_width=True):
+        # Bypass the shared response cache for an explicit refresh
+        backend_api_client.invalidate("bot_orchestration", "controllers")
         # Re-enable auto-refresh if it was temporarily disabled
         if not st.session_state.auto_refresh_enabled:
             st.session_state.auto_refresh_enabled = True
@@ -348,28 +356,40 @@ def show_bot_instances():
         if active_bots_response.get("status") == "success":
             active_bots = active_bots_response.get("data", {})
 
+            # One status and one configs request per bot, in parallel, shared by the filter and the cards
+            bot_snapshots, unreachable_bots = load_bot_snapshots(list(active_bots.keys()))
+
             # Filter out any bots that might be in transitional state
             truly_active_bots = {}
-            for bot_name, bot_info in active_bots.items():
-                try:
-                    bot_status = backend_api_client.bot_orchestration.get_bot_status(bot_name)
-                    if bot_status.get("status") == "success":
-                        bot_data = bot_status.get("data", {})
-                        if bot_data.get("status") in ["running", "stopped"]:
-                            truly_active_bots[bot_name] = bot_info
-                except Exception:
-                    continue
-
-            if truly_active_bots:
+            for bot_name, snapshot in bot_snapshots.items():
+                bot_status = snapshot["bot_status"]
+                if bot_status.get("status") == "success":
+                    bot_data = bot_status.get("data", {})
+                    if bot_data.get("status") in ["running", "stopped"]:
+                        truly_active_bots[bot_name] = snapshot
+
+            if truly_active_bots or unreachable_bots:
                 # Show refresh status
                 if st.session_state.auto_refresh_enabled:
                     status_placeholder.info(f"🔄 Auto-refreshing every {REFRESH_INTERVAL} seconds")
                 else:
                     status_placeholder.warning("⏸️ Auto-refresh paused. Click 'Refresh Now' to resume.")
 
+                # Drop the cached cards of bots that are gone
+                bot_cards = st.session_state.setdefault("bot_cards", {})
+                for bot_name in set(bot_cards) - set(truly_active_bots):
+                    del bot_cards[bot_name]
+
                 # Render each bot
-                for bot_name in truly_active_bots.keys():
-                    render_bot_card(bot_name)
+                for bot_name, snapshot in truly_active_bots.items():
+                    try:
+                        render_bot_card(bot_name, get_bot_card_data(bot_name, snapshot))
+                    except Exception as e:
+                        with st.container(border=True):
+                            st.error(f"🤖 **{bot_name}** - Error")
+                            st.error(f"An error occurred while rendering bot status: {str(e)}")
+                for bot_name, reason in unreachable_bots.items():
+                    render_unreachable_bot_card(bot_name, reason)
             else:
                 status_placeholder.info("No active bot instances found. Deploy a bot to see it here.")
         else:
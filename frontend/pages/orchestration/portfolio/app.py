@@ -1,7 +1,12 @@
+import math
+from datetime import datetime, timedelta, timezone
+
 import pandas as pd
 import plotly.express as px
 import streamlit as st
 
+from frontend.analytics.portfolio import portfolio_state_to_df
+from frontend.services.portfolio_history_store import PortfolioHistoryStore
 from frontend.st_utils import get_backend_api_client, initialize_st_page
 
 initialize_st_page(title="Portfolio", icon="💰")
@@ -9,98 +14,54 @@ initialize_st_page(title="Portfolio", icon="💰")
 # Page content
 client = get_backend_api_client()
 NUM_COLUMNS = 4
-
-
-# Convert portfolio state to DataFrame for easier manipulation
-def portfolio_state_to_df(portfolio_state):
-    data = []
-    for account, exchanges in portfolio_state.items():
-        for exchange, tokens_info in exchanges.items():
-            for info in tokens_info:
-                data.append({
-                    "account": account,
-                    "exchange": exchange,
-                    "token": info["token"],
-                    "price": info["price"],
-                    "units": info["units"],
-                    "value": info["value"],
-                    "available_units": info["available_units"],
-                })
-    if not data:
-        return pd.DataFrame(columns=[
-            "account", "exchange", "token", "price",
-            "units", "value", "available_units"
-        ])
-    return pd.DataFrame(data)
-
-
-# Convert historical portfolio states to DataFrame
-def portfolio_history_to_df(history):
-    data = []
-    for record in history:
-        timestamp = record["timestamp"]
-        for account, exchanges in record["state"].items():
-            for exchange, tokens_info in exchanges.items():
-                for info in tokens_info:
-                    data.append({
-                        "timestamp": timestamp,
-                        "account": account,
-                        "exchange": exchange,
-                        "token": info["token"],
-                        "price": info["price"],
-                        "units": info["units"],
-                        "value": info["value"],
-                        "available_units": info["available_units"],
-                    })
-    if not data:
-        return pd.DataFrame(columns=[
-            "timestamp", "account", "exchange", "token",
-            "price", "units", "value", "available_units"
-        ])
-    return pd.DataFrame(data)
+HISTORY_KEYS = ["account", "exchange", "token"]
+MAX_CHART_POINTS = 2000  # timestamps kept in the history charts
 
 
 # Aggregate portfolio history by grouping nearby timestamps
-def aggregate_portfolio_history(history_df, time_window_seconds=10):
+def aggregate_portfolio_history(history_df, time_window_seconds=10, max_points=None):
     """
     Aggregate portfolio history by grouping timestamps within a time window.
     This solves the issue where different exchanges are logged at slightly different times.
+    When `max_points` is set, the result is downsampled to at most about that many timestamps for charting.
     """
     if len(history_df) == 0:
         return history_df
-    
-    # Convert timestamp to pandas datetime if not already
-    history_df['timestamp'] = pd.to_datetime(history_df['timestamp'])
-    
-    # Sort by timestamp
-    history_df = history_df.sort_values('timestamp')
-    
-    # Create time groups by rounding timestamps to the nearest time window
-    history_df['time_group'] = history_df['timestamp'].dt.floor(f'{time_window_seconds}s')
-    
-    # For each time group, aggregate the data
-    aggregated_data = []
-    
-    for time_group in history_df['time_group'].unique():
-        group_data = history_df[history_df['time_group'] == time_group]
-        
-        # Aggregate by account, exchange, token within this time group
-        agg_group = group_data.groupby(['account', 'exchange', 'token']).agg({
-            'value': 'sum',
-            'units': 'sum', 
-            'available_units': 'sum',
-            'price': 'mean'  # Use mean price for the time group
-        }).reset_index()
-        
-        # Add the time group as timestamp
-        agg_group['timestamp'] = time_group
-        
-        aggregated_data.append(agg_group)
-    
-    if aggregated_data:
-        return pd.concat(aggregated_data, ignore_index=True)
-    else:
-        return pd.DataFrame()
+
+    timestamps = pd.to_datetime(history_df['timestamp'])
+
+    # Create time groups by rounding timestamps to the nearest time window, and aggregate by account, exchange and
+    # token within each of them in a single grouped pass
+    time_group = timestamps.dt.floor(f'{time_window_seconds}s').rename('timestamp')
+    aggregated = history_df.groupby([time_group] + HISTORY_KEYS, observed=True, sort=True).agg(
+        value=('value', 'sum'),
+        units=('units', 'sum'),
+        available_units=('available_units', 'sum'),
+        price=('price', 'mean'),  # Use mean price for the time group
+    ).reset_index()
+
+    if max_points and aggregated['timestamp'].nunique() > max_points:
+        aggregated = downsample_portfolio_history(aggregated, max_points)
+    return aggregated
+
+
+def downsample_portfolio_history(history_df, max_points):
+    """
+    Average each (account, exchange, token) series of an aggregated history over equal time buckets, so the
+    history has at most about `max_points` timestamps.
+    """
+    span = history_df['timestamp'].max() - history_df['timestamp'].min()
+    bucket = pd.Timedelta(seconds=max(1, math.ceil(span.total_seconds() / max_points)))
+    buckets = history_df['timestamp'].dt.floor(bucket)
+    return history_df.groupby([buckets] + HISTORY_KEYS, observed=True, sort=True)[
+        ['value', 'units', 'available_units', 'price']
+    ].mean().reset_index()
+
+
+@st.cache_resource
+def get_portfolio_history_store():
+    """Portfolio history cached on disk and shared by all sessions."""
+    return PortfolioHistoryStore(client)
 
 
 # Global filters (outside fragments to avoid duplication)
@@ -220,10 +181,11 @@ def portfolio_overview():
     with c1:
         # Portfolio allocation pie chart
         portfolio_df['% Allocation'] = (portfolio_df['value'] / total_balance_usd) * 100
-        portfolio_df['label'] = portfolio_df['token'] + ' ($' + portfolio_df['value'].apply(
+        portfolio_df['label'] = portfolio_df['token'].astype(str) + ' ($' + portfolio_df['value'].apply(
             lambda x: f'{x:,.2f}') + ')'
         
-        fig = px.sunburst(portfolio_df,
+        # The sunburst groups by its path columns without dropping unused categories
+        fig = px.sunburst(portfolio_df.astype({'account': str, 'exchange': str}),
                           path=['account', 'exchange', 'label'],
                           values='value',
                           hover_data={'% Allocation': ':.2f'},
@@ -237,7 +199,7 @@ def portfolio_overview():
     
     with c2:
         # Token distribution
-        token_distribution = portfolio_df.groupby('token')['value'].sum().reset_index()
+        token_distribution = portfolio_df.groupby('token', observed=True)['value'].sum().reset_index()
         token_distribution = token_distribution.sort_values('value', ascending=False)
         
         fig = px.bar(token_distribution, x='token', y='value', 
@@ -262,54 +224,50 @@ def portfolio_history():
     st.subheader("Portfolio History")
     
     # Date range selection
-    col1, col2, col3 = st.columns(3)
+    col1, col2 = st.columns(2)
     with col1:
-        days_back = st.selectbox("Time Period", [7, 30, 90, 180, 365], index=1, key="history_days")
-    with col2:
-        limit = st.number_input("Max Records", min_value=10, max_value=1000, value=100, key="history_limit")
-    with col3:
-        time_window = st.selectbox("Time Aggregation Window", [5, 10, 30, 60, 300], index=1, key="time_window", 
-                                   help="Seconds to group nearby timestamps (fixes exchange timing differences)")
+        days_back = st.selectbox("Time Period", [1, 7, 30, 90, 180, 365], index=2, key="history_days")
     
-    # Get portfolio history
+    # Get portfolio history, complete for the whole period and fetched incrementally. Only periods charted at the
+    # finest resolution read the raw snapshots, longer ones are charted from the rollups alone
+    start_time = int((datetime.now(timezone.utc) - timedelta(days=days_back)).timestamp())
+    store = get_portfolio_history_store()
     try:
-        from datetime import datetime, timezone, timedelta
-        
-        # Calculate start time for filtering
-        start_time = datetime.now(timezone.utc) - timedelta(days=days_back)
-        
-        response = client.portfolio.get_history(
-            selected_accounts,  # account_names
-            None,              # connector_names
-            limit,             # limit
-            None,              # cursor
-            int(start_time.timestamp()),  # start_time
-            None               # end_time
-        )
-        
-        # Extract data from response
-        history_data = response.get("data", [])
-        
+        with st.spinner("Loading portfolio history..."):
+            resolution, rollup_df, errors = store.rollup(selected_accounts, start_time, target_points=MAX_CHART_POINTS)
+            is_raw = resolution in (None, "1m")
+            if is_raw:
+                history_df, _ = store.load(selected_accounts, start_time, refresh=False)
     except Exception as e:
         st.error(f"Failed to fetch portfolio history: {e}")
         return
+    for error in errors:
+        st.warning(f"Failed to fetch portfolio history for {error}")
+    
+    with col2:
+        time_window = st.selectbox("Time Aggregation Window", [5, 10, 30, 60, 300], index=1, key="time_window",
+                                   disabled=not is_raw,
+                                   help="Seconds to group nearby timestamps (fixes exchange timing differences). "
+                                        "Periods charted from averages over longer buckets don't need it.")
     
-    if not history_data or len(history_data) == 0:
+    if len(history_df if is_raw else rollup_df) == 0:
         st.warning("No historical data available.")
         return
     
-    # Convert to DataFrame
-    history_df = portfolio_history_to_df(history_data)
-    history_df['timestamp'] = pd.to_datetime(history_df['timestamp'], format='ISO8601')
-    
-    # Filter by selected exchanges and tokens
-    history_df = history_df[
-        (history_df['exchange'].isin(selected_exchanges)) & 
-        (history_df['token'].isin(selected_tokens))
-    ]
-    
-    # Aggregate timestamps to solve the "electrocardiogram" issue
-    history_df = aggregate_portfolio_history(history_df, time_window_seconds=time_window)
+    if is_raw:
+        # Short periods are charted from the snapshots, aggregating timestamps to solve the "electrocardiogram" issue
+        history_df = history_df[
+            (history_df['exchange'].isin(selected_exchanges)) & 
+            (history_df['token'].isin(selected_tokens))
+        ]
+        history_df = aggregate_portfolio_history(history_df, time_window_seconds=time_window, max_points=MAX_CHART_POINTS)
+    else:
+        # Longer periods are charted from the rollups, already bucketed at a resolution with a bounded number of points
+        history_df = rollup_df[
+            (rollup_df['exchange'].isin(selected_exchanges)) & 
+            (rollup_df['token'].isin(selected_tokens))
+        ]
+        st.caption(f"Showing {resolution} averages over the last {days_back} days.")
     
     if len(history_df) == 0:
         st.warning("No historical data available for selected filters.")
@@ -317,7 +275,7 @@ def portfolio_history():
     
     # Portfolio evolution by account (area chart)
     st.subheader("Portfolio Evolution by Account")
-    account_evolution_df = history_df.groupby(['timestamp', 'account'])['value'].sum().reset_index()
+    account_evolution_df = history_df.groupby(['timestamp', 'account'], observed=True)['value'].sum().reset_index()
     account_evolution_df = account_evolution_df.sort_values('timestamp')
     
     fig = px.area(account_evolution_df, x='timestamp', y='value', color='account', 
@@ -328,11 +286,11 @@ def portfolio_history():
     
     # Portfolio evolution by token (area chart)  
     st.subheader("Portfolio Evolution by Token")
-    token_evolution_df = history_df.groupby(['timestamp', 'token'])['value'].sum().reset_index()
+    token_evolution_df = history_df.groupby(['timestamp', 'token'], observed=True)['value'].sum().reset_index()
     token_evolution_df = token_evolution_df.sort_values('timestamp')
     
     # Show only top 10 tokens by average value to avoid clutter
-    top_tokens = token_evolution_df.groupby('token')['value'].mean().sort_values(ascending=False).head(10).index
+    top_tokens = token_evolution_df.groupby('token', observed=True)['value'].mean().nlargest(10).index
     token_evolution_filtered = token_evolution_df[token_evolution_df['token'].isin(top_tokens)]
     
     fig = px.area(token_evolution_filtered, x='timestamp', y='value', color='token', 
@@ -343,7 +301,7 @@ def portfolio_history():
     
     # Portfolio evolution by exchange (area chart)
     st.subheader("Portfolio Evolution by Exchange")
-    exchange_evolution_df = history_df.groupby(['timestamp', 'exchange'])['value'].sum().reset_index()
+    exchange_evolution_df = history_df.groupby(['timestamp', 'exchange'], observed=True)['value'].sum().reset_index()
     exchange_evolution_df = exchange_evolution_df.sort_values('timestamp')
     
     fig = px.area(exchange_evolution_df, x='timestamp', y='value', color='exchange', 
@@ -1,12 +1,19 @@
 import datetime
+import hashlib
+import json
+import math
 import time
 
 import nest_asyncio
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 import streamlit as st
 from plotly.subplots import make_subplots
 
+from frontend.analytics.order_book import OrderBookSnapshot
+from frontend.services.candle_store import CandleStore
+from frontend.services.concurrent_fetch import fetch_concurrently
 from frontend.st_utils import get_backend_api_client, initialize_st_page
 
 # Enable nested async
@@ -48,8 +55,41 @@ if "trade_price_set_by_user" not in st.session_state:
 if "last_order_type" not in st.session_state:
     st.session_state.last_order_type = "market"  # Track order type changes
 
-# Set refresh interval for real-time updates
-REFRESH_INTERVAL = 30  # seconds
+# Auto-refresh cadences of the independently refreshed page regions
+MARKET_REFRESH_INTERVAL = 2  # seconds, price metrics and order book
+POSITIONS_REFRESH_INTERVAL = 5  # seconds, positions, active orders and order history
+BALANCES_REFRESH_INTERVAL = 30  # seconds
+CANDLES_MAX_REFRESH_INTERVAL = 60  # seconds, candles refresh at the bar interval up to this value
+CANDLE_INTERVAL_SECONDS = {"1m": 60, "3m": 180, "5m": 300, "15m": 900, "1h": 3600, "4h": 14400, "1d": 86400}
+
+# Per-request timeouts for the concurrent trading data fetch
+FETCH_TIMEOUT = 5  # seconds
+FETCH_TIMEOUTS = {"prices": 3, "order_book": 3}
+# Order book levels fetched once per refresh, shared by the depth metrics and the order book chart. Enough for the
+# chart and the depth of most books; a depth range beyond the snapshot is queried from the backend instead
+ORDER_BOOK_DEPTH = 100
+ORDER_BOOK_CHART_LEVELS = 20  # levels per side drawn in the order book chart
+# Requests behind each independently refreshed page region, by request name (see trading_data_requests)
+REGION_REQUESTS = {
+    "market_metrics": ("prices", "order_book", "funding"),
+    "candles_chart": ("candles", "trades"),
+    "order_book_chart": ("prices", "order_book"),
+    "balances": ("balances",),
+    "positions": ("positions",),
+    "active_orders": ("active_orders",),
+    "order_history": ("order_history",),
+}
+# Message shown when a request fails or times out (None renders the section empty without a message)
+FETCH_ERROR_MESSAGES = {
+    "candles": "Could not fetch candles",
+    "prices": "Could not fetch prices",
+    "order_book": "Could not fetch order book",
+    "trades": None,
+    "positions": "Failed to fetch positions",
+    "active_orders": "Failed to fetch active orders",
+    "order_history": None,
+    "balances": "Failed to fetch balances",
+}
 
 
 def get_accounts_and_credentials():
@@ -76,84 +116,84 @@ def get_candles_connectors():
         return []
 
 
-def get_positions():
-    """Get current positions."""
-    try:
-        response = backend_api_client.trading.get_positions(limit=100)
-        # Handle both response formats
-        if isinstance(response, list):
-            return response
-        elif isinstance(response, dict) and response.get("status") == "success":
+def fetch_positions():
+    """Fetch current positions. Raises on backend errors."""
+    response = backend_api_client.trading.get_positions(limit=100)
+    # Handle both response formats
+    if isinstance(response, list):
+        return response
+    elif isinstance(response, dict) and response.get("status") == "success":
+        return response.get("data", [])
+    elif isinstance(response, dict) and "data" in response:
+        # Handle the actual API response format
+        return response.get("data", [])
+    return []
+
+
+def fetch_active_orders():
+    """Fetch active orders. Raises on backend errors."""
+    response = backend_api_client.trading.get_active_orders(limit=100)
+    # Handle both response formats
+    if isinstance(response, list):
+        return response
+    elif isinstance(response, dict):
+        # Check for different response formats
+        if response.get("status") == "success":
             return response.get("data", [])
-        elif isinstance(response, dict) and "data" in response:
-            # Handle the actual API response format
+        elif "data" in response:
+            # Handle response format like {"data": [...], "pagination": {...}}
             return response.get("data", [])
-        return []
-    except Exception as e:
-        st.error(f"Failed to fetch positions: {e}")
-        return []
-
+    return []
+
+
+def fetch_order_history():
+    """Fetch recent order history. Raises on backend errors."""
+    # Try to get orders instead of order_history since that method doesn't exist
+    response = backend_api_client.trading.search_orders(limit=50)
+    # Handle both response formats
+    if isinstance(response, list):
+        return response
+    elif isinstance(response, dict):
+        # Check for different response formats
+        if response.get("status") == "success":
+            return response.get("data", [])
+        elif "data" in response:
+            # Handle response format like {"data": [...], "pagination": {...}}
+            return response.get("data", [])
+    return []
 
-def get_active_orders():
-    """Get active orders."""
-    try:
-        response = backend_api_client.trading.get_active_orders(limit=100)
-        # Handle both response formats
-        if isinstance(response, list):
-            return response
-        elif isinstance(response, dict):
-            # Check for different response formats
-            if response.get("status") == "success":
-                return response.get("data", [])
-            elif "data" in response:
-                # Handle response format like {"data": [...], "pagination": {...}}
-                return response.get("data", [])
-        return []
-    except Exception as e:
-        st.error(f"Failed to fetch active orders: {e}")
-        return []
 
+def fetch_order_book(connector, trading_pair, depth=10):
+    """Fetch order book data for the selected trading pair. Raises on backend errors."""
+    response = backend_api_client.market_data.get_order_book(
+        connector_name=connector,
+        trading_pair=trading_pair,
+        depth=depth
+    )
 
-def get_order_history():
-    """Get recent order history."""
-    try:
-        # Try to get orders instead of order_history since that method doesn't exist
-        response = backend_api_client.trading.search_orders(limit=50)
-        # Handle both response formats
-        if isinstance(response, list):
+    # Handle both response formats
+    if isinstance(response, dict):
+        if "status" in response and response.get("status") == "success":
+            return response.get("data", {})
+        elif "bids" in response and "asks" in response:
             return response
-        elif isinstance(response, dict):
-            # Check for different response formats
-            if response.get("status") == "success":
-                return response.get("data", [])
-            elif "data" in response:
-                # Handle response format like {"data": [...], "pagination": {...}}
-                return response.get("data", [])
-        return []
-    except Exception:
-        # If get_orders doesn't exist either, just return empty list without warning
-        return []
+    return {}
 
 
-def get_order_book(connector, trading_pair, depth=10):
-    """Get order book data for the selected trading pair."""
+def get_quote_volume_for_price(connector, trading_pair, price, is_buy):
+    """Quote volume available up to `price` on one side of the book, as computed by the backend."""
+    response = backend_api_client.market_data.get_quote_volume_for_price(
+        connector_name=connector,
+        trading_pair=trading_pair,
+        price=price,
+        is_buy=is_buy
+    )
+    volume = response.get("result_quote_volume") if isinstance(response, dict) else None
     try:
-        response = backend_api_client.market_data.get_order_book(
-            connector_name=connector,
-            trading_pair=trading_pair,
-            depth=depth
-        )
-
-        # Handle both response formats
-        if isinstance(response, dict):
-            if "status" in response and response.get("status") == "success":
-                return response.get("data", {})
-            elif "bids" in response and "asks" in response:
-                return response
-        return {}
-    except Exception as e:
-        st.warning(f"Could not fetch order book: {e}")
-        return {}
+        volume = float(volume)
+    except (TypeError, ValueError):
+        return 0.0
+    return 0.0 if math.isnan(volume) else volume
 
 
 def get_funding_rate(connector, trading_pair):
@@ -177,8 +217,8 @@ def get_funding_rate(connector, trading_pair):
         return {}
 
 
-def get_trade_history(account_name, connector_name, trading_pair):
-    """Get trade history for the selected account and trading pair."""
+def fetch_trade_history(account_name, connector_name, trading_pair):
+    """Fetch trade history for the selected account and trading pair."""
     try:
         # Try to get trades for this specific account/connector/pair
         response = backend_api_client.trading.get_trades(
@@ -197,7 +237,7 @@ def get_trade_history(account_name, connector_name, trading_pair):
         # If method doesn't exist, try alternative approach
         try:
             # Get all orders and filter for filled ones
-            orders = get_order_history()
+            orders = fetch_order_history()
             trades = []
             for order in orders:
                 if (order.get("status") == "FILLED" and
@@ -209,64 +249,60 @@ def get_trade_history(account_name, connector_name, trading_pair):
             return []
 
 
-def get_market_data(connector, trading_pair, interval="1m", max_records=100, candles_connector=None):
-    """Get market data with proper error handling."""
-    start_time = time.time()
-    try:
-        # Get candles
-        candles = []
-        try:
-            # Use candles_connector if provided, otherwise use main connector
-            candles_conn = candles_connector if candles_connector else connector
-            candles_response = backend_api_client.market_data.get_candles(
-                connector_name=candles_conn,
-                trading_pair=trading_pair,
-                interval=interval,
-                max_records=max_records
-            )
-            # Handle both response formats
-            if isinstance(candles_response, list):
-                # Direct list response
-                candles = candles_response
-            elif isinstance(candles_response, dict) and candles_response.get("status") == "success":
-                # Response object with status and data
-                candles = candles_response.get("data", [])
-        except Exception as e:
-            st.warning(f"Could not fetch candles: {e}")
-
-        # Get current price
-        prices = {}
-        try:
-            price_response = backend_api_client.market_data.get_prices(
-                connector_name=connector,
-                trading_pairs=[trading_pair]
-            )
-            # Handle both response formats
-            if isinstance(price_response, dict):
-                if "status" in price_response and price_response.get("status") == "success":
-                    prices = price_response.get("data", {})
-                elif "prices" in price_response:
-                    # Response has a "prices" field containing the actual price data
-                    prices = price_response.get("prices", {})
-                else:
-                    # Direct dict response with prices
-                    prices = price_response
-            elif isinstance(price_response, list):
-                # If it's a list, try to convert to dict
-                prices = {item.get("trading_pair", "unknown"): item.get("price", 0) for item in price_response if
-                          isinstance(item, dict)}
-        except Exception as e:
-            st.warning(f"Could not fetch prices: {e}")
-
-        # Calculate fetch time for performance monitoring
-        fetch_time = (time.time() - start_time) * 1000
-        st.session_state["last_fetch_time"] = fetch_time
-        st.session_state["last_fetch_timestamp"] = time.time()
-
-        return candles, prices
-    except Exception as e:
-        st.error(f"Failed to fetch market data: {e}")
-        return [], {}
+@st.cache_resource
+def get_candle_store():
+    """Candle buffers shared by all sessions, so each refresh only downloads the newest bars."""
+    return CandleStore(capacity=1000)
+
+
+def fetch_candles(connector, trading_pair, interval="1m", max_records=100, candles_connector=None):
+    """Fetch candles, using candles_connector as source if provided. Raises on backend errors."""
+    # Use candles_connector if provided, otherwise use main connector
+    candles_conn = candles_connector if candles_connector else connector
+    candles_response = backend_api_client.market_data.get_candles(
+        connector_name=candles_conn,
+        trading_pair=trading_pair,
+        interval=interval,
+        max_records=max_records
+    )
+    # Handle both response formats
+    if isinstance(candles_response, list):
+        # Direct list response
+        return candles_response
+    elif isinstance(candles_response, dict) and candles_response.get("status") == "success":
+        # Response object with status and data
+        return candles_response.get("data", [])
+    return []
+
+
+def fetch_prices(connector, trading_pair):
+    """Fetch the current price of the trading pair. Raises on backend errors."""
+    price_response = backend_api_client.market_data.get_prices(
+        connector_name=connector,
+        trading_pairs=[trading_pair]
+    )
+    # Handle both response formats
+    if isinstance(price_response, dict):
+        if "status" in price_response and price_response.get("status") == "success":
+            return price_response.get("data", {})
+        elif "prices" in price_response:
+            # Response has a "prices" field containing the actual price data
+            return price_response.get("prices", {})
+        else:
+            # Direct dict response with prices
+            return price_response
+    elif isinstance(price_response, list):
+        # If it's a list, try to convert to dict
+        return {item.get("trading_pair", "unknown"): item.get("price", 0) for item in price_response if
+                isinstance(item, dict)}
+    return {}
+
+
+def get_current_price(prices, trading_pair):
+    """Current price of the trading pair in a prices response, 0 if it's not available."""
+    if prices and trading_pair in prices:
+        return float(prices[trading_pair])
+    return 0.0
 
 
 def place_order(order_data):
@@ -321,9 +357,143 @@ def get_default_layout(title=None, height=800, width=1100):
     return layout
 
 
+def candles_to_columns(candles_data):
+    """Candle columns as float64 arrays, from a dict of columns or a list of candle dicts."""
+    if isinstance(candles_data, dict):
+        return {column: np.asarray(values, dtype=np.float64) for column, values in candles_data.items()}
+    columns = ("timestamp", "open", "high", "low", "close", "volume")
+    return {column: np.array([float(candle.get(column, 0)) for candle in candles_data]) for column in columns}
+
+
+def trade_markers(trades_data, chart_start, chart_end):
+    """Datetimes and prices of the buy and sell trades executed within the chart time range."""
+    empty = (np.array([], dtype="datetime64[ms]"), np.array([]))
+    markers = {"buy": empty, "sell": empty}
+    if not trades_data:
+        return markers
+    try:
+        trades_df = pd.DataFrame(trades_data)
+        if 'timestamp' in trades_df.columns:
+            trade_times = pd.to_datetime(trades_df['timestamp'], unit='s')
+        elif 'created_at' in trades_df.columns:
+            trade_times = pd.to_datetime(trades_df['created_at'])
+        elif 'execution_time' in trades_df.columns:
+            trade_times = pd.to_datetime(trades_df['execution_time'])
+        else:
+            return markers
+        trade_times = trade_times.dt.tz_localize(None).to_numpy(dtype="datetime64[ms]")
+        prices = trades_df.get('price', trades_df.get('avg_price', pd.Series(0, index=trades_df.index)))
+        prices = pd.to_numeric(prices, errors="coerce").to_numpy(dtype=np.float64)
+        sides = trades_df.get('trade_type', trades_df.get('side', pd.Series("", index=trades_df.index)))
+        sides = sides.astype(str).to_numpy()
+
+        in_range = (trade_times >= chart_start) & (trade_times <= chart_end)
+        for side in markers:
+            mask = in_range & (sides == side)
+            markers[side] = (trade_times[mask], prices[mask])
+    except Exception:
+        # If trade markers fail, continue without them
+        pass
+    return markers
+
+
+def build_candlestick_figure(title):
+    """Figure skeleton with empty candles, volume and trade marker traces, filled in by update_candlestick_figure."""
+    # Create subplots with shared x-axis: candlestick chart on top, volume bars on bottom
+    fig = make_subplots(
+        rows=2, cols=1,
+        shared_xaxes=True,
+        vertical_spacing=0.01,
+        row_heights=[0.8, 0.2],
+        subplot_titles=(None, None)  # No subplot titles
+    )
+    fig.add_trace(go.Candlestick(name="Candlesticks"), row=1, col=1)
+    fig.add_trace(
+        go.Bar(
+            name='Volume',
+            yaxis='y2',
+            hovertemplate='Volume: $%{y:,.0f}<br>%{x}<extra></extra>'
+        ),
+        row=2, col=1
+    )
+    # Buy markers (green triangles pointing up) and sell markers (red triangles pointing down)
+    fig.add_trace(
+        go.Scatter(
+            mode='markers',
+            marker=dict(symbol='triangle-up', size=10, line=dict(width=1, color='white')),
+            name='Buy Trades',
+            hovertemplate='<b>BUY</b><br>Price: $%{y:.4f}<br>Time: %{x}<extra></extra>'
+        ),
+        row=1, col=1
+    )
+    fig.add_trace(
+        go.Scatter(
+            mode='markers',
+            marker=dict(symbol='triangle-down', size=10, line=dict(width=1, color='white')),
+            name='Sell Trades',
+            hovertemplate='<b>SELL</b><br>Price: $%{y:.4f}<br>Time: %{x}<extra></extra>'
+        ),
+        row=1, col=1
+    )
+
+    # Get base layout and customize for subplots
+    layout = get_default_layout(title=title, height=700)  # Increased height for two subplots
+    layout.update({
+        "xaxis": {
+            "rangeslider": {"visible": False},
+            "showgrid": True,
+            "gridcolor": "rgba(255,255,255,0.1)",
+            "color": "white"
+        },
+        "yaxis": {
+            "title": "Price ($)",
+            "showgrid": True,
+            "gridcolor": "rgba(255,255,255,0.1)",
+            "color": "white"
+        },
+        "xaxis2": {
+            "showgrid": True,
+            "gridcolor": "rgba(255,255,255,0.1)",
+            "color": "white"
+        },
+        "yaxis2": {
+            "title": "Volume (Quote)",
+            "showgrid": True,
+            "gridcolor": "rgba(255,255,255,0.1)",
+            "color": "white"
+        }
+    })
+    fig.update_layout(**layout)
+    return fig
+
+
+def update_candlestick_figure(fig, candles, trades_data=None):
+    """Replace the trace arrays of a figure built by build_candlestick_figure, leaving the layout untouched."""
+    datetimes = (candles["timestamp"] * 1000).astype("datetime64[ms]")
+    opens, closes = candles["open"], candles["close"]
+    quote_volume = candles["volume"] * closes if "volume" in candles else np.zeros_like(closes)
+    # Color volume bars based on price movement (green for up, red for down)
+    volume_colors = np.where(closes >= opens, 'rgba(0, 255, 0, 0.5)', 'rgba(255, 0, 0, 0.5)')
+    markers = trade_markers(trades_data, datetimes[0], datetimes[-1])
+
+    candles_trace, volume_trace, buy_trace, sell_trace = fig.data
+    with fig.batch_update():
+        candles_trace.update(x=datetimes, open=opens, high=candles["high"], low=candles["low"], close=closes)
+        volume_trace.update(x=datetimes, y=quote_volume, marker_color=volume_colors,
+                            visible=bool(quote_volume.sum() > 0))
+        buy_trace.update(x=markers["buy"][0], y=markers["buy"][1])
+        sell_trace.update(x=markers["sell"][0], y=markers["sell"][1])
+    return fig
+
+
 def create_candlestick_chart(candles_data, connector_name="", trading_pair="", interval="", trades_data=None):
-    """Create a candlestick chart with custom theme, trade markers, and volume bars."""
-    if not candles_data:
+    """
+    Create a candlestick chart with custom theme, trade markers, and volume bars.
+
+    The figure skeleton (subplots, traces and layout) is built once per chart and kept in the session; refreshes
+    only replace the trace arrays, computed column-wise with NumPy.
+    """
+    if candles_data is None or len(candles_data) == 0:
         fig = go.Figure()
         fig.add_annotation(
             text="No candle data available",
@@ -335,166 +505,20 @@ def create_candlestick_chart(candles_data, connector_name="", trading_pair="", i
         return fig
 
     try:
-        # Convert candles data to DataFrame
-        df = pd.DataFrame(candles_data)
-        if df.empty:
+        candles = candles_to_columns(candles_data)
+        if len(candles["timestamp"]) == 0:
             return go.Figure()
 
-        # Convert timestamp to datetime for better display
-        if 'timestamp' in df.columns:
-            df['datetime'] = pd.to_datetime(df['timestamp'], unit='s')
-
-        # Calculate quote volume (volume * close price)
-        if 'volume' in df.columns and 'close' in df.columns:
-            df['quote_volume'] = df['volume'] * df['close']
-        else:
-            df['quote_volume'] = 0
-
-        # Create subplots with shared x-axis: candlestick chart on top, volume bars on bottom
-        fig = make_subplots(
-            rows=2, cols=1,
-            shared_xaxes=True,
-            vertical_spacing=0.01,
-            row_heights=[0.8, 0.2],
-            subplot_titles=(None, None)  # No subplot titles
-        )
-
-        # Add candlestick trace to first subplot
-        fig.add_trace(
-            go.Candlestick(
-                x=df['datetime'] if 'datetime' in df.columns else df.index,
-                open=df['open'],
-                high=df['high'],
-                low=df['low'],
-                close=df['close'],
-                name="Candlesticks",
-            ),
-            row=1, col=1
-        )
-
-        # Add volume bars to second subplot if volume data exists
-        if 'quote_volume' in df.columns and df['quote_volume'].sum() > 0:
-            # Color volume bars based on price movement (green for up, red for down)
-            colors = ['rgba(0, 255, 0, 0.5)' if close >= open_price else 'rgba(255, 0, 0, 0.5)' 
-                     for close, open_price in zip(df['close'], df['open'])]
-            
-            fig.add_trace(
-                go.Bar(
-                    x=df['datetime'] if 'datetime' in df.columns else df.index,
-                    y=df['quote_volume'],
-                    name='Volume',
-                    marker=dict(color=colors),
-                    yaxis='y2',
-                    hovertemplate='Volume: $%{y:,.0f}<br>%{x}<extra></extra>'
-                ),
-                row=2, col=1
-            )
-
-        # Add trade markers if trade data is provided (add to first subplot)
-        if trades_data:
-            try:
-                trades_df = pd.DataFrame(trades_data)
-                if not trades_df.empty:
-                    # Convert trade timestamps to datetime
-                    if 'timestamp' in trades_df.columns:
-                        trades_df['datetime'] = pd.to_datetime(trades_df['timestamp'], unit='s')
-                    elif 'created_at' in trades_df.columns:
-                        trades_df['datetime'] = pd.to_datetime(trades_df['created_at'])
-                    elif 'execution_time' in trades_df.columns:
-                        trades_df['datetime'] = pd.to_datetime(trades_df['execution_time'])
-
-                    # Filter trades to chart time range if datetime column exists
-                    if 'datetime' in trades_df.columns and 'datetime' in df.columns:
-                        chart_start = df['datetime'].min()
-                        chart_end = df['datetime'].max()
-
-                        trades_in_range = trades_df[
-                            (trades_df['datetime'] >= chart_start) &
-                            (trades_df['datetime'] <= chart_end)
-                            ]
-
-                        if not trades_in_range.empty:
-                            # Separate buy and sell trades
-                            buy_trades = trades_in_range[
-                                trades_in_range.get('trade_type', trades_in_range.get('side', '')) == 'buy']
-                            sell_trades = trades_in_range[
-                                trades_in_range.get('trade_type', trades_in_range.get('side', '')) == 'sell']
-
-                            # Add buy markers (green triangles pointing up) to first subplot
-                            if not buy_trades.empty:
-                                fig.add_trace(
-                                    go.Scatter(
-                                        x=buy_trades['datetime'],
-                                        y=buy_trades.get('price', buy_trades.get('avg_price', 0)),
-                                        mode='markers',
-                                        marker=dict(
-                                            symbol='triangle-up',
-                                            size=10,
-                                            line=dict(width=1, color='white')
-                                        ),
-                                        name='Buy Trades',
-                                        hovertemplate='<b>BUY</b><br>Price: $%{y:.4f}<br>Time: %{x}<extra></extra>'
-                                    ),
-                                    row=1, col=1
-                                )
-
-                            # Add sell markers (red triangles pointing down) to first subplot
-                            if not sell_trades.empty:
-                                fig.add_trace(
-                                    go.Scatter(
-                                        x=sell_trades['datetime'],
-                                        y=sell_trades.get('price', sell_trades.get('avg_price', 0)),
-                                        mode='markers',
-                                        marker=dict(
-                                            symbol='triangle-down',
-                                            size=10,
-                                            line=dict(width=1, color='white')
-                                        ),
-                                        name='Sell Trades',
-                                        hovertemplate='<b>SELL</b><br>Price: $%{y:.4f}<br>Time: %{x}<extra></extra>'
-                                    ),
-                                    row=1, col=1
-                                )
-            except Exception:
-                # If trade markers fail, continue without them
-                pass
-
-        # Create title
-        title = f"{connector_name}: {trading_pair} ({interval})" if connector_name else "Price Chart"
-
-        # Get base layout and customize for subplots
-        layout = get_default_layout(title=title, height=700)  # Increased height for two subplots
-        
-        # Update specific layout options for subplots
-        layout.update({
-            "xaxis": {
-                "rangeslider": {"visible": False},
-                "showgrid": True,
-                "gridcolor": "rgba(255,255,255,0.1)",
-                "color": "white"
-            },
-            "yaxis": {
-                "title": "Price ($)",
-                "showgrid": True,
-                "gridcolor": "rgba(255,255,255,0.1)",
-                "color": "white"
-            },
-            "xaxis2": {
-                "showgrid": True,
-                "gridcolor": "rgba(255,255,255,0.1)",
-                "color": "white"
-            },
-            "yaxis2": {
-                "title": "Volume (Quote)",
-                "showgrid": True,
-                "gridcolor": "rgba(255,255,255,0.1)",
-                "color": "white"
-            }
-        })
-        
-        fig.update_layout(**layout)
-
-        return fig
+        figures = st.session_state.setdefault("candlestick_figures", {})
+        chart_key = (connector_name, trading_pair, interval)
+        fig = figures.get(chart_key)
+        if fig is None:
+            # Keep only the skeleton of the chart currently displayed
+            figures.clear()
+            title = f"{connector_name}: {trading_pair} ({interval})" if connector_name else "Price Chart"
+            fig = build_candlestick_figure(title)
+            figures[chart_key] = fig
+        return update_candlestick_figure(fig, candles, trades_data)
     except Exception as e:
         # Fallback chart with error message
         fig = go.Figure()
@@ -510,7 +534,8 @@ def create_candlestick_chart(candles_data, connector_name="", trading_pair="", i
 
 def create_order_book_chart(order_book_data, current_price=None, depth_percentage=1.0, trading_pair=""):
     """Create an order book histogram with price on Y-axis and volume on X-axis."""
-    if not order_book_data or not order_book_data.get("bids") or not order_book_data.get("asks"):
+    book = OrderBookSnapshot.from_response(order_book_data)
+    if not book:
         fig = go.Figure()
         fig.add_annotation(
             text="No order book data available",
@@ -522,80 +547,48 @@ def create_order_book_chart(order_book_data, current_price=None, depth_percentag
         return fig, None, None
 
     try:
-        bids = order_book_data.get("bids", [])
-        asks = order_book_data.get("asks", [])
-
-        if not bids or not asks:
-            fig = go.Figure()
-            fig.add_annotation(
-                text="Insufficient order book data",
-                xref="paper", yref="paper",
-                x=0.5, y=0.5,
-                showarrow=False
-            )
-            fig.update_layout(**get_default_layout(title="Order Book", height=600, width=300))
-            return fig, None, None
-
-        # Process bids and asks - they're already objects with price/amount keys
-        bids_df = pd.DataFrame(bids)
-        asks_df = pd.DataFrame(asks)
-
-        # Convert to float
-        bids_df['price'] = bids_df['price'].astype(float)
-        bids_df['amount'] = bids_df['amount'].astype(float)
-        asks_df['price'] = asks_df['price'].astype(float)
-        asks_df['amount'] = asks_df['amount'].astype(float)
-
-        # Convert amounts to quote asset (USDT) for better normalization
-        bids_df['quote_volume'] = bids_df['price'] * bids_df['amount']
-        asks_df['quote_volume'] = asks_df['price'] * asks_df['amount']
-
-        # Sort bids descending (highest price first) and asks ascending (lowest price first)
-        bids_df = bids_df.sort_values('price', ascending=False)
-        asks_df = asks_df.sort_values('price', ascending=True)
-
-        # Calculate cumulative volumes for better visualization
-        bids_df['cumulative_volume'] = bids_df['quote_volume'].cumsum()
-        asks_df['cumulative_volume'] = asks_df['quote_volume'].cumsum()
+        # Cumulative quote volumes from the top of the book for better visualization
+        bid_cumulative, ask_cumulative = book.cumulative_depth()
+        bid_prices, bid_volumes = book.bid_prices, book.bid_quote_volumes
+        ask_prices, ask_volumes = book.ask_prices, book.ask_quote_volumes
 
         # Filter by depth percentage if current price is available
         if current_price:
             price_range = current_price * (depth_percentage / 100)
-            min_price = current_price - price_range
-            max_price = current_price + price_range
-
-            bids_df = bids_df[bids_df['price'] >= min_price]
-            asks_df = asks_df[asks_df['price'] <= max_price]
+            bid_mask = bid_prices >= current_price - price_range
+            ask_mask = ask_prices <= current_price + price_range
+            bid_prices, bid_volumes, bid_cumulative = bid_prices[bid_mask], bid_volumes[bid_mask], bid_cumulative[bid_mask]
+            ask_prices, ask_volumes, ask_cumulative = ask_prices[ask_mask], ask_volumes[ask_mask], ask_cumulative[ask_mask]
 
         # Create order book chart
         fig = go.Figure()
 
         # Add bid bars (green, all positive values) - using cumulative volume
-        if not bids_df.empty:
+        if bid_prices.size:
             fig.add_trace(
                 go.Bar(
-                    x=bids_df['cumulative_volume'],  # Using cumulative volume
-                    y=bids_df['price'],
+                    x=bid_cumulative,  # Using cumulative volume
+                    y=bid_prices,
                     orientation='h',
                     name='Bids',
                     marker=dict(opacity=0.8),
                     hovertemplate='<b>BID</b><br>Price: $%{y:.4f}<br>Cumulative Volume: $%{x:,.0f}<br>Level Volume: $%{customdata:,.0f}<extra></extra>',
-                    customdata=bids_df['quote_volume'],  # Show individual level volume in hover
+                    customdata=bid_volumes,  # Show individual level volume in hover
                     offsetgroup='bids'
                 )
             )
 
         # Add ask bars (red, all positive values) - using cumulative volume
-        if not asks_df.empty:
+        if ask_prices.size:
             fig.add_trace(
                 go.Bar(
-                    x=asks_df['cumulative_volume'],  # Using cumulative volume
-                    y=asks_df['price'],
+                    x=ask_cumulative,  # Using cumulative volume
+                    y=ask_prices,
                     orientation='h',
                     name='Asks',
                     marker=dict(opacity=0.8),
                     hovertemplate='<b>ASK</b><br>Price: $%{y:.4f}<br>Cumulative Volume: $%{x:,.0f}<br>Level Volume: $%{customdata:,.0f}<extra></extra>',
-                    customdata=asks_df['quote_volume'],  # Show individual level volume in hover
+                    customdata=ask_volumes,  # Show individual level volume in hover
                     offsetgroup='asks'
                 )
             )
@@ -631,13 +624,13 @@ def create_order_book_chart(order_book_data, current_price=None, depth_percentag
         price_min = None
         price_max = None
 
-        if not bids_df.empty and not asks_df.empty:
-            price_min = min(bids_df['price'].min(), asks_df['price'].min())
-            price_max = max(bids_df['price'].max(), asks_df['price'].max())
-        elif not bids_df.empty:
-            price_min = price_max = bids_df['price'].min()
-        elif not asks_df.empty:
-            price_min = price_max = asks_df['price'].max()
+        if bid_prices.size and ask_prices.size:
+            price_min = min(bid_prices[-1], ask_prices[0])
+            price_max = max(bid_prices[0], ask_prices[-1])
+        elif bid_prices.size:
+            price_min = price_max = bid_prices[-1]
+        elif ask_prices.size:
+            price_min = price_max = ask_prices[-1]
 
         return fig, price_min, price_max
     except Exception as e:
@@ -865,6 +858,361 @@ def render_orders_table(orders_data):
             st.rerun()
 
 
+def render_order_history_table(order_history):
+    """Render order history table."""
+    if not order_history:
+        st.info("No order history found.")
+        return
+
+    # Convert to DataFrame
+    df = pd.DataFrame(order_history)
+    if df.empty:
+        st.info("No order history found.")
+        return
+
+    st.subheader("📜 Order History")
+    st.dataframe(
+        df,
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            "price": st.column_config.NumberColumn(
+                "Price",
+                format="$%.4f"
+            ),
+            "amount": st.column_config.NumberColumn(
+                "Amount",
+                format="%.6f"
+            ),
+            "timestamp": st.column_config.DatetimeColumn(
+                "Time",
+                format="DD/MM/YYYY HH:mm:ss"
+            )
+        }
+    )
+
+
+def fetch_balances(account_name):
+    """Fetch account balances. Raises on backend errors."""
+    if not account_name:
+        return []
+
+    # Get portfolio state for the selected account
+    portfolio_state = backend_api_client.portfolio.get_state(
+        account_names=[account_name]
+    )
+
+    # Extract balances
+    balances = []
+    if account_name in portfolio_state:
+        for exchange, tokens in portfolio_state[account_name].items():
+            for token_info in tokens:
+                balances.append({
+                    "exchange": exchange,
+                    "token": token_info["token"],
+                    "total": token_info["units"],
+                    "available": token_info["available_units"],
+                    "price": token_info["price"],
+                    "value": token_info["value"]
+                })
+    return balances
+
+
+def render_balances_table(balances):
+    """Render balances table."""
+    if not balances:
+        st.info("No balances found.")
+        return
+
+    # Convert to DataFrame
+    df = pd.DataFrame(balances)
+    if df.empty:
+        st.info("No balances found.")
+        return
+
+    st.subheader(f"💰 Account Balances - {st.session_state.selected_account}")
+
+    # Calculate total value
+    total_value = df['value'].sum()
+    st.metric("Total Portfolio Value", f"${total_value:,.2f}")
+
+    st.dataframe(
+        df,
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            "total": st.column_config.NumberColumn(
+                "Total Balance",
+                format="%.6f"
+            ),
+            "available": st.column_config.NumberColumn(
+                "Available",
+                format="%.6f"
+            ),
+            "price": st.column_config.NumberColumn(
+                "Price",
+                format="$%.4f"
+            ),
+            "value": st.column_config.NumberColumn(
+                "Value (USD)",
+                format="$%.2f"
+            )
+        }
+    )
+
+
+def get_candles_refresh_interval(interval):
+    return min(CANDLE_INTERVAL_SECONDS.get(interval, 60), CANDLES_MAX_REFRESH_INTERVAL)
+
+
+def run_fragment(fn, refresh_interval, *args):
+    """Run `fn` as a fragment that re-runs on its own every `refresh_interval` seconds while auto-refresh is on."""
+    run_every = refresh_interval if st.session_state.auto_refresh_enabled else None
+    st.fragment(fn, run_every=run_every)(*args)
+
+
+def build_if_changed(region, data, build):
+    """
+    Return the output of `build()` for a page region, rebuilding it only when the region's data changed since its
+    last run in this session. Used to skip figure construction on refreshes that brought no new data.
+
+    Only the build is skipped: the region's elements are still sent to the browser on every run, since Streamlit
+    clears whatever a fragment run doesn't redraw, so returning early would blank the region instead of keeping
+    its previous output.
+    """
+    fingerprint = hashlib.md5(json.dumps(data, sort_keys=True, default=str).encode()).hexdigest()
+    region_outputs = st.session_state.setdefault("region_outputs", {})
+    cached = region_outputs.get(region)
+    if cached is None or cached[0] != fingerprint:
+        cached = (fingerprint, build())
+        region_outputs[region] = cached
+    return cached[1]
+
+
+def trading_data_requests(connector, trading_pair, interval, max_candles, candles_connector):
+    """Fetch callables of every request behind the page regions, by request name (see REGION_REQUESTS)."""
+    candles_source = candles_connector if candles_connector else connector
+    candle_store = get_candle_store()
+    account_name = st.session_state.selected_account
+    account_connector = st.session_state.selected_connector
+    requests = {
+        "prices": lambda: fetch_prices(connector, trading_pair),
+        "order_book": lambda: fetch_order_book(connector, trading_pair, depth=ORDER_BOOK_DEPTH),
+        "funding": lambda: get_funding_rate(connector, trading_pair),
+        "candles": lambda: candle_store.get_candles(
+            lambda max_records: fetch_candles(connector, trading_pair, interval, max_records, candles_connector),
+            candles_source, trading_pair, interval, max_candles
+        ),
+        "balances": lambda: fetch_balances(account_name),
+        "positions": fetch_positions,
+        "active_orders": fetch_active_orders,
+        "order_history": fetch_order_history,
+    }
+    if account_name and account_connector:
+        requests["trades"] = lambda: fetch_trade_history(account_name, account_connector, trading_pair)
+    return requests
+
+
+def prefetch_trading_data(requests):
+    """
+    Fetch the data of every page region in a single concurrent fan-out on a full page run, so the page waits for
+    its slowest request instead of the sum of the regions. The results are handed over to the region fragments
+    through the session state (see region_data) and returned by request name.
+    """
+    results = fetch_concurrently(requests, timeout=FETCH_TIMEOUT, timeouts=FETCH_TIMEOUTS)
+    st.session_state["prefetched_results"] = {
+        region: {name: results[name] for name in names if name in results}
+        for region, names in REGION_REQUESTS.items()
+    }
+    return results
+
+
+def region_data(region, requests):
+    """
+    Data of a page region by request name. A full page run hands the region the results of prefetch_trading_data;
+    when the fragment reruns on its own timer it fetches its requests concurrently instead. Failed or timed out
+    requests fall back to None and are reported in the page. The region's fetch time, that of its slowest
+    request, is kept in `region_fetch_times`.
+    """
+    results = st.session_state.get("prefetched_results", {}).pop(region, None)
+    if results is None:
+        region_requests = {name: requests[name] for name in REGION_REQUESTS[region] if name in requests}
+        results = fetch_concurrently(region_requests, timeout=FETCH_TIMEOUT, timeouts=FETCH_TIMEOUTS)
+    fetch_times = st.session_state.setdefault("region_fetch_times", {})
+    fetch_times[region] = max((result.elapsed_ms for result in results.values()), default=0.0)
+
+    data = {}
+    for name, result in results.items():
+        data[name] = result.value if result.ok else None
+        message = FETCH_ERROR_MESSAGES.get(name)
+        if result.timed_out and message:
+            st.warning(f"{message}: request timed out after {FETCH_TIMEOUTS.get(name, FETCH_TIMEOUT)}s")
+        elif result.error is not None and message:
+            st.warning(f"{message}: {result.error}")
+    return data
+
+
+def show_fetch_time(region):
+    fetch_time = st.session_state.get("region_fetch_times", {}).get(region)
+    if fetch_time is not None:
+        st.caption(f"⚡ Fetch: {fetch_time:.0f}ms")
+
+
+def top_of_book(order_book, levels):
+    """The best `levels` bids and asks of an order book response."""
+    if not order_book:
+        return {}
+    return {**order_book, "bids": order_book.get("bids", [])[:levels], "asks": order_book.get("asks", [])[:levels]}
+
+
+def show_market_metrics(requests, connector, trading_pair, depth_percentage):
+    """Price, depth and funding metrics, refreshed at the market data cadence."""
+    market_data = region_data("market_metrics", requests)
+    prices = market_data["prices"] or {}
+    order_book = market_data["order_book"] or {}
+    funding_data = market_data["funding"] or {}
+
+    price_col, depth_col, funding_col = st.columns(3)
+
+    book = OrderBookSnapshot.from_response(order_book)
+    with price_col:
+        if book:
+            st.metric(f"💰 {trading_pair}", f"${book.mid_price:.4f}")
+            st.metric("📈 Bid Price", f"${book.best_bid:.4f}")
+            st.metric("📉 Ask Price", f"${book.best_ask:.4f}")
+        else:
+            # Fallback to current price if no order book
+            if prices and trading_pair in prices:
+                current_price = prices[trading_pair]
+                st.metric(
+                    f"💰 {trading_pair}",
+                    f"${float(current_price):,.4f}"
+                )
+            else:
+                st.metric(f"💰 {trading_pair}", "Loading...")
+    with depth_col:
+        if book:
+            # Estimate the depth from the order book snapshot instead of querying the backend for each side
+            depth_factor = depth_percentage / 100
+            sell_price = book.best_ask * (1 + depth_factor)  # Price above current ask, reached when buying
+            buy_price = book.best_bid * (1 - depth_factor)  # Price below current bid, reached when selling
+            buy_impact = book.market_impact(is_buy=True, price_limit=sell_price)
+            sell_impact = book.market_impact(is_buy=False, price_limit=buy_price)
+            buy_vol, sell_vol = buy_impact.quote_volume, sell_impact.quote_volume
+
+            # The backend is only needed when the price limit lies beyond the levels of the snapshot. Failed or timed
+            # out sides keep the snapshot estimates, a lower bound of the depth
+            depth_requests = {}
+            if not buy_impact.depth_sufficient:
+                depth_requests["buy"] = lambda: get_quote_volume_for_price(connector, trading_pair, sell_price, True)
+            if not sell_impact.depth_sufficient:
+                depth_requests["sell"] = lambda: get_quote_volume_for_price(connector, trading_pair, buy_price, False)
+            depth_results = fetch_concurrently(depth_requests, timeout=FETCH_TIMEOUT) if depth_requests else {}
+            if depth_results.get("buy") and depth_results["buy"].ok:
+                buy_vol = depth_results["buy"].value
+            if depth_results.get("sell") and depth_results["sell"].ok:
+                sell_vol = depth_results["sell"].value
+
+            st.metric(
+                "📊 Buy Depth (USDT)",
+                f"${buy_vol:,.0f}" if buy_vol != 0 else "N/A",
+                help=f"Volume available when buying (hitting asks). Average fill ${buy_impact.average_price:,.4f}, "
+                     f"slippage {buy_impact.slippage_bps:.1f} bps"
+            )
+            st.metric(
+                "📊 Sell Depth (USDT)",
+                f"${sell_vol:,.0f}" if sell_vol != 0 else "N/A",
+                help=f"Volume available when selling (hitting bids). Average fill ${sell_impact.average_price:,.4f}, "
+                     f"slippage {sell_impact.slippage_bps:.1f} bps"
+            )
+        elif order_book:
+            st.metric(f"📊 Depth ±{depth_percentage:.1f}%", "No data")
+        else:
+            st.metric(f"📊 Depth ±{depth_percentage:.1f}%", "No order book")
+
+    with funding_col:
+        # Funding rate for perpetual contracts
+        if "perpetual" in connector.lower():
+            if funding_data and "funding_rate" in funding_data:
+                funding_rate = float(funding_data["funding_rate"]) * 100
+                st.metric(
+                    "💸 Funding Rate",
+                    f"{funding_rate:.4f}%"
+                )
+            else:
+                st.metric("💸 Funding Rate", "N/A")
+        else:
+            st.metric("💸 Funding Rate", "Spot")
+    show_fetch_time("market_metrics")
+
+
+def show_candles_chart(requests, connector, trading_pair, interval, candles_connector):
+    """Candlestick chart with trade markers, refreshed at the bar interval."""
+    candles_source = candles_connector if candles_connector else connector
+    chart_data = region_data("candles_chart", requests)
+    candles, candles_version = chart_data["candles"] or ({}, None)
+    trades = chart_data.get("trades") or []
+
+    # The buffer version changes whenever a candle is added or the open bar is updated
+    candlestick_fig = build_if_changed(
+        "candles_chart",
+        [candles_version, len(candles.get("timestamp", [])), trades, candles_source, trading_pair, interval],
+        lambda: create_candlestick_chart(candles, candles_source, trading_pair, interval, trades)
+    )
+    st.plotly_chart(candlestick_fig, use_container_width=True)
+
+    # Show last update time
+    current_time = datetime.datetime.now().strftime("%H:%M:%S")
+    refresh_interval = get_candles_refresh_interval(interval)
+    fetch_time = st.session_state["region_fetch_times"]["candles_chart"]
+    st.caption(f"🔄 Last updated: {current_time} (auto-refresh every {refresh_interval}s, fetch {fetch_time:.0f}ms)")
+
+
+def show_order_book(requests, trading_pair, depth_percentage):
+    """Order book depth chart, refreshed at the market data cadence."""
+    book_data = region_data("order_book_chart", requests)
+    prices = book_data["prices"] or {}
+    # The book is fetched once at ORDER_BOOK_DEPTH for the metrics and the chart, the chart draws its top levels
+    order_book = top_of_book(book_data["order_book"], ORDER_BOOK_CHART_LEVELS)
+
+    current_price = 0.0
+    if prices and trading_pair in prices:
+        current_price = float(prices[trading_pair])
+
+    orderbook_fig, price_min, price_max = build_if_changed(
+        "order_book_chart",
+        [order_book, current_price, depth_percentage],
+        lambda: create_order_book_chart(order_book, current_price, depth_percentage, trading_pair)
+    )
+    st.plotly_chart(orderbook_fig, use_container_width=True)
+    show_fetch_time("order_book_chart")
+
+
+def show_balances(requests):
+    """Balances of the selected account, refreshed every BALANCES_REFRESH_INTERVAL seconds."""
+    balances = region_data("balances", requests)["balances"]
+    render_balances_table(balances or [])
+    show_fetch_time("balances")
+
+
+def show_positions(requests):
+    positions = region_data("positions", requests)["positions"]
+    render_positions_table(positions or [])
+    show_fetch_time("positions")
+
+
+def show_active_orders(requests):
+    orders = region_data("active_orders", requests)["active_orders"]
+    render_orders_table(orders or [])
+    show_fetch_time("active_orders")
+
+
+def show_order_history(requests):
+    order_history = region_data("order_history", requests)["order_history"]
+    render_order_history_table(order_history or [])
+    show_fetch_time("order_history")
+
+
 # Page Header
 st.title("💹 Trading Hub")
 st.caption("Execute trades, monitor positions, and analyze markets")
@@ -943,6 +1291,8 @@ with selection_col:
     if connector and trading_pair:
         st.session_state.selected_market = {"connector": connector, "trading_pair": trading_pair}
 
+# The market metrics are drawn here once the whole page's data has been fetched, see show_trading_data
+metrics_container = None
 with market_data_col:
     st.subheader("📊 Market Data")
 
@@ -951,40 +1301,11 @@ with market_data_col:
         # Get market data for metrics
         connector = st.session_state.selected_market["connector"]
         trading_pair = st.session_state.selected_market["trading_pair"]
-        interval = st.session_state.chart_interval
-        max_candles = st.session_state.max_candles
-        candles_connector = st.session_state.candles_connector
 
         # Create sub-columns for organized display
-        price_col, depth_col, funding_col, controls_col = st.columns([1, 1, 1, 1])
-
-        with price_col:
-            candles, prices = get_market_data(
-                connector, trading_pair, interval, max_candles, candles_connector
-            )
-
-            # Get order book data for bid/ask prices and volumes
-            order_book = get_order_book(connector, trading_pair, depth=1000)
-
-            if order_book and "bids" in order_book and "asks" in order_book:
-                bid_price = float(order_book["bids"][0]["price"]) if order_book["bids"] else 0
-                ask_price = float(order_book["asks"][0]["price"]) if order_book["asks"] else 0
-                mid_price = (bid_price + ask_price) / 2 if bid_price > 0 and ask_price > 0 else 0
+        metrics_col, controls_col = st.columns([3, 1])
 
-                st.metric(f"💰 {trading_pair}", f"${mid_price:.4f}")
-                st.metric("📈 Bid Price", f"${bid_price:.4f}")
-                st.metric("📉 Ask Price", f"${ask_price:.4f}")
-            else:
-                # Fallback to current price if no order book
-                if prices and trading_pair in prices:
-                    current_price = prices[trading_pair]
-                    st.metric(
-                        f"💰 {trading_pair}",
-                        f"${float(current_price):,.4f}"
-                    )
-                else:
-                    st.metric(f"💰 {trading_pair}", "Loading...")
-        with depth_col:
+        with controls_col:
             # Order book depth configuration
             depth_percentage = st.number_input(
                 "📊 Depth ±%",
@@ -996,122 +1317,30 @@ with market_data_col:
                 key="depth_percentage"
             )
 
-            # Calculate depth using the actual API method
-            if order_book and "bids" in order_book and "asks" in order_book:
-                bid_price = float(order_book["bids"][0]["price"]) if order_book["bids"] else 0
-                ask_price = float(order_book["asks"][0]["price"]) if order_book["asks"] else 0
-
-                if bid_price > 0 and ask_price > 0:
-                    # Calculate prices at depth percentage
-                    depth_factor = depth_percentage / 100
-                    buy_price = bid_price * (1 - depth_factor)  # Price below current bid
-                    sell_price = ask_price * (1 + depth_factor)  # Price above current ask
-
-                    try:
-                        # Get buy depth (volume available when buying up to sell_price - hitting asks)
-                        buy_response = backend_api_client.market_data.get_quote_volume_for_price(
-                            connector_name=connector,
-                            trading_pair=trading_pair,
-                            price=sell_price,  # Use sell_price for buying (hitting asks above current price)
-                            is_buy=True
-                        )
-
-                        # Get sell depth (volume available when selling down to buy_price - hitting bids)
-                        sell_response = backend_api_client.market_data.get_quote_volume_for_price(
-                            connector_name=connector,
-                            trading_pair=trading_pair,
-                            price=buy_price,  # Use buy_price for selling (hitting bids below current price)
-                            is_buy=False
-                        )
-
-                        # Handle response format based on your example
-                        buy_vol = 0
-                        sell_vol = 0
-
-                        if isinstance(buy_response, dict) and "result_quote_volume" in buy_response:
-                            buy_vol = buy_response["result_quote_volume"]
-                            # Handle NaN values more robustly
-                            import math
-                            if buy_vol is None or (isinstance(buy_vol, float) and math.isnan(buy_vol)) or str(buy_vol).lower() == 'nan':
-                                buy_vol = 0
-
-                        if isinstance(sell_response, dict) and "result_quote_volume" in sell_response:
-                            sell_vol = sell_response["result_quote_volume"]
-                            # Handle NaN values more robustly
-                            import math
-                            if sell_vol is None or (isinstance(sell_vol, float) and math.isnan(sell_vol)) or str(sell_vol).lower() == 'nan':
-                                sell_vol = 0
-
-                        st.metric(
-                            "📊 Buy Depth (USDT)",
-                            f"${float(buy_vol):,.0f}" if buy_vol != 0 else "N/A",
-                            help="Volume available when buying (hitting asks)"
-                        )
-                        st.metric(
-                            "📊 Sell Depth (USDT)",
-                            f"${float(sell_vol):,.0f}" if sell_vol != 0 else "N/A",
-                            help="Volume available when selling (hitting bids)"
-                        )
-                    except Exception:
-                        # Fallback to simple calculation if API fails
-                        total_bid_volume = sum(float(bid["amount"] * bid["price"]) for bid in order_book["bids"])
-                        total_ask_volume = sum(float(ask["amount"] * ask["price"]) for ask in order_book["asks"])
-
-                        st.metric(
-                            "📊 Buy Depth (USDT)",
-                            f"${total_ask_volume:,.0f}",
-                            help="Total ask volume (for buying)"
-                        )
-                        st.metric(
-                            "📊 Sell Depth (USDT)",
-                            f"${total_bid_volume:,.0f}",
-                            help="Total bid volume (for selling)"
-                        )
-                else:
-                    st.metric(f"📊 Depth ±{depth_percentage:.1f}%", "No data")
-            else:
-                st.metric(f"📊 Depth ±{depth_percentage:.1f}%", "No order book")
-
-        with funding_col:
-            # Funding rate for perpetual contracts
-            if "perpetual" in connector.lower():
-                funding_data = get_funding_rate(connector, trading_pair)
-                if funding_data and "funding_rate" in funding_data:
-                    funding_rate = float(funding_data["funding_rate"]) * 100
-                    st.metric(
-                        "💸 Funding Rate",
-                        f"{funding_rate:.4f}%"
-                    )
-                else:
-                    st.metric("💸 Funding Rate", "N/A")
-            else:
-                st.metric("💸 Funding Rate", "Spot")
-
-        with controls_col:
-            # Show fetch time and refresh button together
-            if "last_fetch_time" in st.session_state:
-                fetch_time = st.session_state["last_fetch_time"]
-                st.caption(f"⚡ Fetch: {fetch_time:.0f}ms")
-
             # Auto-refresh toggle
             auto_refresh = st.toggle(
                 "🔄 Auto-refresh",
                 value=st.session_state.auto_refresh_enabled,
-                help=f"Refresh data every {REFRESH_INTERVAL} seconds"
+                help=f"Refresh market data every {MARKET_REFRESH_INTERVAL}s, positions and orders every "
+                     f"{POSITIONS_REFRESH_INTERVAL}s and balances every {BALANCES_REFRESH_INTERVAL}s"
             )
             st.session_state.auto_refresh_enabled = auto_refresh
 
             # Refresh button
             if st.button("🔄 Refresh Now", use_container_width=True, type="primary"):
+                # Bypass the shared response cache for an explicit refresh
+                backend_api_client.invalidate("market_data", "trading", "portfolio")
                 st.session_state.last_refresh_time = time.time()
                 st.rerun()
+
+        metrics_container = metrics_col
     else:
         st.info("Select account and pair to view extended market data")
 
 
 # Main trading data display function
-def show_trading_data():
-    """Display trading data with chart controls."""
+def show_trading_data(metrics_container):
+    """Display trading data with chart controls, drawing the market metrics in `metrics_container`."""
 
     connector = st.session_state.selected_market.get("connector")
     trading_pair = st.session_state.selected_market.get("trading_pair")
@@ -1124,25 +1353,12 @@ def show_trading_data():
     st.divider()
     chart_col, orderbook_col, trade_col = st.columns([3, 1, 1])
 
-    # Get market data first (needed for both charts)
-    candles, prices = get_market_data(
-        connector, trading_pair, st.session_state.chart_interval,
-        st.session_state.max_candles, st.session_state.candles_connector
-    )
-
-    # Get order book data
-    order_book = get_order_book(connector, trading_pair, depth=20)
-
-    # Get current price and depth percentage
-    current_price = 0.0
-    if prices and trading_pair in prices:
-        current_price = float(prices[trading_pair])
     depth_percentage = st.session_state.get("depth_percentage", 1.0)
 
     with chart_col:
         st.subheader("📈 Price Chart")
 
-        # Chart controls in the same fragment
+        # Chart controls live outside the chart fragment, changing them reruns the whole page
         controls_col1, controls_col2, controls_col3 = st.columns([1, 1, 1])
 
         with controls_col1:
@@ -1181,48 +1397,33 @@ def show_trading_data():
             )
             st.session_state.max_candles = max_candles
 
-        # Get trade history for the selected account/connector/pair
-        trades = []
-        if st.session_state.selected_account and st.session_state.selected_connector:
-            trades = get_trade_history(
-                st.session_state.selected_account,
-                st.session_state.selected_connector,
-                trading_pair
-            )
-
         # Add small gap before chart
         st.write("")
 
-        # Create candlestick chart
-        candles_source = st.session_state.candles_connector if st.session_state.candles_connector else connector
-        candlestick_fig = create_candlestick_chart(candles, candles_source, trading_pair, interval, trades)
+        # Every control is set by now: fetch the data of all regions at once for this run
+        requests = trading_data_requests(connector, trading_pair, interval, max_candles,
+                                         st.session_state.candles_connector)
+        results = prefetch_trading_data(requests)
 
-    with orderbook_col:
-        st.subheader("📊 Order Book")
+        run_fragment(show_candles_chart, get_candles_refresh_interval(interval),
+                     requests, connector, trading_pair, interval, st.session_state.candles_connector)
 
-        # Create and display order book chart
-        orderbook_fig, price_min, price_max = create_order_book_chart(
-            order_book, current_price, depth_percentage, trading_pair
-        )
-
-    # Display both charts
-    with chart_col:
-        st.plotly_chart(candlestick_fig, use_container_width=True)
-        # Show last update time
-        current_time = datetime.datetime.now().strftime("%H:%M:%S")
-        st.caption(f"🔄 Last updated: {current_time} (auto-refresh every 30s)")
+    if metrics_container is not None:
+        with metrics_container:
+            run_fragment(show_market_metrics, MARKET_REFRESH_INTERVAL, requests, connector, trading_pair,
+                         depth_percentage)
 
     with orderbook_col:
-        st.plotly_chart(orderbook_fig, use_container_width=True)
+        st.subheader("📊 Order Book")
+        run_fragment(show_order_book, MARKET_REFRESH_INTERVAL, requests, trading_pair, depth_percentage)
 
     with trade_col:
         st.subheader("💸 Execute Trade")
 
         if st.session_state.selected_account and st.session_state.selected_connector:
             # Get current price for calculations
-            current_price = 0.0
-            if prices and trading_pair in prices:
-                current_price = float(prices[trading_pair])
+            current_price = get_current_price(results["prices"].value if results["prices"].ok else None,
+                                              trading_pair)
 
             # Extract base and quote tokens from trading pair
             base_token, quote_token = trading_pair.split('-')
@@ -1357,144 +1558,18 @@ def show_trading_data():
     # Data tables section
     st.divider()
 
-    # Get positions, orders, and history
-    positions = get_positions()
-    orders = get_active_orders()
-    order_history = get_order_history()
-
-    # Display in tabs - Balances first
+    # Display in tabs - Balances first, each tab refreshes on its own cadence
     tab1, tab2, tab3, tab4 = st.tabs(["💰 Balances", "📊 Positions", "📋 Active Orders", "📜 Order History"])
 
     with tab1:
-        render_balances_table()
+        run_fragment(show_balances, BALANCES_REFRESH_INTERVAL, requests)
     with tab2:
-        render_positions_table(positions)
+        run_fragment(show_positions, POSITIONS_REFRESH_INTERVAL, requests)
     with tab3:
-        render_orders_table(orders)
+        run_fragment(show_active_orders, POSITIONS_REFRESH_INTERVAL, requests)
     with tab4:
-        render_order_history_table(order_history)
+        run_fragment(show_order_history, POSITIONS_REFRESH_INTERVAL, requests)
 
 
-def render_order_history_table(order_history):
-    """Render order history table."""
-    if not order_history:
-        st.info("No order history found.")
-        return
-
-    # Convert to DataFrame
-    df = pd.DataFrame(order_history)
-    if df.empty:
-        st.info("No order history found.")
-        return
-
-    st.subheader("📜 Order History")
-    st.dataframe(
-        df,
-        use_container_width=True,
-        hide_index=True,
-        column_config={
-            "price": st.column_config.NumberColumn(
-                "Price",
-                format="$%.4f"
-            ),
-            "amount": st.column_config.NumberColumn(
-                "Amount",
-                format="%.6f"
-            ),
-            "timestamp": st.column_config.DatetimeColumn(
-                "Time",
-                format="DD/MM/YYYY HH:mm:ss"
-            )
-        }
-    )
-
-
-def get_balances():
-    """Get account balances."""
-    try:
-        if not st.session_state.selected_account:
-            return []
-
-        # Get portfolio state for the selected account
-        portfolio_state = backend_api_client.portfolio.get_state(
-            account_names=[st.session_state.selected_account]
-        )
-
-        # Extract balances
-        balances = []
-        if st.session_state.selected_account in portfolio_state:
-            for exchange, tokens in portfolio_state[st.session_state.selected_account].items():
-                for token_info in tokens:
-                    balances.append({
-                        "exchange": exchange,
-                        "token": token_info["token"],
-                        "total": token_info["units"],
-                        "available": token_info["available_units"],
-                        "price": token_info["price"],
-                        "value": token_info["value"]
-                    })
-        return balances
-    except Exception as e:
-        st.error(f"Failed to fetch balances: {e}")
-        return []
-
-
-def render_balances_table():
-    """Render balances table."""
-    balances = get_balances()
-
-    if not balances:
-        st.info("No balances found.")
-        return
-
-    # Convert to DataFrame
-    df = pd.DataFrame(balances)
-    if df.empty:
-        st.info("No balances found.")
-        return
-
-    st.subheader(f"💰 Account Balances - {st.session_state.selected_account}")
-
-    # Calculate total value
-    total_value = df['value'].sum()
-    st.metric("Total Portfolio Value", f"${total_value:,.2f}")
-
-    st.dataframe(
-        df,
-        use_container_width=True,
-        hide_index=True,
-        column_config={
-            "total": st.column_config.NumberColumn(
-                "Total Balance",
-                format="%.6f"
-            ),
-            "available": st.column_config.NumberColumn(
-                "Available",
-                format="%.6f"
-            ),
-            "price": st.column_config.NumberColumn(
-                "Price",
-                format="$%.4f"
-            ),
-            "value": st.column_config.NumberColumn(
-                "Value (USD)",
-                format="$%.2f"
-            )
-        }
-    )
-
-
-# Auto-refresh logic - only if user is not actively trading
-if st.session_state.auto_refresh_enabled and not st.session_state.trade_price_set_by_user:
-    # Check if it's time to refresh
-    current_time = time.time()
-    time_since_last_refresh = current_time - st.session_state.last_refresh_time
-    
-    if time_since_last_refresh >= REFRESH_INTERVAL:
-        # Update last refresh time and rerun
-        st.session_state.last_refresh_time = current_time
-        time.sleep(0.1)  # Small delay to prevent rapid refreshes
-        st.rerun()
-
 # Display trading data
-show_trading_data()
+show_trading_data(metrics_container)
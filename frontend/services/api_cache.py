@@ -0,0 +1,189 @@
+import copy
+import json
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from frontend.services.concurrent_fetch import request_deadline
+
+# Seconds a response is reused for, per "<router>.<method>". Endpoints that are not listed are never cached.
+DEFAULT_TTL_POLICY: Dict[str, float] = {
+    # Market data
+    "market_data.get_order_book": 1,
+    "market_data.get_prices": 1,
+    "market_data.get_quote_volume_for_price": 1,
+    "market_data.get_candles": 2,
+    "market_data.get_funding_info": 10,
+    "market_data.get_candles_last_days": 60,
+    "market_data.get_historical_candles": 300,
+    # Trading
+    "trading.get_positions": 2,
+    "trading.get_active_orders": 2,
+    "trading.search_orders": 2,
+    "trading.get_trades": 2,
+    # Portfolio
+    "portfolio.get_state": 5,
+    "portfolio.get_portfolio_summary": 5,
+    "portfolio.get_history": 30,
+    # Accounts and connectors
+    "accounts.list_accounts": 60,
+    "accounts.list_account_credentials": 60,
+    "connectors.list_connectors": 60,
+    "connectors.get_config_map": 300,
+    # Controllers and bots
+    "controllers.list_controller_configs": 30,
+    "controllers.get_bot_controller_configs": 5,
+    "bot_orchestration.get_active_bots_status": 2,
+    "bot_orchestration.get_bot_status": 2,
+    "bot_orchestration.get_bot_runs": 30,
+    "docker.get_available_images": 60,
+    # Archived databases don't change once written
+    "archived_bots.list_databases": 30,
+    "archived_bots.get_database_status": 300,
+    "archived_bots.get_database_summary": 300,
+    "archived_bots.get_database_performance": 300,
+    # Trades are kept once per database by ArchivedTradesStore instead of page by page here
+    "archived_bots.get_database_orders": 300,
+    "archived_bots.get_database_positions": 300,
+    "archived_bots.get_database_executors": 300,
+    "archived_bots.get_database_controllers": 300,
+}
+
+# Endpoint prefixes whose cached responses are dropped after a mutation goes through the client.
+DEFAULT_INVALIDATION_POLICY: Dict[str, Tuple[str, ...]] = {
+    "trading.place_order": ("trading", "portfolio"),
+    "trading.cancel_order": ("trading", "portfolio"),
+    "accounts.add_account": ("accounts", "portfolio"),
+    "accounts.delete_account": ("accounts", "portfolio"),
+    "accounts.add_credential": ("accounts", "portfolio"),
+    "accounts.delete_credential": ("accounts", "portfolio"),
+    "controllers.create_or_update_controller_config": ("controllers",),
+    "controllers.delete_controller_config": ("controllers",),
+    "controllers.update_bot_controller_config": ("controllers", "bot_orchestration"),
+    "bot_orchestration.start_bot": ("bot_orchestration",),
+    "bot_orchestration.stop_bot": ("bot_orchestration",),
+    "bot_orchestration.deploy_v2_script": ("bot_orchestration",),
+    "bot_orchestration.deploy_v2_controllers": ("bot_orchestration", "controllers"),
+    "bot_orchestration.stop_and_archive_bot": ("bot_orchestration", "archived_bots"),
+    "bot_orchestration.delete_bot_run": ("bot_orchestration",),
+    "docker.start_container": ("bot_orchestration", "docker"),
+    "docker.stop_container": ("bot_orchestration", "docker"),
+    "docker.clean_exited_containers": ("bot_orchestration", "docker"),
+    "docker.remove_container": ("bot_orchestration", "docker"),
+}
+
+
+class _CachedAttribute:
+    """Resolves `client.<router>.<method>(...)` lazily and routes the call through the cache."""
+
+    def __init__(self, cache: "CachedBackendAPIClient", path: Tuple[str, ...]):
+        self._cache = cache
+        self._path = path
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return _CachedAttribute(self._cache, self._path + (name,))
+
+    def __call__(self, *args, **kwargs):
+        return self._cache.call(self._path, *args, **kwargs)
+
+
+class CachedBackendAPIClient:
+    """
+    Caching proxy in front of a backend client exposing `call(path, *args, **kwargs)` (see BackendAPIClientPool).
+
+    - Read endpoints listed in the TTL policy are cached per arguments for their TTL, shared by all sessions.
+    - Concurrent identical reads are coalesced: only one request goes to the backend and the others wait for it.
+    - Mutations listed in the invalidation policy drop the cached responses they affect. `invalidate()` can be
+      called explicitly, e.g. from a "Refresh Now" button.
+
+    Callers always receive a copy of the cached response, so mutating it doesn't leak into other sessions.
+    """
+
+    def __init__(self, client, ttl_policy: Optional[Dict[str, float]] = None,
+                 invalidation_policy: Optional[Dict[str, Iterable[str]]] = None, max_entries: int = 2048):
+        self._client = client
+        self._ttl_policy = DEFAULT_TTL_POLICY if ttl_policy is None else ttl_policy
+        self._invalidation_policy = DEFAULT_INVALIDATION_POLICY if invalidation_policy is None else invalidation_policy
+        self._max_entries = max_entries
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, Any]]" = OrderedDict()
+        self._in_flight: Dict[Tuple[str, str], Future] = {}
+        self._generation = 0
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return _CachedAttribute(self, (name,))
+
+    @staticmethod
+    def _make_key(endpoint: str, args: tuple, kwargs: dict) -> Tuple[str, str]:
+        return endpoint, json.dumps([args, kwargs], sort_keys=True, default=str)
+
+    def call(self, path: Tuple[str, ...], *args, **kwargs) -> Any:
+        endpoint = ".".join(path)
+        ttl = self._ttl_policy.get(endpoint)
+        if not ttl:
+            try:
+                return self._client.call(path, *args, **kwargs)
+            finally:
+                prefixes = self._invalidation_policy.get(endpoint)
+                if prefixes:
+                    self.invalidate(*prefixes)
+
+        key = self._make_key(endpoint, args, kwargs)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                return copy.deepcopy(entry[1])
+            future = self._in_flight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._in_flight[key] = future
+                generation = self._generation
+
+        if not is_leader:
+            # Followers stop waiting at their own deadline, the leader's request may be slower than they allow
+            deadline = request_deadline()
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            return copy.deepcopy(future.result(timeout=timeout))
+
+        try:
+            value = self._client.call(path, *args, **kwargs)
+        except BaseException as e:
+            with self._lock:
+                self._in_flight.pop(key, None)
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            self._in_flight.pop(key, None)
+            # Don't store responses that may predate an invalidation issued while they were in flight
+            if generation == self._generation:
+                self._entries[key] = (time.monotonic() + ttl, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self._max_entries:
+                    self._entries.popitem(last=False)
+        future.set_result(value)
+        return copy.deepcopy(value)
+
+    def invalidate(self, *prefixes: str):
+        """
+        Drop cached responses for the given routers or endpoints, e.g. `invalidate("trading")` or
+        `invalidate("market_data.get_order_book")`. Drops everything when called without arguments.
+        """
+        with self._lock:
+            self._generation += 1
+            if not prefixes:
+                self._entries.clear()
+                return
+            scopes = tuple(f"{prefix}." for prefix in prefixes)
+            stale_keys = [key for key in self._entries if key[0] in prefixes or key[0].startswith(scopes)]
+            for key in stale_keys:
+                del self._entries[key]
@@ -0,0 +1,85 @@
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from frontend.analytics.timestamps import normalize_timestamp_columns
+
+CATEGORICAL_COLUMNS = ["connector_name", "trading_pair", "trade_type"]
+NUMERIC_COLUMNS = ["price", "amount", "trade_fee_in_quote", "quote_volume", "pnl"]
+
+
+def trades_to_df(trades: List[Dict]) -> pd.DataFrame:
+    """
+    Typed DataFrame of archived trades sorted by time: datetime64 timestamp (from epochs in any unit),
+    categorical connector, pair and trade type and float64 numbers.
+    """
+    trades_df = pd.DataFrame(trades)
+    if trades_df.empty:
+        return trades_df
+    if "timestamp" in trades_df.columns:
+        normalize_timestamp_columns(trades_df)
+        trades_df = trades_df.sort_values("timestamp", kind="stable", ignore_index=True)
+    for column in NUMERIC_COLUMNS:
+        if column in trades_df.columns:
+            trades_df[column] = pd.to_numeric(trades_df[column], errors="coerce").astype("float64")
+    return trades_df.astype({column: "category" for column in CATEGORICAL_COLUMNS if column in trades_df.columns})
+
+
+class ArchivedTradesStore:
+    """
+    All trades of the archived bot databases, each downloaded once page by page and kept as a single typed
+    DataFrame for the summary, analysis, charts and exports. Only the `max_databases` most recently used
+    databases are kept in memory.
+
+    The frames are shared by every caller and must not be modified in place.
+    """
+
+    def __init__(self, client, page_size: int = 5000, max_databases: int = 4):
+        self._client = client
+        self._page_size = page_size
+        self._max_databases = max_databases
+
+        self._lock = threading.Lock()
+        self._db_locks: Dict[str, threading.Lock] = {}
+        self._trades: "OrderedDict[str, pd.DataFrame]" = OrderedDict()
+
+    def fetch_trades(self, db_path: str) -> List[Dict]:
+        """
+        Fetch every trade of a database, following the offset until the reported `total` (or, without one, until a
+        short page), so a backend capping the page size below `page_size` doesn't truncate the trades.
+        """
+        trades, offset = [], 0
+        while True:
+            response = self._client.archived_bots.get_database_trades(db_path, self._page_size, offset) or {}
+            page = response.get("trades") or []
+            trades.extend(page)
+            offset += len(page)
+            total = response.get("total")
+            if not page or (offset >= total if total is not None else len(page) < self._page_size):
+                return trades
+
+    def get_trades(self, db_path: str) -> pd.DataFrame:
+        with self._lock:
+            db_lock = self._db_locks.setdefault(db_path, threading.Lock())
+        # Concurrent sessions opening the same database wait for a single download
+        with db_lock:
+            with self._lock:
+                if db_path in self._trades:
+                    self._trades.move_to_end(db_path)
+                    return self._trades[db_path]
+            trades_df = trades_to_df(self.fetch_trades(db_path))
+            with self._lock:
+                self._trades[db_path] = trades_df
+                while len(self._trades) > self._max_databases:
+                    self._trades.popitem(last=False)
+            return trades_df
+
+    def invalidate(self, db_path: Optional[str] = None):
+        """Forget the trades of a database, or of every database."""
+        with self._lock:
+            if db_path is None:
+                self._trades.clear()
+            else:
+                self._trades.pop(db_path, None)
@@ -0,0 +1,136 @@
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, List, Optional, Tuple
+
+from hummingbot_api_client import SyncHummingbotAPIClient
+
+from frontend.services.concurrent_fetch import FETCH_WORKERS, request_deadline
+
+
+class _PooledAttribute:
+    """Resolves `client.<router>.<method>(...)` lazily and runs the call on a pooled client."""
+
+    def __init__(self, pool: "BackendAPIClientPool", path: Tuple[str, ...]):
+        self._pool = pool
+        self._path = path
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return _PooledAttribute(self._pool, self._path + (name,))
+
+    def __call__(self, *args, **kwargs):
+        return self._pool.call(self._path, *args, **kwargs)
+
+
+class BackendAPIClientPool:
+    """
+    Process-wide, thread-safe pool of SyncHummingbotAPIClient instances.
+
+    All Streamlit sessions share the same pool, so the number of HTTP sessions and login handshakes against the
+    backend is bounded by `max_size` instead of growing with the number of open tabs. Clients are created lazily,
+    kept alive between calls and handed out to one thread at a time. The pool exposes the same
+    `<router>.<method>(...)` interface as the wrapped client, so pages can use it as a drop-in replacement.
+
+    Waiting for an idle client is bounded by `acquire_timeout` and, for calls made by fetch_concurrently or
+    iter_concurrently, by the caller's remaining deadline, so a slow backend holding every client fails the
+    requests that can no longer be used instead of queueing them.
+    """
+
+    def __init__(self, base_url: str, username: str, password: str, max_size: int = FETCH_WORKERS,
+                 acquire_timeout: float = 30.0, health_check_interval: float = 30.0):
+        self._base_url = base_url
+        self._username = username
+        self._password = password
+        self._max_size = max(1, max_size)
+        self._acquire_timeout = acquire_timeout
+        self._health_check_interval = health_check_interval
+
+        self._idle_clients: "queue.LifoQueue[SyncHummingbotAPIClient]" = queue.LifoQueue()
+        self._clients: List[SyncHummingbotAPIClient] = []
+        self._lock = threading.Lock()
+
+        self._health_lock = threading.Lock()
+        self._docker_running: Optional[bool] = None
+        self._docker_checked_at = 0.0
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return _PooledAttribute(self, (name,))
+
+    @property
+    def size(self) -> int:
+        return len(self._clients)
+
+    def _create_client(self) -> SyncHummingbotAPIClient:
+        client = SyncHummingbotAPIClient(
+            base_url=self._base_url,
+            username=self._username,
+            password=self._password
+        )
+        client.__enter__()
+        return client
+
+    def acquire(self) -> SyncHummingbotAPIClient:
+        """Get an idle client, creating a new one while the pool is below its maximum size."""
+        try:
+            return self._idle_clients.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if len(self._clients) < self._max_size:
+                client = self._create_client()
+                self._clients.append(client)
+                return client
+        timeout = self._acquire_timeout
+        deadline = request_deadline()
+        if deadline is not None:
+            timeout = max(0.0, min(timeout, deadline - time.monotonic()))
+        try:
+            return self._idle_clients.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(f"No backend API client available after {timeout:.1f}s")
+
+    def release(self, client: SyncHummingbotAPIClient):
+        self._idle_clients.put(client)
+
+    @contextmanager
+    def client(self):
+        client = self.acquire()
+        try:
+            yield client
+        finally:
+            self.release(client)
+
+    def call(self, path: Tuple[str, ...], *args, **kwargs) -> Any:
+        """Call the attribute at `path` (e.g. ("market_data", "get_prices")) on a pooled client."""
+        with self.client() as client:
+            target = client
+            for name in path:
+                target = getattr(target, name)
+            return target(*args, **kwargs)
+
+    def is_docker_running(self) -> bool:
+        """
+        Return the Docker status of the backend, refreshed at most once per `health_check_interval` seconds
+        for the whole process. Errors are propagated and not cached.
+        """
+        with self._health_lock:
+            now = time.monotonic()
+            if self._docker_running is None or now - self._docker_checked_at >= self._health_check_interval:
+                self._docker_running = bool(self.call(("docker", "is_running")))
+                self._docker_checked_at = now
+            return self._docker_running
+
+    def close(self):
+        with self._lock:
+            clients, self._clients = self._clients, []
+            self._idle_clients = queue.LifoQueue()
+        for client in clients:
+            try:
+                client.__exit__(None, None, None)
+            except Exception:
+                pass  # Ignore cleanup errors
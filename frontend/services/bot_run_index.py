@@ -0,0 +1,53 @@
+from bisect import bisect_left
+from typing import Dict, List, Optional
+
+# Above every character, so `prefix + _MAX_CHAR` bounds the sorted strings starting with `prefix`
+_MAX_CHAR = chr(0x10FFFF)
+
+
+def database_bot_name(db_path: str) -> str:
+    """
+    Bot name of an archived database, e.g. "askarabuuut" for
+    "bots/archived/askarabuuut-20250710-0013/data/askarabuuut-20250710-0013-20250710-001318.sqlite".
+    """
+    return db_path.split("/")[-1].split("-20")[0]
+
+
+def _prefix_range(sorted_keys: List[str], prefix: str) -> range:
+    return range(bisect_left(sorted_keys, prefix), bisect_left(sorted_keys, prefix + _MAX_CHAR))
+
+
+class BotRunIndex:
+    """
+    Lookups between bot runs and archived databases, built once per load of the runs or the databases.
+
+    Run names and database file names are kept sorted, so the names starting with a prefix are found by
+    bisection, and the run of every database is resolved when the index is built.
+    """
+
+    def __init__(self, bot_runs: List[Dict], db_paths: List[str]):
+        self._bot_runs = bot_runs
+        runs = sorted((run.get("bot_name") or "", position) for position, run in enumerate(bot_runs))
+        self._run_names = [name for name, _ in runs]
+        self._run_positions = [position for _, position in runs]
+
+        databases = sorted((db_path.split("/")[-1], db_path) for db_path in db_paths)
+        self._db_file_names = [file_name for file_name, _ in databases]
+        self._db_paths = [db_path for _, db_path in databases]
+
+        self._run_by_database: Dict[str, Optional[Dict]] = {db_path: self._find_run(db_path) for db_path in db_paths}
+
+    def _find_run(self, db_path: str) -> Optional[Dict]:
+        positions = [self._run_positions[i] for i in _prefix_range(self._run_names, database_bot_name(db_path))]
+        # The first run in load order, as when scanning the runs
+        return self._bot_runs[min(positions)] if positions else None
+
+    def run_for_database(self, db_path: str) -> Optional[Dict]:
+        """The bot run whose name starts with the bot name of the database, if any."""
+        if db_path in self._run_by_database:
+            return self._run_by_database[db_path]
+        return self._find_run(db_path)
+
+    def databases_for_run(self, bot_name: str) -> List[str]:
+        """The databases whose file name starts with the name of a bot run."""
+        return [self._db_paths[i] for i in _prefix_range(self._db_file_names, bot_name)]
@@ -0,0 +1,164 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+
+CANDLE_COLUMNS = ("timestamp", "open", "high", "low", "close", "volume")
+INTERVAL_UNIT_SECONDS = {"s": 1, "m": 60, "h": 60 * 60, "d": 60 * 60 * 24, "w": 60 * 60 * 24 * 7}
+
+
+def interval_to_seconds(interval: str) -> int:
+    return int(interval[:-1]) * INTERVAL_UNIT_SECONDS[interval[-1]]
+
+
+def _as_float(value) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+class CandleRingBuffer:
+    """
+    Fixed-capacity ring buffer of OHLCV candles stored column-wise in a NumPy array, ordered by timestamp.
+
+    `update` merges a batch of candles: bars already stored (usually the open bar) are overwritten in place and
+    newer bars are appended, dropping the oldest ones when the buffer is full. `version` only increases when the
+    stored values actually change, so it can be used as a cheap change marker by renderers.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.version = 0
+        self._data = np.full((len(CANDLE_COLUMNS), capacity), np.nan)
+        self._start = 0
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def last_timestamp(self) -> float:
+        if self._size == 0:
+            return -np.inf
+        return self._data[0, (self._start + self._size - 1) % self.capacity]
+
+    def _positions(self, start: int = 0, stop: int = None) -> np.ndarray:
+        stop = self._size if stop is None else stop
+        return (self._start + np.arange(start, stop)) % self.capacity
+
+    def update(self, candles: List[Dict]) -> bool:
+        """
+        Merge candles (dicts with the CANDLE_COLUMNS keys). Missing or invalid values are stored as NaN and candles
+        without a timestamp are skipped. Returns whether the buffer changed.
+        """
+        if not candles:
+            return False
+        rows = np.array([[_as_float(candle.get(column)) for column in CANDLE_COLUMNS] for candle in candles]).T
+        rows = rows[:, ~np.isnan(rows[0])]
+        if not rows.shape[1]:
+            return False
+        rows = rows[:, np.argsort(rows[0], kind="stable")]
+        timestamps = rows[0]
+        changed = False
+
+        # Overwrite bars that are already stored, typically the open bar
+        is_stored = timestamps <= self.last_timestamp
+        if is_stored.any():
+            stored_timestamps = self._data[0, self._positions()]
+            indexes = np.searchsorted(stored_timestamps, timestamps[is_stored])
+            indexes = np.minimum(indexes, self._size - 1)
+            matches = stored_timestamps[indexes] == timestamps[is_stored]
+            positions = self._positions()[indexes[matches]]
+            new_values = rows[:, is_stored][:, matches]
+            if not np.array_equal(self._data[:, positions], new_values):
+                self._data[:, positions] = new_values
+                changed = True
+
+        # Append newer bars, keeping only the last `capacity` ones
+        new_rows = rows[:, ~is_stored][:, -self.capacity:]
+        n_new = new_rows.shape[1]
+        if n_new:
+            positions = (self._start + self._size + np.arange(n_new)) % self.capacity
+            self._data[:, positions] = new_rows
+            overflow = max(0, self._size + n_new - self.capacity)
+            self._start = (self._start + overflow) % self.capacity
+            self._size = min(self._size + n_new, self.capacity)
+            changed = True
+
+        if changed:
+            self.version += 1
+        return changed
+
+    def clear(self):
+        """Drop every stored candle."""
+        if self._size:
+            self._start = 0
+            self._size = 0
+            self.version += 1
+
+    def tail(self, n: int) -> Dict[str, np.ndarray]:
+        """Copy of the last `n` candles as a dict of column arrays."""
+        n = min(n, self._size)
+        data = self._data[:, self._positions(self._size - n)]
+        return {column: data[i] for i, column in enumerate(CANDLE_COLUMNS)}
+
+
+class CandleStore:
+    """
+    Process-wide candle buffers keyed by (connector, trading pair, interval), shared by every session watching
+    the same market.
+
+    The first request downloads the full window. Later refreshes only download the bars newer than the last
+    stored timestamp plus the open bar, so a refresh usually transfers one or two candles instead of hundreds.
+    When more bars opened since the last refresh than the requested window holds, the stored bars are dropped
+    and the window is downloaded again, so the buffer never holds a time gap.
+    """
+
+    def __init__(self, capacity: int = 1000, max_markets: int = 64, min_refresh_interval: float = 1.0):
+        self._capacity = capacity
+        self._max_markets = max_markets
+        self._min_refresh_interval = min_refresh_interval
+        self._lock = threading.Lock()
+        self._markets: "OrderedDict[Tuple[str, str, str], Tuple[CandleRingBuffer, threading.Lock, list]]" = OrderedDict()
+
+    def _get_market(self, key: Tuple[str, str, str]):
+        with self._lock:
+            market = self._markets.get(key)
+            if market is None:
+                # The list holds the monotonic time of the last refresh and the largest window downloaded in full
+                market = (CandleRingBuffer(self._capacity), threading.Lock(), [0.0, 0])
+                self._markets[key] = market
+                while len(self._markets) > self._max_markets:
+                    self._markets.popitem(last=False)
+            self._markets.move_to_end(key)
+            return market
+
+    def get_candles(self, fetch_candles: Callable[[int], List[Dict]], connector: str, trading_pair: str,
+                    interval: str, max_records: int) -> Tuple[Dict[str, np.ndarray], int]:
+        """
+        Return the last `max_records` candles as column arrays and the buffer version, refreshing the buffer first.
+        `fetch_candles(n)` must return the last `n` candles of the market from the backend.
+        """
+        max_records = min(max_records, self._capacity)
+        buffer, market_lock, state = self._get_market((connector, trading_pair, interval))
+
+        # Sessions refreshing the same market wait for a single download instead of issuing their own
+        with market_lock:
+            now = time.monotonic()
+            missing_bars = int((time.time() - buffer.last_timestamp) // interval_to_seconds(interval)) if len(buffer) else 0
+            # A full window replaces the stored bars: update() only merges bars newer than the first stored one,
+            # and a newest window that doesn't reach the stored bars would leave a time gap
+            if state[1] < max_records or missing_bars + 2 > max_records:
+                buffer.clear()
+                buffer.update(fetch_candles(max_records))
+                state[0], state[1] = now, max_records
+            elif now - state[0] >= self._min_refresh_interval:
+                # Re-fetch the stored open bar plus any bar opened since the last refresh
+                buffer.update(fetch_candles(max(missing_bars + 2, 2)))
+                state[0] = now
+            if len(buffer) == 0:
+                return {}, buffer.version
+            return buffer.tail(max_records), buffer.version
@@ -0,0 +1,121 @@
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, TimeoutError, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+# Shared by every session; calls are I/O bound so threads spend most of their time waiting on the backend.
+FETCH_WORKERS = 16
+_executor = ThreadPoolExecutor(max_workers=FETCH_WORKERS, thread_name_prefix="backend-fetch")
+# Deadline of the request running on each fetch thread, see request_deadline
+_request_context = threading.local()
+
+
+@dataclass
+class FetchResult:
+    value: Any = None
+    error: Optional[BaseException] = None
+    timed_out: bool = False
+    elapsed_ms: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and not self.timed_out
+
+
+def request_deadline() -> Optional[float]:
+    """
+    The time.monotonic() deadline of the request running on this thread when it was launched by
+    fetch_concurrently or iter_concurrently, None otherwise. Lets shared resources (e.g. the backend client pool)
+    stop waiting once the caller has given up on the request.
+    """
+    return getattr(_request_context, "deadline", None)
+
+
+def _timed_call(fn: Callable[[], Any], deadline: float = None):
+    if deadline is not None and time.monotonic() >= deadline:
+        raise TimeoutError("request deadline passed before it started")
+    _request_context.deadline = deadline
+    start = time.perf_counter()
+    try:
+        value = fn()
+    finally:
+        _request_context.deadline = None
+    return value, (time.perf_counter() - start) * 1000
+
+
+def fetch_concurrently(requests: Dict[str, Callable[[], Any]], timeout: float = 10.0,
+                       timeouts: Optional[Dict[str, float]] = None) -> Dict[str, FetchResult]:
+    """
+    Run independent fetch callables at the same time and collect their results by name.
+
+    Each request gets its own timeout (`timeouts[name]`, falling back to `timeout`) measured from the moment all
+    requests are launched, so the total wait is bounded by the slowest allowed request instead of the sum of them.
+    Failures and timeouts are reported in the returned FetchResult instead of raised, so callers can render
+    whatever data did arrive. The callables run outside the Streamlit script thread and must not use `st.*`.
+    """
+    timeouts = timeouts or {}
+    started_at = time.monotonic()
+    deadlines = {name: started_at + timeouts.get(name, timeout) for name in requests}
+    futures = {name: _executor.submit(_timed_call, fn, deadlines[name]) for name, fn in requests.items()}
+
+    results = {}
+    for name, future in futures.items():
+        deadline = deadlines[name]
+        try:
+            value, elapsed_ms = future.result(timeout=max(0.0, deadline - time.monotonic()))
+            results[name] = FetchResult(value=value, elapsed_ms=elapsed_ms)
+        except TimeoutError:
+            future.cancel()
+            results[name] = FetchResult(timed_out=True, elapsed_ms=(time.monotonic() - started_at) * 1000)
+        except Exception as e:
+            results[name] = FetchResult(error=e, elapsed_ms=(time.monotonic() - started_at) * 1000)
+    return results
+
+
+def iter_concurrently(requests: Dict[str, Callable[[], Any]], max_concurrency: int = 8,
+                      timeout: float = 10.0, deadline: Optional[float] = None) -> Iterator[Tuple[str, FetchResult]]:
+    """
+    Run fetch callables with at most `max_concurrency` of them in flight, yielding `(name, FetchResult)` pairs
+    in completion order so callers can show results while the rest are still loading.
+
+    Each request's timeout is measured from the moment it is launched. With a `deadline` (a time.monotonic()
+    value), requests still in flight then time out and the ones not launched yet are never launched nor yielded.
+    Like fetch_concurrently, failures and timeouts are reported in the FetchResult and the callables must not
+    use `st.*`.
+    """
+    deadline = float("inf") if deadline is None else deadline
+    pending_requests = iter(requests.items())
+    in_flight = {}
+
+    def expires_at(started_at: float) -> float:
+        return min(started_at + timeout, deadline)
+
+    def launch():
+        if time.monotonic() >= deadline:
+            return
+        for name, fn in pending_requests:
+            started_at = time.monotonic()
+            in_flight[_executor.submit(_timed_call, fn, expires_at(started_at))] = (name, started_at)
+            if len(in_flight) >= max_concurrency:
+                return
+
+    launch()
+    while in_flight:
+        next_expiry = min(expires_at(started_at) for _, started_at in in_flight.values())
+        done, _ = wait(in_flight, timeout=max(0.0, next_expiry - time.monotonic()), return_when=FIRST_COMPLETED)
+        now = time.monotonic()
+        for future in list(in_flight):
+            name, started_at = in_flight[future]
+            if future in done:
+                del in_flight[future]
+                try:
+                    value, elapsed_ms = future.result()
+                    yield name, FetchResult(value=value, elapsed_ms=elapsed_ms)
+                except Exception as e:
+                    yield name, FetchResult(error=e, elapsed_ms=(now - started_at) * 1000)
+            elif now >= expires_at(started_at):
+                del in_flight[future]
+                future.cancel()
+                yield name, FetchResult(timed_out=True, elapsed_ms=(now - started_at) * 1000)
+        launch()
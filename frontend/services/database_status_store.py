@@ -0,0 +1,103 @@
+import json
+import os
+import threading
+import time
+from functools import partial
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from constants import ARCHIVED_DATABASES_STATUS_PATH
+from frontend.services.concurrent_fetch import iter_concurrently
+
+
+class DatabaseStatusStore:
+    """
+    Status of the archived bot databases, scanned concurrently and persisted to a JSON file so each database is
+    only checked once.
+
+    Entries are keyed by database path and by the database version when the caller knows one (e.g. its
+    modification time), so a database that changed is scanned again. Statuses older than `max_age` seconds are
+    scanned again as well, and `invalidate()` forces a rescan. Failed checks are not persisted and are retried on
+    the next scan.
+    """
+
+    def __init__(self, client, path: str = ARCHIVED_DATABASES_STATUS_PATH, max_concurrency: int = 8,
+                 fetch_timeout: float = 30.0, save_every: int = 25, max_age: float = 24 * 60 * 60):
+        self._client = client
+        self._path = path
+        self._max_concurrency = max(1, max_concurrency)
+        self._fetch_timeout = fetch_timeout
+        self._save_every = save_every
+        self._max_age = max_age
+
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict] = self._read()
+
+    def _read(self) -> Dict[str, Dict]:
+        if not os.path.exists(self._path):
+            return {}
+        try:
+            with open(self._path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self):
+        with self._lock:
+            entries = dict(self._entries)
+        os.makedirs(os.path.dirname(self._path) or ".", exist_ok=True)
+        with open(f"{self._path}.tmp", "w") as f:
+            json.dump(entries, f)
+        os.replace(f"{self._path}.tmp", self._path)
+
+    def cached(self, db_paths: List[str], versions: Optional[Dict[str, str]] = None) -> Dict[str, Dict]:
+        """Known statuses of the databases scanned less than `max_age` ago whose version hasn't changed since."""
+        versions = versions or {}
+        min_scanned_at = time.time() - self._max_age
+        with self._lock:
+            entries = {db_path: self._entries.get(db_path) for db_path in db_paths}
+        return {db_path: entry["status"] for db_path, entry in entries.items()
+                if entry is not None and entry.get("version") == versions.get(db_path)
+                and entry.get("scanned_at", 0) >= min_scanned_at}
+
+    def invalidate(self, db_paths: Optional[List[str]] = None):
+        """Forget the statuses of the given databases, or of every database, so the next scan checks them again."""
+        with self._lock:
+            if db_paths is None:
+                self._entries = {}
+            else:
+                for db_path in db_paths:
+                    self._entries.pop(db_path, None)
+        self._save()
+
+    def scan(self, db_paths: List[str], versions: Optional[Dict[str, str]] = None) -> Iterator[Tuple[str, Dict]]:
+        """
+        Check the databases without a known status, yielding `(db_path, status)` as each check completes.
+        Failed checks yield `{"status": "error", "error": ...}`. Databases no longer listed are forgotten.
+        """
+        versions = versions or {}
+        known = self.cached(db_paths, versions)
+        listed = set(db_paths)
+        with self._lock:
+            self._entries = {db_path: entry for db_path, entry in self._entries.items() if db_path in listed}
+
+        requests = {db_path: partial(self._client.archived_bots.get_database_status, db_path)
+                    for db_path in db_paths if db_path not in known}
+        if not requests:
+            return
+        scanned = 0
+        try:
+            for db_path, result in iter_concurrently(requests, self._max_concurrency, self._fetch_timeout):
+                if result.ok:
+                    status = result.value
+                    with self._lock:
+                        self._entries[db_path] = {"version": versions.get(db_path), "status": status,
+                                                  "scanned_at": time.time()}
+                    scanned += 1
+                    if scanned % self._save_every == 0:
+                        self._save()
+                else:
+                    status = {"status": "error", "error": "request timed out" if result.timed_out else str(result.error)}
+                yield db_path, status
+        finally:
+            # Also reached when the page reruns mid-scan, so the checks done so far are kept
+            self._save()
@@ -0,0 +1,36 @@
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional
+
+import pandas as pd
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from CONFIG import DEBUG_EXPORTS_ENABLED
+from constants import DEBUG_EXPORTS_PATH
+
+# A single writer, so exports never compete with each other or with the page for disk and CPU
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="debug-export")
+
+
+def _write_csv(frame: pd.DataFrame, path: str):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{time.time_ns()}.tmp"
+    frame.to_csv(tmp_path, index=False, compression="gzip")
+    os.replace(tmp_path, path)
+
+
+def export_frame(name: str, frame: pd.DataFrame, enabled: bool = DEBUG_EXPORTS_ENABLED) -> Optional[Future]:
+    """
+    Write a frame to `DEBUG_EXPORTS_PATH/<session id>/<name>.csv.gz` in the background when debug exports are
+    enabled (DEBUG_EXPORTS_ENABLED), returning the Future of the write or None when disabled.
+
+    Each session overwrites its own file, so concurrent sessions don't race on it. The frame is copied before
+    returning, so the caller may keep modifying it.
+    """
+    if not enabled:
+        return None
+    ctx = get_script_run_ctx()
+    session_id = ctx.session_id if ctx is not None else "no-session"
+    path = os.path.join(DEBUG_EXPORTS_PATH, session_id, f"{name}.csv.gz")
+    return _executor.submit(_write_csv, frame.copy(), path)
@@ -0,0 +1,46 @@
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+
+def executors_fingerprint(checkpoint: Optional[str], executors_filter: Optional[Dict[str, Any]],
+                          executor_ids: Iterable[Any]) -> Tuple:
+    """
+    Cheap content key of a set of executors: the checkpoint they come from, the filter that selected them, their
+    count and a checksum of their ids, instead of hashing every field of every executor.
+    """
+    filter_key = tuple(sorted((name, tuple(str(value) for value in values))
+                              for name, values in (executors_filter or {}).items()))
+    executor_ids = [str(executor_id) for executor_id in executor_ids]
+    ids_checksum = zlib.crc32("\n".join(executor_ids).encode())
+    return checkpoint, filter_key, len(executor_ids), ids_checksum
+
+
+class PerformanceResultsCache:
+    """
+    Performance results by content fingerprint (see executors_fingerprint), shared by the global, long, short and
+    controller views and bounded to the `max_entries` most recently used results.
+    """
+
+    def __init__(self, max_entries: int = 128):
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._results: "OrderedDict[Hashable, Dict]" = OrderedDict()
+
+    def get(self, key: Hashable, compute: Callable[[], Dict]) -> Dict:
+        """The results cached under `key`, computing them with `compute()` on a miss."""
+        with self._lock:
+            if key in self._results:
+                self._results.move_to_end(key)
+                return self._results[key]
+        results = compute()
+        with self._lock:
+            self._results[key] = results
+            while len(self._results) > self._max_entries:
+                self._results.popitem(last=False)
+        return results
+
+    def clear(self):
+        with self._lock:
+            self._results.clear()
@@ -0,0 +1,301 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from functools import partial
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote
+
+import pandas as pd
+
+from constants import PORTFOLIO_HISTORY_DATA_PATH
+from frontend.analytics.portfolio import HISTORY_COLUMNS, portfolio_history_to_df
+from frontend.analytics.portfolio_rollups import PortfolioRollups
+from frontend.services.concurrent_fetch import iter_concurrently
+
+CATEGORICAL_COLUMNS = ["account", "exchange", "token"]
+DAY_SECONDS = 24 * 60 * 60
+
+
+def _normalize(history_df: pd.DataFrame) -> pd.DataFrame:
+    """Naive UTC timestamps and categorical keys, so frames from the backend and from disk concatenate cleanly."""
+    if history_df["timestamp"].dt.tz is not None:
+        history_df = history_df.assign(timestamp=history_df["timestamp"].dt.tz_convert(None))
+    return history_df.astype({column: "category" for column in CATEGORICAL_COLUMNS})
+
+
+class PortfolioHistoryStore:
+    """
+    Complete portfolio history per account, cached on disk as append-only Parquet parts under
+    `base_path/<account>/` together with the time range the parts cover.
+
+    Loading a period only requests from the backend the time ranges not covered yet: snapshots newer than the last
+    refresh and, when the period grows, older ones. Missing ranges are split in chunks of `chunk_days` that are
+    fetched concurrently (the cursor itself is opaque, so pages of a chunk are followed one after the other).
+    Account locks are only held while reading or updating the cache, never while waiting on the backend.
+    """
+
+    def __init__(self, client, base_path: str = PORTFOLIO_HISTORY_DATA_PATH, page_size: int = 1000,
+                 chunk_days: int = 30, max_concurrency: int = 4, min_refresh_interval: float = 30.0,
+                 max_parts: int = 64, fetch_timeout: float = 20.0):
+        self._client = client
+        self._base_path = base_path
+        self._page_size = page_size
+        self._chunk_seconds = chunk_days * DAY_SECONDS
+        self._max_concurrency = max(1, max_concurrency)
+        self._min_refresh_interval = min_refresh_interval
+        self._max_parts = max_parts
+        self._fetch_timeout = fetch_timeout
+
+        self._lock = threading.Lock()
+        self._account_locks: Dict[str, threading.Lock] = {}
+        self._frames: Dict[str, pd.DataFrame] = {}
+        self._coverage: Dict[str, Optional[Tuple[int, int]]] = {}
+        self._refreshed_at: Dict[str, float] = {}
+        # Accounts with a backend fetch in flight, served as cached to other callers meanwhile
+        self._fetching = set()
+        # Rollups of every loaded account, updated with the snapshots as they are loaded
+        self._rollups = PortfolioRollups()
+        self._rollups_lock = threading.Lock()
+
+    def _account_path(self, account: str) -> str:
+        # Account names come from the backend: encode separators and dots so they can't leave the base path
+        return os.path.join(self._base_path, quote(account, safe="").replace(".", "%2E"))
+
+    def _account_lock(self, account: str) -> threading.Lock:
+        with self._lock:
+            return self._account_locks.setdefault(account, threading.Lock())
+
+    @contextmanager
+    def _locked(self, accounts: List[str]):
+        """Hold the locks of the accounts, always taken in the same order."""
+        locks = [self._account_lock(account) for account in sorted(set(accounts))]
+        for lock in locks:
+            lock.acquire()
+        try:
+            yield
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+
+    def fetch_range(self, account: str, start_time: int, end_time: int) -> pd.DataFrame:
+        """Fetch the snapshots of an account between two timestamps (seconds), following the cursor to the end."""
+        records, cursor = [], None
+        while True:
+            response = self._client.portfolio.get_history(
+                [account],  # account_names
+                None,  # connector_names
+                self._page_size,  # limit
+                cursor,  # cursor
+                start_time,  # start_time
+                end_time  # end_time
+            )
+            records.extend(response.get("data", []))
+            pagination = response.get("pagination") or {}
+            cursor = pagination.get("next_cursor")
+            if not pagination.get("has_more") or not cursor:
+                return _normalize(portfolio_history_to_df(records))
+
+    def _load_from_disk(self, account: str):
+        account_path = self._account_path(account)
+        coverage, frames = None, []
+        if os.path.isdir(account_path):
+            coverage_path = os.path.join(account_path, "coverage.json")
+            if os.path.exists(coverage_path):
+                with open(coverage_path) as f:
+                    coverage = tuple(json.load(f))
+            for file_name in sorted(os.listdir(account_path)):
+                if file_name.endswith(".parquet"):
+                    frames.append(_normalize(pd.read_parquet(os.path.join(account_path, file_name))))
+        self._coverage[account] = coverage
+        self._frames[account] = self._concat(frames)
+        with self._rollups_lock:
+            self._rollups.update(self._frames[account])
+
+    @staticmethod
+    def _concat(frames: List[pd.DataFrame]) -> pd.DataFrame:
+        frames = [frame for frame in frames if not frame.empty]
+        if not frames:
+            return _normalize(portfolio_history_to_df([]))
+        history_df = pd.concat(frames, ignore_index=True)
+        # Ranges fetched separately may share their boundary snapshot
+        history_df = history_df.drop_duplicates(subset=["timestamp", "account", "exchange", "token"])
+        return _normalize(history_df.sort_values("timestamp", kind="stable").reset_index(drop=True))
+
+    @staticmethod
+    def _unseen(history_df: pd.DataFrame, new_df: pd.DataFrame) -> pd.DataFrame:
+        """Rows of `new_df` that aren't in `history_df` yet, e.g. the boundary snapshot of a range already loaded."""
+        if history_df.empty or new_df.empty:
+            return new_df
+        start, end = new_df["timestamp"].min(), new_df["timestamp"].max()
+        overlap = history_df[history_df["timestamp"].between(start, end)]
+        if overlap.empty:
+            return new_df
+        keys = ["timestamp"] + CATEGORICAL_COLUMNS
+        as_strings = {column: str for column in CATEGORICAL_COLUMNS}
+        known = pd.MultiIndex.from_frame(overlap[keys].astype(as_strings))
+        return new_df[~pd.MultiIndex.from_frame(new_df[keys].astype(as_strings)).isin(known)]
+
+    def _save(self, account: str, new_frames: List[pd.DataFrame], coverage: Tuple[int, int]):
+        account_path = self._account_path(account)
+        os.makedirs(account_path, exist_ok=True)
+        for new_frame in new_frames:
+            if not new_frame.empty:
+                start, end = (int(ts.timestamp()) for ts in (new_frame["timestamp"].min(), new_frame["timestamp"].max()))
+                new_frame.to_parquet(os.path.join(account_path, f"part-{start}-{end}-{time.time_ns()}.parquet"))
+
+        parts = [file_name for file_name in os.listdir(account_path) if file_name.endswith(".parquet")]
+        if len(parts) > self._max_parts:
+            # Compact the parts into a single file, written before the old parts are removed
+            self._frames[account].to_parquet(os.path.join(account_path, f"part-compacted-{time.time_ns()}.parquet"))
+            for file_name in parts:
+                os.remove(os.path.join(account_path, file_name))
+
+        coverage_path = os.path.join(account_path, "coverage.json")
+        with open(f"{coverage_path}.tmp", "w") as f:
+            json.dump(list(coverage), f)
+        os.replace(f"{coverage_path}.tmp", coverage_path)
+
+    def _missing_ranges(self, account: str, start_time: int, end_time: int) -> List[Tuple[int, int, bool]]:
+        """
+        Time ranges to fetch to cover an account from `start_time` to `end_time`, each with whether it extends the
+        coverage backwards (from its end) rather than forwards (from its start).
+        """
+        coverage = self._coverage.get(account)
+        if coverage is None:
+            return [(start_time, end_time, True)]
+        missing = []
+        if start_time < coverage[0]:
+            missing.append((start_time, coverage[0], True))
+        if end_time > coverage[1]:
+            missing.append((coverage[1], end_time, False))
+        return missing
+
+    def _chunks(self, range_start: int, range_end: int, backwards: bool) -> List[Tuple[int, int]]:
+        """Chunks of a missing range, starting from the side adjacent to the coverage."""
+        chunks = [(chunk_start, min(chunk_start + self._chunk_seconds, range_end))
+                  for chunk_start in range(range_start, range_end, self._chunk_seconds)]
+        return chunks[::-1] if backwards else chunks
+
+    def _fetch_missing(self, chunks: List[Tuple[str, int, int]]) -> Dict[Tuple[str, int], object]:
+        """
+        Fetch chunks with at most `max_concurrency` in flight, so a long backfill doesn't take over the shared fetch
+        threads, and for at most `fetch_timeout` seconds in total. Returns each chunk's frame or the exception it
+        raised; chunks that didn't arrive in time are missing from the result.
+        """
+        requests = {(account, chunk_start): partial(self.fetch_range, account, chunk_start, chunk_end)
+                    for account, chunk_start, chunk_end in chunks}
+        results = {}
+        for key, result in iter_concurrently(requests, self._max_concurrency, self._fetch_timeout,
+                                             deadline=time.monotonic() + self._fetch_timeout):
+            results[key] = result.value if result.ok else result.error or TimeoutError("request timed out")
+        return results
+
+    def _refresh(self, accounts: List[str], start_time: int) -> List[str]:
+        """
+        Fetch from the backend the history of the accounts since `start_time` (seconds) that isn't cached yet,
+        returning the error messages of the accounts that couldn't be brought up to date (they're retried next
+        time, from where this refresh got to).
+        """
+        end_time = int(time.time())
+        missing_ranges = {}
+        with self._locked(accounts):
+            for account in accounts:
+                if account not in self._frames:
+                    self._load_from_disk(account)
+                coverage = self._coverage.get(account)
+                recently_refreshed = time.monotonic() - self._refreshed_at.get(account, 0.0) < self._min_refresh_interval
+                range_end = coverage[1] if coverage is not None and recently_refreshed else end_time
+                account_ranges = self._missing_ranges(account, start_time, range_end)
+                with self._lock:
+                    if not account_ranges or account in self._fetching:
+                        continue
+                    self._fetching.add(account)
+                missing_ranges[account] = account_ranges
+        if not missing_ranges:
+            return []
+
+        chunks = [(account, chunk_start, chunk_end)
+                  for account, account_ranges in missing_ranges.items()
+                  for range_start, range_end, backwards in account_ranges
+                  for chunk_start, chunk_end in self._chunks(range_start, range_end, backwards)]
+        try:
+            results = self._fetch_missing(chunks)
+            errors = []
+            with self._locked(list(missing_ranges)):
+                for account, account_ranges in missing_ranges.items():
+                    error = self._add_history(account, account_ranges, results)
+                    if error is not None:
+                        errors.append(f"{account}: {error}")
+            return errors
+        finally:
+            with self._lock:
+                self._fetching.difference_update(missing_ranges)
+
+    def _add_history(self, account: str, missing_ranges: List[Tuple[int, int, bool]],
+                     results: Dict[Tuple[str, int], object]) -> Optional[Exception]:
+        """
+        Merge the fetched chunks of an account into its history, rollups, coverage and disk cache, returning the
+        error of the first chunk that didn't arrive, if any.
+
+        Coverage stays contiguous: each missing range only contributes its chunks that arrived one after the other
+        from the side adjacent to the coverage, the rest is fetched again next time.
+        """
+        coverage = self._coverage.get(account)
+        new_frames, error = [], None
+        for range_start, range_end, backwards in missing_ranges:
+            covered_start = covered_end = range_end if backwards else range_start
+            for chunk_start, chunk_end in self._chunks(range_start, range_end, backwards):
+                result = results.get((account, chunk_start), TimeoutError("request timed out"))
+                if isinstance(result, Exception):
+                    error = error or result
+                    break
+                new_frames.append(result)
+                covered_start, covered_end = min(covered_start, chunk_start), max(covered_end, chunk_end)
+            if covered_start < covered_end:
+                coverage = (covered_start, covered_end) if coverage is None else \
+                    (min(covered_start, coverage[0]), max(covered_end, coverage[1]))
+        if coverage is None or coverage == self._coverage.get(account):
+            return error
+
+        # Rollups sum every row they are given, so only rows that aren't stored yet may reach them
+        new_rows = self._unseen(self._frames[account], self._concat(new_frames))
+        self._frames[account] = self._concat([self._frames[account], new_rows])
+        with self._rollups_lock:
+            self._rollups.update(new_rows)
+        self._coverage[account] = coverage
+        if error is None:
+            self._refreshed_at[account] = time.monotonic()
+        self._save(account, [new_rows], coverage)
+        return error
+
+    def load(self, accounts: List[str], start_time: int, refresh: bool = True) -> Tuple[pd.DataFrame, List[str]]:
+        """
+        Return the history of the accounts since `start_time` (seconds), fetching from the backend only what isn't
+        cached yet, and the error messages of the accounts that couldn't be updated (they're retried next time).
+        With `refresh=False` the cached history is returned as is, e.g. right after rollup() refreshed it.
+
+        This concatenates and sorts every snapshot of the period, so charts of long periods should use rollup().
+        """
+        errors = self._refresh(accounts, start_time) if refresh else []
+        start = pd.Timestamp(start_time, unit="s")
+        with self._locked(accounts):
+            history_df = self._concat([self._frames[account][self._frames[account]["timestamp"] >= start]
+                                       for account in accounts])
+        return history_df[HISTORY_COLUMNS], errors
+
+    def rollup(self, accounts: List[str], start_time: int,
+               target_points: int = 2000) -> Tuple[Optional[str], pd.DataFrame, List[str]]:
+        """
+        Values of the accounts since `start_time` (seconds) at the rollup resolution giving about `target_points`
+        timestamps, with the name of that resolution (None when nothing is loaded). Like load(), the history is
+        first brought up to date, and the error messages of the accounts that couldn't be updated are returned.
+        """
+        errors = self._refresh(accounts, start_time)
+        with self._rollups_lock:
+            resolution = self._rollups.pick_resolution(start_time, int(time.time()), target_points)
+            if resolution is None:
+                return None, pd.DataFrame(columns=["timestamp", "account", "exchange", "token", "value"]), errors
+            rollup_df = self._rollups.select(resolution, start_time)
+        return resolution, rollup_df[rollup_df["account"].isin(accounts)], errors
@@ -66,59 +66,64 @@ def style_metric_cards():
     pass
 
 
-def get_backend_api_client():
+@st.cache_resource(show_spinner=False)
+def get_backend_api_pool():
+    """Process-wide backend client pool shared by every Streamlit session."""
     import atexit
 
-    from hummingbot_api_client import SyncHummingbotAPIClient
+    from CONFIG import (
+        BACKEND_API_HEALTH_CHECK_INTERVAL,
+        BACKEND_API_HOST,
+        BACKEND_API_PASSWORD,
+        BACKEND_API_POOL_SIZE,
+        BACKEND_API_PORT,
+        BACKEND_API_USERNAME,
+    )
+    from frontend.services.backend_api_pool import BackendAPIClientPool
+    from frontend.services.concurrent_fetch import FETCH_WORKERS
 
-    from CONFIG import BACKEND_API_HOST, BACKEND_API_PASSWORD, BACKEND_API_PORT, BACKEND_API_USERNAME
+    # Ensure URL has proper protocol
+    if not BACKEND_API_HOST.startswith(('http://', 'https://')):
+        base_url = f"http://{BACKEND_API_HOST}:{BACKEND_API_PORT}"
+    else:
+        base_url = f"{BACKEND_API_HOST}:{BACKEND_API_PORT}"
+
+    pool = BackendAPIClientPool(
+        base_url=base_url,
+        username=BACKEND_API_USERNAME,
+        password=BACKEND_API_PASSWORD,
+        # Every fetch thread must be able to hold a client, or concurrent fetches queue on the pool
+        max_size=max(BACKEND_API_POOL_SIZE, FETCH_WORKERS),
+        health_check_interval=BACKEND_API_HEALTH_CHECK_INTERVAL
+    )
+    # Close the pooled HTTP sessions when the server process exits
+    atexit.register(pool.close)
+    return pool
 
-    # Use Streamlit session state to store singleton instance
-    if 'backend_api_client' not in st.session_state or st.session_state.backend_api_client is None:
-        try:
-            # Create and enter the client context
-            # Ensure URL has proper protocol
-            if not BACKEND_API_HOST.startswith(('http://', 'https://')):
-                base_url = f"http://{BACKEND_API_HOST}:{BACKEND_API_PORT}"
-            else:
-                base_url = f"{BACKEND_API_HOST}:{BACKEND_API_PORT}"
 
-            client = SyncHummingbotAPIClient(
-                base_url=base_url,
-                username=BACKEND_API_USERNAME,
-                password=BACKEND_API_PASSWORD
-            )
-            # Initialize the client using context manager
-            client.__enter__()
-
-            # Register cleanup function to properly exit the context manager
-            def cleanup_client():
-                try:
-                    if 'backend_api_client' in st.session_state and st.session_state.backend_api_client is not None:
-                        st.session_state.backend_api_client.__exit__(None, None, None)
-                        st.session_state.backend_api_client = None
-                except Exception:
-                    pass  # Ignore cleanup errors
-
-            # Register cleanup with atexit and session state
-            atexit.register(cleanup_client)
-            if 'cleanup_registered' not in st.session_state:
-                st.session_state.cleanup_registered = True
-                # Also register cleanup for session state changes
-                st.session_state.backend_api_client_cleanup = cleanup_client
-
-            # Check Docker after initialization
-            if not client.docker.is_running():
-                st.error("Docker is not running. Please make sure Docker is running.")
-                cleanup_client()  # Clean up before stopping
-                st.stop()
-
-            st.session_state.backend_api_client = client
-        except Exception as e:
-            st.error(f"Failed to initialize API client: {str(e)}")
-            st.stop()
-
-    return st.session_state.backend_api_client
+@st.cache_resource(show_spinner=False)
+def get_cached_backend_api_client():
+    """Response cache shared by every Streamlit session, in front of the pooled backend client."""
+    from frontend.services.api_cache import CachedBackendAPIClient
+
+    return CachedBackendAPIClient(get_backend_api_pool())
+
+
+def get_backend_api_client():
+    try:
+        pool = get_backend_api_pool()
+        # Docker status is cached by the pool and refreshed periodically, so new sessions don't hit the backend
+        docker_running = pool.is_docker_running()
+        client = get_cached_backend_api_client()
+    except Exception as e:
+        st.error(f"Failed to initialize API client: {str(e)}")
+        st.stop()
+
+    if not docker_running:
+        st.error("Docker is not running. Please make sure Docker is running.")
+        st.stop()
+
+    return client
 
 
 def auth_system():
@@ -7,6 +7,8 @@ from hummingbot.core.data_type.common import TradeType
 
 from backend.services.backend_api_client import BackendAPIClient
 from backend.utils.performance_data_source import PerformanceDataSource
+from frontend.analytics.performance_metrics import compare_performance_results, summarize_executors
+from frontend.services.performance_results_cache import PerformanceResultsCache, executors_fingerprint
 from frontend.st_utils import download_csv_button, get_backend_api_client
 from frontend.visualization.backtesting import create_backtesting_figure
 from frontend.visualization.backtesting_metrics import render_accuracy_metrics, render_backtesting_metrics
@@ -36,13 +38,11 @@ def display_performance_summary_table(executors, executors_with_orders: pd.DataF
             close_timestamp=("close_timestamp", "max"),
             filled_amount_quote=("filled_amount_quote", "sum")
         ).reset_index()
-        grouped_executors["net_pnl_over_time"] = grouped_executors.apply(
-            lambda row: executors[
-                (executors["controller_id"] == row["controller_id"]) &
-                (executors["exchange"] == row["exchange"]) &
-                (executors["trading_pair"] == row["trading_pair"])
-                ]["net_pnl_quote"].cumsum().tolist(), axis=1
-        )
+        # Cumulative PnL of every controller, exchange and trading pair in close order, in a single pass
+        sparkline_keys = ["controller_id", "exchange", "trading_pair"]
+        cumulative_pnl = executors.groupby(sparkline_keys, sort=False)["net_pnl_quote"].cumsum()
+        pnl_over_time = cumulative_pnl.groupby([executors[key] for key in sparkline_keys], sort=False).agg(list)
+        grouped_executors = grouped_executors.join(pnl_over_time.rename("net_pnl_over_time"), on=sparkline_keys)
         grouped_executors["exchange"] = grouped_executors["exchange"].apply(lambda x: x.replace("_", " ").capitalize())
         grouped_executors["controller_type"] = grouped_executors["controller_type"].apply(
             lambda x: x.replace("_", " ").capitalize()
@@ -56,9 +56,8 @@ def display_performance_summary_table(executors, executors_with_orders: pd.DataF
         grouped_executors["net_pnl_quote"] = grouped_executors["net_pnl_quote"].apply(lambda x: f"$ {x:.2f}")
         grouped_executors.rename(columns={"datetime": "start_datetime_utc",
                                           "id": "total_executors"}, inplace=True)
-        all_pnl_values = [value for sublist in grouped_executors["net_pnl_over_time"] for value in sublist]
-        y_min = min(all_pnl_values) if all_pnl_values else -1e10
-        y_max = max(all_pnl_values) if all_pnl_values else 1e10
+        y_min = cumulative_pnl.min() if not cumulative_pnl.empty else -1e10
+        y_max = cumulative_pnl.max() if not cumulative_pnl.empty else 1e10
         cols_to_show = ["exchange", "trading_pair", "net_pnl_quote", "net_pnl_over_time", "filled_amount_quote",
                         "controller_id", "controller_type", "total_executors", "duration"]
 
@@ -87,8 +86,12 @@ def display_global_results(data_source: PerformanceDataSource):
     selected_controllers_filter = {
         "controller_id": selected_controllers if len(selected_controllers) > 0 else list(data_source.controllers_dict.keys())
     }
-    executors_dict = data_source.get_executor_dict(selected_controllers_filter)
-    results_response = fetch_global_results(executors_dict)
+    st.toggle("Verify metrics with backend", key="verify_performance_results",
+              help="Compute the metrics with the backend API as well and report any metric that differs from the "
+                   "local computation.")
+    executors_df = data_source.get_executors_df(executors_filter=selected_controllers_filter,
+                                                apply_executor_data_types=True)
+    results_response = fetch_results(data_source, selected_controllers_filter, executors_df)
 
     render_backtesting_metrics(summary_results=results_response,
                                title="Global Metrics")
@@ -101,30 +104,60 @@ def display_global_results(data_source: PerformanceDataSource):
         with st.container(border=True):
             display_side_analysis(data_source, selected_controllers_filter, is_long=False)
 
-    executors_df = data_source.get_executors_df(executors_filter=selected_controllers_filter,
-                                                apply_executor_data_types=True)
     st.plotly_chart(create_combined_subplots(executors_df), use_container_width=True)
 
 
-@st.cache_data(show_spinner=False)
-def fetch_global_results(executors_dict: List[Dict[str, Any]]):
+def compute_performance_results(executors_dict: List[Dict[str, Any]]):
     backend_api = get_backend_api_client()
-    if len(executors_dict) > 0:
-        results_response = backend_api.get_performance_results(executors=executors_dict)
-    else:
-        results_response = {}
+    results_response = backend_api.get_performance_results(executors=executors_dict)
     return results_response.get("results", {})
 
 
+@st.cache_resource
+def get_performance_results_cache():
+    return PerformanceResultsCache()
+
+
+def fetch_results(data_source: PerformanceDataSource, executors_filter: Dict[str, Any], executors_df: pd.DataFrame,
+                  **executor_dict_kwargs):
+    """
+    Performance results of the executors selected by a filter, computed locally from their frame and cached by
+    checkpoint, filter and executor ids.
+
+    With "Verify metrics with backend" on, the results come from the backend API instead (sending it the executors
+    built with `executor_dict_kwargs`) and the metrics that differ from the local ones are reported.
+    """
+    verify = st.session_state.get("verify_performance_results", False)
+
+    def compute():
+        if executors_df.empty:
+            return {}, {}
+        results = summarize_executors(executors_df)
+        if not verify:
+            return results, {}
+        backend_results = compute_performance_results(data_source.get_executor_dict(executors_filter,
+                                                                                     **executor_dict_kwargs))
+        return backend_results, compare_performance_results(results, backend_results)
+
+    key = executors_fingerprint(st.session_state.get("performance_checkpoint"), executors_filter,
+                                executors_df["id"] if "id" in executors_df.columns else []), verify
+    results, mismatches = get_performance_results_cache().get(key, compute)
+    if mismatches:
+        st.warning("Local metrics differ from the backend: " + ", ".join(
+            f"{metric} ({local} vs {backend})" for metric, (local, backend) in mismatches.items()))
+    return results
+
+
 def display_side_analysis(data_source: PerformanceDataSource,
                           current_filter: Dict[str, Any] = None,
                           is_long: bool = True):
     side_filter = current_filter.copy()
     side_filter["side"] = [TradeType.BUY] if is_long else [TradeType.SELL]
-    executors_dict = data_source.get_executor_dict(side_filter,
-                                                   apply_executor_data_types=True,
-                                                   remove_special_fields=True)
-    results = fetch_long_results(executors_dict) if is_long else fetch_short_results(executors_dict)
+    executors_df = data_source.get_executors_df(executors_filter=side_filter,
+                                                apply_executor_data_types=True)
+    results = fetch_results(data_source, side_filter, executors_df,
+                            apply_executor_data_types=True,
+                            remove_special_fields=True)
     if results:
         side_str = "Long" if is_long else "Short"
         st.write(f"### {side_str} Positions")
@@ -140,31 +173,9 @@ def display_side_analysis(data_source: PerformanceDataSource,
         fig.update_layout(title="Close Types")
         st.plotly_chart(fig, use_container_width=True)
 
-        executors_df = data_source.get_executors_df(executors_filter=side_filter,
-                                                    apply_executor_data_types=True)
         display_executors_by_close_type_metrics(executors_df)
 
 
-@st.cache_data(show_spinner=False)
-def fetch_long_results(executors_dict: List[Dict[str, Any]]):
-    backend_api = get_backend_api_client()
-    if len(executors_dict) > 0:
-        results_response = backend_api.get_performance_results(executors=executors_dict)
-    else:
-        results_response = {}
-    return results_response.get("results", {})
-
-
-@st.cache_data(show_spinner=False)
-def fetch_short_results(executors_dict: List[Dict[str, Any]]):
-    backend_api = get_backend_api_client()
-    if len(executors_dict) > 0:
-        results_response = backend_api.get_performance_results(executors=executors_dict)
-    else:
-        results_response = {}
-    return results_response.get("results", {})
-
-
 def display_execution_analysis(data_source: PerformanceDataSource):
     st.write("### Filters")
     col1, col2 = st.columns([2, 1])
@@ -205,8 +216,7 @@ def display_execution_analysis(data_source: PerformanceDataSource):
         }
         candles_df = fetch_market_data(candles_params)
 
-        executors_dict: List[Dict[str, Any]] = data_source.get_executor_dict(executors_filter)
-        performance_results = fetch_performance_results(executors_dict)
+        performance_results = fetch_results(data_source, executors_filter, executors_df)
         executors_info_list = data_source.get_executor_info_list(executors_filter)
 
         fig = create_backtesting_figure(df=candles_df,
@@ -246,16 +256,6 @@ def fetch_market_data(params: Dict[str, Any] = None):
     return candles_df
 
 
-@st.cache_data()
-def fetch_performance_results(executors_dict: List[Dict[str, Any]]):
-    backend_api = get_backend_api_client()
-    if len(executors_dict) > 0:
-        results_response = backend_api.get_performance_results(executors=executors_dict)
-    else:
-        results_response = {}
-    return results_response.get("results", {})
-
-
 def performance_section(results: dict, fig=None, title: str = "Backtesting Metrics"):
     render_backtesting_metrics(results, title="Controller Performance")
     col1, col2 = st.columns([6, 1])
@@ -41,6 +41,8 @@ def display_etl_section(backend_api: BackendAPIClient):
         st.stop()
     else:
         selected_checkpoint = st.selectbox("Select a checkpoint to load", checkpoints_list)
+        # Identifies the checkpoint in the performance results cache keys
+        st.session_state["performance_checkpoint"] = selected_checkpoint
         checkpoint_data = fetch_checkpoint_data(backend_api, selected_checkpoint)
         checkpoint_data["executors"] = json.loads(checkpoint_data["executors"])
         checkpoint_data["orders"] = json.loads(checkpoint_data["orders"])
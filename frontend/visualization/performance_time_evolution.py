@@ -3,9 +3,52 @@ import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
+from frontend.services.debug_export import export_frame
 from frontend.visualization.theme import get_color_scheme
 
 
+def cumulative_metrics_frame(executors: pd.DataFrame) -> pd.DataFrame:
+    """
+    Cumulative metrics of the executors in close order, computed with a single sort and without modifying
+    `executors`: close_datetime, cum_net_pnl_quote, cum_filled_amount_quote (both sides of each position),
+    cum_n_trades, cum_win_signals, cum_loss_signals, has_pnl (executors that closed with PnL), win_ratio and
+    loss_ratio (among the executors with PnL so far, NaN before the first one).
+
+    The columns are backed by read-only arrays, so the frame is shared by the subplots and can't be altered.
+    Traces take the datetimes as NumPy arrays, which Plotly keeps as datetime64 instead of Python objects.
+    """
+    order = np.argsort(executors["close_timestamp"].to_numpy(), kind="stable")
+    net_pnl_pct = executors["net_pnl_pct"].to_numpy(dtype=float)[order]
+    cum_win_signals = np.cumsum(net_pnl_pct > 0)
+    cum_loss_signals = np.cumsum(net_pnl_pct < 0)
+    has_pnl = net_pnl_pct != 0
+    total_signals = cum_win_signals + cum_loss_signals
+    with np.errstate(invalid="ignore", divide="ignore"):
+        win_ratio = np.where(total_signals > 0, cum_win_signals / total_signals, np.nan)
+    columns = {
+        "close_datetime": executors["close_datetime"].to_numpy()[order],
+        "cum_net_pnl_quote": np.cumsum(executors["net_pnl_quote"].to_numpy(dtype=float)[order]),
+        "cum_filled_amount_quote": np.cumsum(executors["filled_amount_quote"].to_numpy(dtype=float)[order]) * 2,
+        "cum_n_trades": np.cumsum(has_pnl),
+        "cum_win_signals": cum_win_signals,
+        "cum_loss_signals": cum_loss_signals,
+        "has_pnl": has_pnl,
+        "win_ratio": win_ratio,
+        "loss_ratio": 1 - win_ratio,
+    }
+    for values in columns.values():
+        values.flags.writeable = False
+    return pd.DataFrame(columns, copy=False)
+
+
+def _positive_marker(values: pd.Series) -> dict:
+    """Buy colored markers where the value is positive and sell colored elsewhere, through a two-color scale."""
+    color_scheme = get_color_scheme()
+    # Numbers mapped on a colorscale validate much faster in Plotly than a color string per point
+    return dict(color=(values.to_numpy() > 0).astype(np.int8), cmin=0, cmax=1,
+                colorscale=[[0, color_scheme["sell"]], [1, color_scheme["buy"]]])
+
+
 def create_combined_subplots(executors: pd.DataFrame):
     fig = make_subplots(rows=4, cols=1, shared_xaxes=True, vertical_spacing=0.1,
                         subplot_titles=["Cumulative PnL",
@@ -13,16 +56,19 @@ def create_combined_subplots(executors: pd.DataFrame):
                                         "Cumulative Positions",
                                         "Win/Loss Ratio"])
 
-    pnl_trace = get_pnl_traces(executors)
+    export_frame("executors", executors)
+    metrics = cumulative_metrics_frame(executors)
+
+    pnl_trace = get_pnl_traces(metrics)
     fig.add_trace(pnl_trace, row=1, col=1)
 
-    volume_trace = get_volume_bar_traces(executors)
+    volume_trace = get_volume_bar_traces(metrics)
     fig.add_trace(volume_trace, row=2, col=1)
 
-    activity_trace = get_total_executions_with_position_bar_traces(executors)
+    activity_trace = get_total_executions_with_position_bar_traces(metrics)
     fig.add_trace(activity_trace, row=3, col=1)
 
-    win_loss_fig = get_win_loss_ratio_fig(executors)
+    win_loss_fig = get_win_loss_ratio_fig(metrics)
     for trace in win_loss_fig.data:
         fig.add_trace(trace, row=4, col=1)
 
@@ -48,67 +94,45 @@ def create_combined_subplots(executors: pd.DataFrame):
     return fig
 
 
-def get_pnl_traces(executors: pd.DataFrame):
-    color_scheme = get_color_scheme()
-    executors.sort_values("close_timestamp", inplace=True)
-    executors["cum_net_pnl_quote"] = executors["net_pnl_quote"].cumsum()
+def get_pnl_traces(metrics: pd.DataFrame):
     scatter_traces = go.Scatter(name="Cum Realized PnL",
-                                x=executors["close_datetime"],
-                                y=executors["cum_net_pnl_quote"],
-                                marker_color=executors["cum_net_pnl_quote"].apply(
-                                    lambda x: color_scheme["buy"] if x > 0 else color_scheme["sell"]),
+                                x=metrics["close_datetime"].to_numpy(),
+                                y=metrics["cum_net_pnl_quote"],
+                                marker=_positive_marker(metrics["cum_net_pnl_quote"]),
                                 showlegend=False,
                                 line_shape='hv',
                                 fill="tozeroy")
     return scatter_traces
 
 
-def get_volume_bar_traces(executors: pd.DataFrame):
-    color_scheme = get_color_scheme()
-    executors.sort_values("close_timestamp", inplace=True)
-    executors["cum_filled_amount_quote"] = executors["filled_amount_quote"].cumsum() * 2
+def get_volume_bar_traces(metrics: pd.DataFrame):
     scatter_traces = go.Scatter(name="Cum Volume",
-                                x=executors["close_datetime"],
-                                y=executors["cum_filled_amount_quote"],
-                                marker_color=executors["cum_filled_amount_quote"].apply(
-                                    lambda x: color_scheme["buy"] if x > 0 else color_scheme["sell"]),
+                                x=metrics["close_datetime"].to_numpy(),
+                                y=metrics["cum_filled_amount_quote"],
+                                marker=_positive_marker(metrics["cum_filled_amount_quote"]),
                                 showlegend=False,
                                 fill="tozeroy")
     return scatter_traces
 
 
-def get_total_executions_with_position_bar_traces(executors: pd.DataFrame):
-    color_scheme = get_color_scheme()
-    executors.sort_values("close_timestamp", inplace=True)
-    executors["cum_n_trades"] = (executors['net_pnl_pct'] != 0).cumsum()
+def get_total_executions_with_position_bar_traces(metrics: pd.DataFrame):
     scatter_traces = go.Scatter(name="Cum Activity",
-                                x=executors["close_datetime"],
-                                y=executors["cum_n_trades"],
-                                marker_color=executors["cum_n_trades"].apply(
-                                    lambda x: color_scheme["buy"] if x > 0 else color_scheme["sell"]),
+                                x=metrics["close_datetime"].to_numpy(),
+                                y=metrics["cum_n_trades"],
+                                marker=_positive_marker(metrics["cum_n_trades"]),
                                 showlegend=False,
                                 line_shape='hv',
                                 fill="tozeroy")
     return scatter_traces
 
 
-def get_win_loss_ratio_fig(executors: pd.DataFrame):
-    df = executors.copy()
-    df.to_csv("executors.csv", index=False)
-    df.sort_values("close_timestamp", inplace=True)
-    df = df[df['net_pnl_pct'] != 0]
-    df['cum_win_signals'] = (df['net_pnl_pct'] > 0).cumsum()
-    df['cum_loss_signals'] = (df['net_pnl_pct'] < 0).cumsum()
-    df['acc_over_time'] = df['cum_win_signals'] / np.arange(1, len(df) + 1)
-
-    df['total_signals'] = df['cum_win_signals'] + df['cum_loss_signals']
-    df['win_ratio'] = df['cum_win_signals'] / df['total_signals']
-    df['loss_ratio'] = df['cum_loss_signals'] / df['total_signals']
+def get_win_loss_ratio_fig(metrics: pd.DataFrame):
+    df = metrics[metrics["has_pnl"]]
 
     fig = go.Figure()
 
     fig.add_trace(go.Scatter(
-        x=df["close_datetime"], y=df["win_ratio"],
+        x=df["close_datetime"].to_numpy(), y=df["win_ratio"],
         mode='lines',
         line=dict(width=0.5, color='rgb(184, 247, 212)'),
         stackgroup='one',
@@ -118,7 +142,7 @@ def get_win_loss_ratio_fig(executors: pd.DataFrame):
         showlegend=False
     ))
     fig.add_trace(go.Scatter(
-        x=df["close_datetime"], y=df["loss_ratio"],
+        x=df["close_datetime"].to_numpy(), y=df["loss_ratio"],
         mode='lines',
         line=dict(width=0.5, color='rgb(111, 231, 219)'),
         stackgroup='one',
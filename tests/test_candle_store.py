@@ -0,0 +1,74 @@
+import time
+
+import numpy as np
+
+from frontend.services.candle_store import CandleStore
+
+INTERVAL_SECONDS = 60
+
+
+class FakeCandlesBackend:
+    """Backend returning the last `n` one-minute candles up to the current time."""
+
+    def __init__(self):
+        self.now = time.time()
+        self.requested = []
+
+    def fetch_candles(self, n):
+        self.requested.append(n)
+        last_open = self.now // INTERVAL_SECONDS * INTERVAL_SECONDS
+        timestamps = last_open - INTERVAL_SECONDS * np.arange(n)[::-1]
+        return [{"timestamp": ts, "open": ts, "high": ts, "low": ts, "close": ts, "volume": 1.0} for ts in timestamps]
+
+
+def get_candles(store, backend, max_records):
+    candles, _ = store.get_candles(backend.fetch_candles, "binance", "BTC-USDT", "1m", max_records)
+    return candles
+
+
+def test_refresh_after_long_absence_leaves_no_gap(monkeypatch):
+    backend = FakeCandlesBackend()
+    monkeypatch.setattr(time, "time", lambda: backend.now)
+    store = CandleStore(capacity=1000, min_refresh_interval=0)
+
+    get_candles(store, backend, 500)
+    get_candles(store, backend, 300)
+    backend.now += 6 * 60 * 60  # idle for 360 bars, more than the 300 bars window
+    get_candles(store, backend, 300)
+    candles = get_candles(store, backend, 500)
+
+    assert len(candles["timestamp"]) == 500
+    assert np.all(np.diff(candles["timestamp"]) == INTERVAL_SECONDS)
+    assert candles["timestamp"][-1] == backend.now // INTERVAL_SECONDS * INTERVAL_SECONDS
+
+
+def test_refresh_fetches_only_the_missing_bars(monkeypatch):
+    backend = FakeCandlesBackend()
+    monkeypatch.setattr(time, "time", lambda: backend.now)
+    store = CandleStore(capacity=1000, min_refresh_interval=0)
+
+    get_candles(store, backend, 100)
+    backend.now += 3 * INTERVAL_SECONDS
+    candles = get_candles(store, backend, 100)
+
+    assert backend.requested == [100, 5]
+    assert len(candles["timestamp"]) == 100
+    assert np.all(np.diff(candles["timestamp"]) == INTERVAL_SECONDS)
+
+
+def test_candles_with_missing_fields_are_kept_or_skipped(monkeypatch):
+    backend = FakeCandlesBackend()
+    monkeypatch.setattr(time, "time", lambda: backend.now)
+    store = CandleStore(capacity=1000, min_refresh_interval=0)
+
+    def fetch_candles(n):
+        candles = backend.fetch_candles(n)
+        del candles[-1]["volume"]  # optional field missing
+        del candles[0]["timestamp"]  # can't be placed in time
+        return candles
+
+    candles, _ = store.get_candles(fetch_candles, "binance", "BTC-USDT", "1m", 10)
+
+    assert len(candles["timestamp"]) == 9
+    assert np.isnan(candles["volume"][-1])
+    assert np.all(candles["volume"][:-1] == 1.0)